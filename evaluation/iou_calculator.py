@@ -6,122 +6,316 @@ Computes Intersection over Union (IoU) between extracted and ground truth force
 """
 
 import json
-from typing import Dict, Any, List, Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+import numpy as np
+import orjson
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+# Numeric fields compared by IoU and the fixed-point scale each is
+# quantized to (2, 3 and 4 decimals). Values are stored as scaled ints so
+# set membership never depends on float equality.
+_NUMERIC_FIELDS = (("epsilon", 100), ("sigma", 1000), ("charge", 10000))
+_NUMERIC_NAMES = tuple(name for name, _ in _NUMERIC_FIELDS)
+_NUMERIC_SCALES = np.array([scale for _, scale in _NUMERIC_FIELDS], dtype=np.float64)
+
+# Normalized ground truth map shared by pool workers; set once per worker so
+# it is not re-pickled or re-normalized for every run.
+_WORKER_GT: Optional[Dict[str, Tuple]] = None
+
 
 def load_json(filepath: Path) -> Dict[str, Any]:
     """Load JSON file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def save_json(filepath: Path, data: Any) -> None:
+    """
+    Write data as indented JSON, atomically.
+    
+    The file is written next to its destination and renamed into place, so
+    readers never see a half-written result.
+    """
+    filepath = Path(filepath)
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, filepath)
+
+
+def load_atoms_only(filepath: Path) -> List[Dict[str, Any]]:
+    """
+    Load only the "atoms" array of an evaluation JSON file.
+    
+    Streams the array with ijson when available so sibling keys are never
+    materialized; falls back to load_json otherwise.
+    """
+    if not IJSON_AVAILABLE:
+        return load_json(filepath).get("atoms", [])
+    with open(filepath, 'rb') as f:
+        return list(ijson.items(f, "atoms.item", use_float=True))
 
 
 def normalize_atom_param(atom_data: Dict[str, Any]) -> Tuple:
     """
     Normalize atom parameter to a comparable tuple.
     
-    Returns: (atom_type, element, epsilon, sigma, charge)
+    Returns: (atom_type, element, epsilon, sigma, charge), with the numeric
+    fields as fixed-point ints (see _NUMERIC_FIELDS).
     """
     atom_type = atom_data.get("atom_type", "").strip()
     element = atom_data.get("element", "").strip()
     
-    # Normalize numerical values with tolerance
-    epsilon = round(float(atom_data.get("epsilon", 0)), 2)
-    sigma = round(float(atom_data.get("sigma", 0)), 3)
-    charge = round(float(atom_data.get("charge", 0)), 4)
+    # Quantize numerical values with tolerance
+    epsilon, sigma, charge = (
+        int(round(float(atom_data.get(name, 0)) * scale))
+        for name, scale in _NUMERIC_FIELDS
+    )
     
     return (atom_type, element, epsilon, sigma, charge)
 
 
-def calculate_iou(extracted: Dict[str, Any], ground_truth: Dict[str, Any]) -> Dict[str, Any]:
+def normalize_atom_params(atoms: List[Dict[str, Any]]) -> List[Tuple]:
     """
-    Calculate IoU metrics between extracted and ground truth parameters.
+    Normalize a whole atom list at once.
     
-    Returns:
-        dict with: missed, wrong, correct, total_gt, total_extracted, iou, details
+    Equivalent to mapping normalize_atom_param over the list, but every
+    atom is read in a single pass and all numeric fields are quantized
+    with one NumPy call.
     """
-    gt_atoms = ground_truth.get("atoms", [])
-    ext_atoms = extracted.get("atoms", [])
+    rows = [
+        (atom.get("atom_type", "").strip(), atom.get("element", "").strip(),
+         [atom.get(name, 0) for name in _NUMERIC_NAMES])
+        for atom in atoms
+    ]
+    if not rows:
+        return []
+    
+    atom_types, elements, values = zip(*rows)
+    quantized = np.rint(np.array(values, dtype=np.float64) * _NUMERIC_SCALES).astype(np.int64)
     
-    # Convert to normalized sets
-    gt_set = set(normalize_atom_param(atom) for atom in gt_atoms)
-    ext_set = set(normalize_atom_param(atom) for atom in ext_atoms)
+    return list(zip(atom_types, elements, *quantized.T.tolist()))
+
+
+def _atom_details(atom: Tuple) -> Dict[str, Any]:
+    """Convert a normalized atom tuple back to a dict with float values."""
+    details = {"atom_type": atom[0], "element": atom[1]}
+    for (name, scale), value in zip(_NUMERIC_FIELDS, atom[2:]):
+        details[name] = value / scale
+    return details
+
+
+def _atoms_to_map(atoms: List[Dict[str, Any]]) -> Dict[str, Tuple]:
+    """Normalize an atom list into {atom_type: normalized tuple}."""
+    return {atom[0]: atom for atom in normalize_atom_params(atoms)}
+
+
+@lru_cache(maxsize=None)
+def _load_ground_truth(gt_file: Path) -> Dict[str, Tuple]:
+    """Load a ground truth file as a normalized atom map, cached by path."""
+    return _atoms_to_map(load_atoms_only(gt_file))
+
+
+def calculate_iou(
+    extracted: Dict[str, Any],
+    ground_truth: Dict[str, Any],
+    details: bool = True
+) -> Dict[str, Any]:
+    """
+    Calculate IoU metrics between extracted and ground truth parameters.
     
-    # Calculate metrics
-    correct = gt_set & ext_set
-    missed = gt_set - ext_set
-    wrong = ext_set - gt_set
+    Returns:
+        dict with: missed, wrong, correct, total_gt, total_extracted, iou,
+        and (when details=True) missed_details / wrong_details
+    """
+    return calculate_iou_from_maps(
+        _atoms_to_map(ground_truth.get("atoms", [])),
+        _atoms_to_map(extracted.get("atoms", [])),
+        details
+    )
+
+
+def calculate_iou_from_maps(
+    gt_map: Dict[str, Tuple],
+    ext_map: Dict[str, Tuple],
+    details: bool = True
+) -> Dict[str, Any]:
+    """
+    Calculate IoU metrics from already-normalized atom maps.
     
-    # IoU = |intersection| / |union|
-    union = gt_set | ext_set
-    iou = len(correct) / len(union) if len(union) > 0 else 0.0
+    Atoms are matched by atom_type: a type present on both sides is
+    correct if every parameter agrees and wrong otherwise, a ground truth
+    type absent from the extraction is missed, and an extracted type absent
+    from the ground truth is wrong.
+    """
+    missed = []
+    wrong = []
+    n_correct = 0
     
-    # Count parameter-level errors
-    missed_params = len(missed)
-    wrong_params = len(wrong)
+    for atom_type, gt_atom in gt_map.items():
+        ext_atom = ext_map.get(atom_type)
+        if ext_atom is None:
+            missed.append(gt_atom)
+        elif ext_atom == gt_atom:
+            n_correct += 1
+        else:
+            wrong.append(ext_atom)
     
     # Extra atoms (in extracted but not in gt, by atom type only)
-    gt_atom_types = {atom.get("atom_type") for atom in gt_atoms}
-    ext_atom_types = {atom.get("atom_type") for atom in ext_atoms}
-    extra_atom_types = ext_atom_types - gt_atom_types
+    extra_atom_types = [atom_type for atom_type in ext_map if atom_type not in gt_map]
     
-    return {
-        "missed": missed_params,
-        "wrong": wrong_params,
-        "correct": len(correct),
-        "total_gt": len(gt_set),
-        "total_extracted": len(ext_set),
+    n_wrong = len(wrong) + len(extra_atom_types)
+    n_union = len(gt_map) + len(extra_atom_types)
+    iou = n_correct / n_union if n_union > 0 else 0.0
+    
+    result = {
+        "missed": len(missed),
+        "wrong": n_wrong,
+        "correct": n_correct,
+        "total_gt": len(gt_map),
+        "total_extracted": len(ext_map),
         "iou": round(iou, 2),
-        "extra_atoms": list(extra_atom_types),
-        "missed_details": [
-            {
-                "atom_type": m[0],
-                "element": m[1],
-                "epsilon": m[2],
-                "sigma": m[3],
-                "charge": m[4]
-            } for m in missed
-        ],
-        "wrong_details": [
+        "extra_atoms": extra_atom_types
+    }
+    
+    if details:
+        result["missed_details"] = [_atom_details(m) for m in missed]
+        result["wrong_details"] = [
             {
-                "atom_type": w[0],
-                "element": w[1],
-                "epsilon": w[2],
-                "sigma": w[3],
-                "charge": w[4]
+                **_atom_details(w),
+                "mismatched_fields": _mismatched_fields(gt_map[w[0]], w)
             } for w in wrong
-        ]
-    }
+        ] + [_atom_details(ext_map[atom_type]) for atom_type in extra_atom_types]
+    
+    return result
+
+
+def _mismatched_fields(gt_atom: Tuple, ext_atom: Tuple) -> List[str]:
+    """Names of the fields that differ between two atoms of the same type."""
+    names = ("atom_type", "element") + _NUMERIC_NAMES
+    return [name for name, g, e in zip(names, gt_atom, ext_atom) if g != e]
+
+
+def _init_worker(gt_map: Dict[str, Tuple]) -> None:
+    """Install the ground truth in a pool worker."""
+    global _WORKER_GT
+    _WORKER_GT = gt_map
+
+
+def _score_run(
+    ext_file: Path,
+    details: bool = True,
+    gt_map: Optional[Dict[str, Tuple]] = None
+) -> Dict[str, Any]:
+    """Load one extracted run and score it against the ground truth."""
+    if gt_map is None:
+        gt_map = _WORKER_GT
+    return calculate_iou_from_maps(gt_map, _atoms_to_map(load_atoms_only(ext_file)), details)
 
 
 def compare_all_runs(
     extracted_dir: Path,
     ground_truth_dir: Path,
     paper_id: str,
-    num_runs: int = 5
+    num_runs: int = 5,
+    max_workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Compare multiple runs of extraction against ground truth.
     
+    Runs are scored in a process pool; pass max_workers=1 to score inline.
+    With several runs, per-atom details are only kept for the best and
+    worst run (best_run / worst_run); all_runs holds scalar metrics.
+    
     Returns aggregated statistics.
     """
     gt_file = ground_truth_dir / f"{paper_id}.json"
     if not gt_file.exists():
         raise FileNotFoundError(f"Ground truth file not found: {gt_file}")
     
-    gt_data = load_json(gt_file)
+    # Ground truth is normalized once and shared by every run
+    gt_map = _load_ground_truth(gt_file)
     
-    results = []
+    # Filter missing runs up front so no worker is started for them
+    ext_files = []
     for run_num in range(1, num_runs + 1):
         ext_file = extracted_dir / f"{paper_id}_run{run_num}.json"
         if not ext_file.exists():
             print(f"⚠️  Warning: {ext_file} not found, skipping")
             continue
-        
-        ext_data = load_json(ext_file)
-        iou_result = calculate_iou(ext_data, gt_data)
-        results.append(iou_result)
+        ext_files.append(ext_file)
+    
+    # A single run keeps its details; otherwise they are rebuilt below
+    # for the runs worth reporting
+    details = len(ext_files) == 1
+    
+    workers = min(len(ext_files), max_workers or os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(gt_map,)
+        ) as executor:
+            results = list(executor.map(_score_run, ext_files, [details] * len(ext_files)))
+    else:
+        results = [_score_run(ext_file, details, gt_map) for ext_file in ext_files]
     
+    def detailed(i: int) -> Dict[str, Any]:
+        return results[i] if details else _score_run(ext_files[i], True, gt_map)
+    
+    return _summarize_runs(paper_id, [f.name for f in ext_files], results, detailed)
+
+
+def compare_runs_from_memory(
+    runs: Dict[int, Dict[str, Any]],
+    ground_truth_dir: Path,
+    paper_id: str
+) -> Dict[str, Any]:
+    """
+    Same as compare_all_runs, but for runs already held in memory.
+    
+    Args:
+        runs: {run_num: extracted data} as produced by the extraction step
+        ground_truth_dir: Directory with {paper_id}.json ground truth files
+        paper_id: Paper the runs belong to
+    
+    Returns aggregated statistics in the compare_all_runs format.
+    """
+    gt_file = ground_truth_dir / f"{paper_id}.json"
+    if not gt_file.exists():
+        raise FileNotFoundError(f"Ground truth file not found: {gt_file}")
+    
+    gt_map = _load_ground_truth(gt_file)
+    
+    run_nums = sorted(runs)
+    ext_maps = [_atoms_to_map(runs[n].get("atoms", [])) for n in run_nums]
+    details = len(ext_maps) == 1
+    results = [calculate_iou_from_maps(gt_map, ext_map, details) for ext_map in ext_maps]
+    
+    def detailed(i: int) -> Dict[str, Any]:
+        return results[i] if details else calculate_iou_from_maps(gt_map, ext_maps[i], True)
+    
+    names = [f"{paper_id}_run{n}.json" for n in run_nums]
+    return _summarize_runs(paper_id, names, results, detailed)
+
+
+def _summarize_runs(
+    paper_id: str,
+    names: List[str],
+    results: List[Dict[str, Any]],
+    detailed: Callable[[int], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Aggregate per-run scores; detailed(i) gives run i with per-atom details."""
     if not results:
         return {
             "paper_id": paper_id,
@@ -129,33 +323,88 @@ def compare_all_runs(
             "error": "No extraction results found"
         }
     
-    # Aggregate statistics
-    import statistics
+    # Aggregate statistics: one (n_runs, 3) array of iou, missed, wrong
+    metrics = np.array([(r["iou"], r["missed"], r["wrong"]) for r in results], dtype=np.float64)
+    iou_avg, missed_avg, wrong_avg = metrics.mean(axis=0).tolist()
+    iou_std = float(metrics[:, 0].std(ddof=1)) if len(results) > 1 else 0.0
     
-    ious = [r["iou"] for r in results]
-    missed_counts = [r["missed"] for r in results]
-    wrong_counts = [r["wrong"] for r in results]
+    best = int(metrics[:, 0].argmax())
+    worst = int(metrics[:, 0].argmin())
     
     return {
         "paper_id": paper_id,
         "num_runs": len(results),
-        "missed_avg": round(statistics.mean(missed_counts), 1),
-        "wrong_avg": round(statistics.mean(wrong_counts), 1),
-        "iou_avg": round(statistics.mean(ious), 2),
-        "iou_std": round(statistics.stdev(ious), 2) if len(ious) > 1 else 0.0,
+        "missed_avg": round(missed_avg, 1),
+        "wrong_avg": round(wrong_avg, 1),
+        "iou_avg": round(iou_avg, 2),
+        "iou_std": round(iou_std, 2),
+        "best_run": {"file": names[best], **detailed(best)},
+        "worst_run": {"file": names[worst], **detailed(worst)},
         "all_runs": results
     }
 
 
+def compare_all_papers(
+    paper_ids: List[str],
+    extracted_dir: Path,
+    ground_truth_dir: Path,
+    num_runs: int = 5,
+    max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare extraction runs for several papers, one paper per process.
+    
+    Returns a dict keyed by paper_id with the compare_all_runs result
+    (or an error entry if the paper could not be scored).
+    """
+    # One directory listing decides which papers have anything to score
+    present = {f.name for f in extracted_dir.glob("*_run*.json")}
+    
+    results: Dict[str, Dict[str, Any]] = {}
+    to_score = []
+    for paper_id in paper_ids:
+        if any(f"{paper_id}_run{n}.json" in present for n in range(1, num_runs + 1)):
+            to_score.append(paper_id)
+        else:
+            results[paper_id] = {
+                "paper_id": paper_id,
+                "num_runs": 0,
+                "error": "No extraction results found"
+            }
+    
+    if not to_score:
+        return results
+    
+    workers = min(len(to_score), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Runs within a paper are scored inline; the pool is across papers
+        futures = {
+            executor.submit(
+                compare_all_runs, extracted_dir, ground_truth_dir, paper_id, num_runs, 1
+            ): paper_id
+            for paper_id in to_score
+        }
+        for future in as_completed(futures):
+            paper_id = futures[future]
+            try:
+                results[paper_id] = future.result()
+            except Exception as e:
+                results[paper_id] = {"paper_id": paper_id, "num_runs": 0, "error": str(e)}
+    
+    # Keep the caller's ordering regardless of completion order
+    return {paper_id: results[paper_id] for paper_id in paper_ids}
+
+
 if __name__ == "__main__":
-    # Example usage
+    # Example usage: score every paper that has ground truth
     eval_dir = Path(__file__).parent
+    gt_dir = eval_dir / "ground_truth"
     
-    paper_id = "garcia_sanchez_2009"
-    result = compare_all_runs(
+    paper_ids = sorted(f.stem for f in gt_dir.glob("*.json"))
+    result = compare_all_papers(
+        paper_ids=paper_ids,
         extracted_dir=eval_dir / "extracted",
-        ground_truth_dir=eval_dir / "ground_truth",
-        paper_id=paper_id,
+        ground_truth_dir=gt_dir,
         num_runs=5
     )
     
@@ -6,13 +6,24 @@ Tests the ability to generate correct RASPA simulation files for different scena
 Based on paper Table 1 with 7 test scenarios.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+import argparse
 import json
+import os
+import re
+import shutil
+import threading
 import time
+import orjson
 from dotenv import load_dotenv
 
 from gcmc_agent.client import DeepSeekConfig, OpenAIChatClient
+from gcmc_agent.rate_limit import TokenBucket
 from gcmc_agent.agents.structure import StructureExpert
 from gcmc_agent.agents.forcefield import ForceFieldExpert
 from gcmc_agent.agents.simulation_input import SimulationInputExpert
@@ -20,6 +31,10 @@ from gcmc_agent.agents.coding import CodingExpert
 from gcmc_agent.agents.evaluator import Evaluator
 
 
+# First PASS/FAIL verdict in an Evaluator answer (e.g. "STATUS: PASS")
+_VERDICT_RE = re.compile(r"\b(PASS|FAIL)(?:ED)?\b", re.IGNORECASE)
+
+
 # Test scenarios from paper Table 1
 TEST_SCENARIOS = [
     {
@@ -106,6 +121,128 @@ TEST_SCENARIOS = [
 ]
 
 
+def _is_rate_limited(errors: List[str]) -> bool:
+    """Whether any error message looks like a provider rate-limit response."""
+    return any("429" in e or "rate limit" in e.lower() for e in errors)
+
+
+@dataclass(slots=True)
+class RunResult:
+    """Outcome of one simulation setup run."""
+    
+    run_name: str
+    structure: str
+    adsorbate: str
+    simulation_type: str
+    success: bool = False
+    execution_ready: bool = False
+    cached: bool = False
+    errors: List[str] = field(default_factory=list)
+    files_created: List[str] = field(default_factory=list)
+
+
+class SetupCache:
+    """
+    Generated template folders keyed by (structure, adsorbate, simulation_type).
+    
+    Each key has its own lock so concurrent runs of the same setup wait for
+    the first one to finish instead of generating it again.
+    """
+    
+    def __init__(self):
+        self._dirs: Dict[Tuple[str, str, str], Path] = {}
+        self._locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._guard = threading.Lock()
+    
+    def lock(self, key: Tuple[str, str, str]) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+    
+    def get(self, key: Tuple[str, str, str]) -> Optional[Path]:
+        return self._dirs.get(key)
+    
+    def put(self, key: Tuple[str, str, str], template_dir: Path) -> None:
+        self._dirs[key] = template_dir
+
+
+@lru_cache(maxsize=None)
+def _get_expert(expert_cls: type, llm_client: OpenAIChatClient, workspace_root: Path, model: str):
+    """
+    Build each expert once per (client, workspace, model) and reuse it.
+    
+    Experts keep no per-run state (the ReAct history lives inside run()),
+    so one instance can serve every setup, including concurrent ones.
+    """
+    return expert_cls(
+        llm_client=llm_client,
+        workspace_root=workspace_root,
+        model=model,
+        verbose=False
+    )
+
+
+def _generate_setup(
+    scenario: Dict,
+    structure: str,
+    adsorbate: str,
+    template_dir: Path,
+    llm_client: OpenAIChatClient,
+    workspace_root: Path,
+    run_name: str
+) -> Optional[str]:
+    """
+    Run the Structure, ForceField and SimulationInput experts into template_dir.
+    
+    Returns:
+        None on success, otherwise the error message of the failing step
+    """
+    # Step 1: Structure Expert
+    print(f"  📐 [{run_name}] StructureExpert...")
+    structure_expert = _get_expert(StructureExpert, llm_client, workspace_root, "deepseek-chat")
+    
+    struct_result = structure_expert.run(
+        structure_name=structure,
+        template_folder=template_dir
+    )
+    
+    if not struct_result.success:
+        return f"StructureExpert failed: {struct_result.error}"
+    
+    # Step 2: ForceField Expert
+    print(f"  🔬 [{run_name}] ForceFieldExpert...")
+    ff_expert = _get_expert(ForceFieldExpert, llm_client, workspace_root, "deepseek-chat")
+    
+    structure_file = template_dir / f"{structure}.cif"
+    ff_result = ff_expert.run(
+        structure_file=structure_file,
+        adsorbate=adsorbate,
+        template_folder=template_dir
+    )
+    
+    if not ff_result.success:
+        return f"ForceFieldExpert failed: {ff_result.error}"
+    
+    # Step 3: SimulationInput Expert
+    print(f"  ⚙️ [{run_name}] SimulationInputExpert...")
+    siminput_expert = _get_expert(SimulationInputExpert, llm_client, workspace_root, "deepseek-chat")
+    
+    siminput_result = siminput_expert.run(
+        simulation_type=scenario["simulation_type"],
+        structure_name=structure,
+        adsorbate=adsorbate,
+        template_folder=template_dir,
+        parameters={
+            "temperature": 298,
+            "pressures": [1e4, 1e5, 1e6]
+        }
+    )
+    
+    if not siminput_result.success:
+        return f"SimulationInputExpert failed: {siminput_result.error}"
+    
+    return None
+
+
 def run_single_setup(
     scenario: Dict,
     structure: str,
@@ -113,121 +250,74 @@ def run_single_setup(
     output_dir: Path,
     llm_client: OpenAIChatClient,
     workspace_root: Path,
-    run_id: int
-) -> Dict[str, Any]:
+    run_id: int,
+    setup_cache: Optional[SetupCache] = None
+) -> RunResult:
     """
     Run a single simulation setup task.
     
+    With a setup_cache, the expert-generated files for a given
+    (structure, adsorbate, simulation_type) are produced once and copied
+    for later runs; the file check and Evaluator still run every time.
+    
     Returns:
-        Dictionary with success metrics
+        RunResult with success metrics
     """
     run_name = f"{scenario['id']}_{structure}_{adsorbate}_run{run_id}"
     template_dir = output_dir / run_name / "template"
     template_dir.mkdir(parents=True, exist_ok=True)
     
-    result = {
-        "run_name": run_name,
-        "structure": structure,
-        "adsorbate": adsorbate,
-        "simulation_type": scenario["simulation_type"],
-        "success": False,
-        "execution_ready": False,
-        "errors": [],
-        "files_created": []
-    }
+    result = RunResult(
+        run_name=run_name,
+        structure=structure,
+        adsorbate=adsorbate,
+        simulation_type=scenario["simulation_type"]
+    )
     
     try:
-        # Step 1: Structure Expert
-        print(f"  📐 [{run_name}] StructureExpert...")
-        structure_expert = StructureExpert(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model="deepseek-chat",
-            verbose=False
-        )
-        
-        struct_result = structure_expert.run(
-            structure_name=structure,
-            template_folder=template_dir
-        )
-        
-        if not struct_result.success:
-            result["errors"].append(f"StructureExpert failed: {struct_result.error}")
-            return result
-        
-        # Step 2: ForceField Expert
-        print(f"  🔬 [{run_name}] ForceFieldExpert...")
-        ff_expert = ForceFieldExpert(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model="deepseek-chat",
-            verbose=False
-        )
-        
-        structure_file = template_dir / f"{structure}.cif"
-        ff_result = ff_expert.run(
-            structure_file=structure_file,
-            adsorbate=adsorbate,
-            template_folder=template_dir
-        )
-        
-        if not ff_result.success:
-            result["errors"].append(f"ForceFieldExpert failed: {ff_result.error}")
-            return result
-        
-        # Step 3: SimulationInput Expert
-        print(f"  ⚙️ [{run_name}] SimulationInputExpert...")
-        siminput_expert = SimulationInputExpert(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model="deepseek-chat",
-            verbose=False
-        )
-        
-        siminput_result = siminput_expert.run(
-            simulation_type=scenario["simulation_type"],
-            structure_name=structure,
-            adsorbate=adsorbate,
-            template_folder=template_dir,
-            parameters={
-                "temperature": 298,
-                "pressures": [1e4, 1e5, 1e6]
-            }
-        )
-        
-        if not siminput_result.success:
-            result["errors"].append(f"SimulationInputExpert failed: {siminput_result.error}")
-            return result
-        
-        # Step 4: Verify files
-        required_files = [
-            f"{structure}.cif",
-            "pseudo_atoms.def",
-            "force_field_mixing_rules.def",
-            "force_field.def",
-            "simulation.input"
-        ]
-        
-        missing_files = []
-        for fname in required_files:
-            fpath = template_dir / fname
-            if fpath.exists():
-                result["files_created"].append(fname)
+        key = (structure, adsorbate, scenario["simulation_type"])
+        with setup_cache.lock(key) if setup_cache else nullcontext():
+            cached_dir = setup_cache.get(key) if setup_cache else None
+            if cached_dir is not None:
+                print(f"  ♻️ [{run_name}] Reusing setup from {cached_dir}")
+                shutil.copytree(cached_dir, template_dir, dirs_exist_ok=True)
+                result.cached = True
             else:
-                missing_files.append(fname)
+                error = _generate_setup(
+                    scenario, structure, adsorbate, template_dir,
+                    llm_client, workspace_root, run_name
+                )
+                if error:
+                    result.errors.append(error)
+                    return result
+            
+            # Step 4: Verify files
+            required_files = [
+                f"{structure}.cif",
+                "pseudo_atoms.def",
+                "force_field_mixing_rules.def",
+                "force_field.def",
+                "simulation.input"
+            ]
+            
+            # One directory listing instead of a stat per required file
+            with os.scandir(template_dir) as entries:
+                present = {entry.name for entry in entries}
+            result.files_created = [f for f in required_files if f in present]
+            missing_files = [f for f in required_files if f not in present]
+            
+            # Only a complete setup is reused; otherwise the next run of this
+            # scenario generates its own
+            if setup_cache and not result.cached and not missing_files:
+                setup_cache.put(key, template_dir)
         
         if missing_files:
-            result["errors"].append(f"Missing files: {missing_files}")
+            result.errors.append(f"Missing files: {missing_files}")
             return result
         
         # Step 5: Evaluator check
         print(f"  ✅ [{run_name}] Evaluator...")
-        evaluator = Evaluator(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model="deepseek-chat",
-            verbose=False
-        )
+        evaluator = _get_expert(Evaluator, llm_client, workspace_root, "deepseek-chat")
         
         eval_result = evaluator.run(
             template_folder=template_dir,
@@ -236,20 +326,22 @@ def run_single_setup(
         )
         
         # Parse evaluation
-        if eval_result.success and "PASS" in eval_result.answer.upper():
-            result["success"] = True
-            result["execution_ready"] = True
-        elif eval_result.success and "FAIL" in eval_result.answer.upper():
-            result["success"] = True  # Setup completed
-            result["execution_ready"] = False  # But has issues
-            result["errors"].append("Evaluator found issues")
+        match = _VERDICT_RE.search(eval_result.answer) if eval_result.success else None
+        verdict = match.group(1).upper() if match else None
+        if verdict == "PASS":
+            result.success = True
+            result.execution_ready = True
+        elif verdict == "FAIL":
+            result.success = True  # Setup completed
+            result.execution_ready = False  # But has issues
+            result.errors.append("Evaluator found issues")
         else:
-            result["errors"].append(f"Evaluator failed: {eval_result.error}")
+            result.errors.append(f"Evaluator failed: {eval_result.error}")
         
         return result
         
     except Exception as e:
-        result["errors"].append(f"Exception: {str(e)}")
+        result.errors.append(f"Exception: {str(e)}")
         return result
 
 
@@ -258,11 +350,17 @@ def run_scenario_evaluation(
     output_dir: Path,
     llm_client: OpenAIChatClient,
     workspace_root: Path,
-    num_runs: int = 5
+    num_runs: int = 5,
+    rate_limiter: Optional[TokenBucket] = None,
+    max_workers: int = 1,
+    setup_cache: Optional[SetupCache] = None
 ) -> Dict[str, Any]:
     """
     Run evaluation for a single scenario.
     
+    Setups are I/O-bound on the LLM API, so up to max_workers of them run
+    concurrently in threads. Each setup writes to its own run directory.
+    
     Returns:
         Results dictionary with metrics
     """
@@ -282,37 +380,56 @@ def run_scenario_evaluation(
             "expected_execution_rate": scenario["expected_execution_rate"]
         }
     
-    all_results = []
+    tasks = [
+        (structure, adsorbate, run_id)
+        for run_id in range(num_runs)
+        for structure in scenario["structures"]
+        for adsorbate in scenario["adsorbates"]
+    ]
+    
+    def run_task(structure: str, adsorbate: str, run_id: int) -> RunResult:
+        if rate_limiter:
+            rate_limiter.acquire()
+        return run_single_setup(
+            scenario=scenario,
+            structure=structure,
+            adsorbate=adsorbate,
+            output_dir=output_dir,
+            llm_client=llm_client,
+            workspace_root=workspace_root,
+            run_id=run_id,
+            setup_cache=setup_cache
+        )
     
     # Run tests
-    for run_id in range(num_runs):
-        for structure in scenario["structures"]:
-            for adsorbate in scenario["adsorbates"]:
-                print(f"\n  Run {run_id+1}/{num_runs}: {structure} + {adsorbate}")
-                
-                result = run_single_setup(
-                    scenario=scenario,
-                    structure=structure,
-                    adsorbate=adsorbate,
-                    output_dir=output_dir,
-                    llm_client=llm_client,
-                    workspace_root=workspace_root,
-                    run_id=run_id
-                )
-                
-                all_results.append(result)
-                
-                # Brief status
-                status = "✅" if result["success"] else "❌"
-                exec_status = "🟢" if result["execution_ready"] else "🟡"
-                print(f"    Setup: {status}  Executable: {exec_status}")
-                
-                time.sleep(1)  # Rate limiting
+    results_by_task: Dict[int, RunResult] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(run_task, *task): i for i, task in enumerate(tasks)}
+        for future in as_completed(futures):
+            i = futures[future]
+            structure, adsorbate, run_id = tasks[i]
+            result = future.result()
+            results_by_task[i] = result
+            
+            # Brief status
+            status = "✅" if result.success else "❌"
+            exec_status = "🟢" if result.execution_ready else "🟡"
+            print(f"\n  Run {run_id+1}/{num_runs}: {structure} + {adsorbate}")
+            print(f"    Setup: {status}  Executable: {exec_status}")
+            
+            if rate_limiter:
+                if _is_rate_limited(result.errors):
+                    rate_limiter.backoff()
+                else:
+                    rate_limiter.reset_backoff()
+    
+    # Report in task order regardless of completion order
+    all_results = [results_by_task[i] for i in range(len(tasks))]
     
     # Calculate metrics
     total = len(all_results)
-    successful = sum(1 for r in all_results if r["success"])
-    executable = sum(1 for r in all_results if r["execution_ready"])
+    successful = sum(1 for r in all_results if r.success)
+    executable = sum(1 for r in all_results if r.execution_ready)
     
     success_rate = successful / total if total > 0 else 0
     execution_rate = executable / total if total > 0 else 0
@@ -338,6 +455,13 @@ def run_scenario_evaluation(
 
 def main():
     """Run Table 1 evaluation."""
+    parser = argparse.ArgumentParser(description='Run Table 1 Experiment Setup Evaluation')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Number of setups to run concurrently (default: 4)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Generate every run from scratch instead of reusing identical setups')
+    args = parser.parse_args()
+    
     load_dotenv()
     
     # Setup
@@ -349,32 +473,46 @@ def main():
     # Initialize LLM
     cfg = DeepSeekConfig.from_env()
     llm_client = OpenAIChatClient(cfg)
+    rate_limiter = TokenBucket(rate=1.0, capacity=5)
+    setup_cache = None if args.no_cache else SetupCache()
     
     print("="*80)
     print("TABLE 1 EVALUATION - EXPERIMENT SETUP TEAM")
     print("="*80)
     print(f"\nOutput directory: {output_dir}")
     print(f"Number of scenarios: {len(TEST_SCENARIOS)}")
-    print(f"Runs per scenario: 5\n")
+    print(f"Runs per scenario: 5")
+    print(f"Concurrent setups: {args.workers}\n")
     
     all_scenario_results = []
     
-    # Run each scenario
-    for scenario in TEST_SCENARIOS:
-        result = run_scenario_evaluation(
-            scenario=scenario,
-            output_dir=output_dir,
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            num_runs=5
-        )
-        all_scenario_results.append(result)
+    # Full per-scenario results (including every run) are streamed to NDJSON
+    # as each scenario finishes; only the scenario metrics stay in memory.
+    details_file = Path("evaluation/table1_results.ndjson")
+    with open(details_file, 'wb') as details_out:
+        for scenario in TEST_SCENARIOS:
+            result = run_scenario_evaluation(
+                scenario=scenario,
+                output_dir=output_dir,
+                llm_client=llm_client,
+                workspace_root=workspace_root,
+                num_runs=5,
+                rate_limiter=rate_limiter,
+                max_workers=args.workers,
+                setup_cache=setup_cache
+            )
+            details_out.write(orjson.dumps(result) + b"\n")
+            details_out.flush()
+            
+            result.pop("individual_results", None)
+            all_scenario_results.append(result)
     
-    # Save results
+    # Save summary
     results_file = Path("evaluation/table1_results.json")
     with open(results_file, 'w') as f:
         json.dump({
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "details_file": str(details_file),
             "scenarios": all_scenario_results,
             "summary": {
                 "total_scenarios": len(TEST_SCENARIOS),
@@ -387,6 +525,7 @@ def main():
     print("SUMMARY")
     print(f"{'='*80}")
     print(f"\nResults saved to: {results_file}")
+    print(f"Per-run details: {details_file}")
     
     # Print comparison table
     print(f"\n{'Scenario':<30} {'Success':<15} {'Execution':<15} {'Status'}")
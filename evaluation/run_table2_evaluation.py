@@ -9,33 +9,76 @@ Supports:
 - Hardcoded example texts (fallback)
 """
 
+import asyncio
+import hashlib
 import json
+import os
 import sys
 import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from statistics import mean, stdev
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import Callable, Optional, Dict, List, Mapping, Tuple
+
+import httpx
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from dotenv import load_dotenv
 from gcmc_agent.client import DeepSeekConfig, OpenAIChatClient
+from gcmc_agent.llm_cache import LLMResponseCache
 from gcmc_agent.research.extraction_agent import PaperExtractionAgent
 from gcmc_agent.research.semantic_scholar import SemanticScholarClient
 
-from iou_calculator import calculate_iou, load_json
+from iou_calculator import calculate_iou, compare_runs_from_memory, load_json, save_json
 
 try:
     from pypdf import PdfReader
     PYPDF_AVAILABLE = True
 except ImportError:
     PYPDF_AVAILABLE = False
+
+# Optional faster backend (PDFium bindings); preferred when installed
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+try:
+    from rich.progress import Progress, BarColumn, MofNCompleteColumn, TextColumn, TimeElapsedColumn
+    RICH_AVAILABLE = True
+except ImportError:
+    RICH_AVAILABLE = False
+
+if not (PYPDF_AVAILABLE or PDFIUM_AVAILABLE):
     print("⚠️  pypdf not installed. PDF loading disabled. Install with: pip install pypdf")
 
+# PDFium is not thread-safe; serialize its use across loader threads
+_PDFIUM_LOCK = threading.Lock()
+
+# Below this many pages the process pool costs more than it saves
+_PARALLEL_PAGE_THRESHOLD = 8
+
+# Decoder for the JSON object in extraction answers
+_JSON_DECODER = json.JSONDecoder()
+
+# Politeness limit for simultaneous PDF downloads
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Extracted PDF text, keyed by a hash of the PDF bytes
+TEXT_CACHE_DIR = Path(__file__).parent / "pdfs" / "text_cache"
+
+# Paper texts already loaded in this process, keyed by (paper_id, pdf_dir, use_api)
+_PAPER_TEXTS: Dict[Tuple[str, Optional[Path], bool], str] = {}
+
 
 # Paper metadata: DOI, title, search query for Semantic Scholar
-PAPER_METADATA = {
+PAPER_METADATA: Mapping[str, Mapping[str, str]] = MappingProxyType({
     "garcia_sanchez_2009": {
         "doi": "10.1021/jp810871f",
         "title": "Transferable Force Field for Carbon Dioxide Adsorption in Zeolites",
@@ -72,10 +115,10 @@ PAPER_METADATA = {
         "search_query": "Martin Siepmann TraPPE transferable potential phase equilibria",
         "pdf_filename": "multigas_trappe.pdf"
     },
-}
+})
 
-# Paper texts (abbreviated versions with force field tables - fallback when PDF not available)
-PAPERS = {
+# Fallback paper texts (abbreviated versions with force field tables)
+PAPERS: Mapping[str, str] = MappingProxyType({
     "garcia_sanchez_2009": """
 Transferable Force Field for Carbon Dioxide Adsorption in Zeolites
 J. Phys. Chem. C 2009, 113, 8814-8820
@@ -105,64 +148,228 @@ O_b          85.7        2.96      0.0
 
 Mixing rules: Lorentz-Berthelot
 """,
-}
+    
+    "vujic_2016": """
+Transferable Force-Field for Modelling of CO2, N2, O2 and Ar in All-Silica and Na+ Exchanged Zeolites
+Modelling Simul. Mater. Sci. Eng. 2016, 24, 045002
 
+Table 2: Lennard-Jones Parameters
+Atom Type    ε/kB (K)    σ (Å)     q (|e|)
+C_co2        28.129      2.757     +0.6512
+O_co2        80.507      3.033     -0.3256
+N_n2         38.298      3.310     -0.4050
+O_o2         49.0        3.020     -0.1130
+Ar           124.07      3.358     0.0
 
-def extract_text_from_pdf(pdf_path: Path) -> Optional[str]:
-    """Extract text from PDF file."""
-    if not PYPDF_AVAILABLE:
+Mixing rules: Lorentz-Berthelot
+""",
+    
+    "epm2_harris_1995": """
+Carbon Dioxide's Liquid-Vapor Coexistence Curve And Critical Properties
+J. Phys. Chem. 1995, 99, 12021-12024
+
+EPM2 Model Parameters
+Table I: Molecular Parameters for CO2
+Atom    ε/kB (K)    σ (Å)     q (|e|)
+C       28.129      2.757     +0.6512
+O       80.507      3.033     -0.3256
+
+Bond length: C-O = 1.149 Å
+Combining rules: Lorentz-Berthelot
+""",
+    
+    "martin_calvo_2015": """
+Transferable Force Fields for Adsorption of Small Gases in Zeolites
+Phys. Chem. Chem. Phys. 2015, 17, 24048-24055
+
+Force Field: TraPPE model for CO2
+Table 1: CO2 Parameters
+Atom Type    ε/kB (K)    σ (Å)     q (|e|)
+C_co2        27.0        2.80      +0.70
+O_co2        79.0        3.05      -0.35
+
+Lorentz-Berthelot mixing rules
+""",
+    
+    "multigas_trappe": """
+TraPPE: A Transferable Potential for Phase Equilibria
+Fluid Phase Equilibria 1998
+
+Table 3: United-Atom Parameters for Small Molecules
+Atom Type    ε/kB (K)    σ (Å)     q (|e|)
+CH4          148.0       3.73      0.0
+C_co2        27.0        2.80      +0.70
+O_co2        79.0        3.05      -0.35
+N_n2         36.0        3.31      -0.482
+O_o2         49.0        3.02      0.0
+
+Mixing rules: Lorentz-Berthelot
+""",
+})
+
+# Paper ids in definition order
+_PAPER_IDS = tuple(PAPERS)
+
+
+def _extract_pages_pypdf(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract text of pages [start, stop) with pypdf (runs in a worker process)."""
+    reader = PdfReader(pdf_path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _extract_pages_pdfium(pdf_path: Path) -> List[str]:
+    """Extract text of every page with PDFium."""
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            return [page.get_textpage().get_text_range() for page in pdf]
+        finally:
+            pdf.close()
+
+
+def extract_text_from_pdf(
+    pdf_path: Path,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = TEXT_CACHE_DIR
+) -> Optional[str]:
+    """
+    Extract text from PDF file.
+    
+    Results are cached in cache_dir under a hash of the PDF content, so a
+    re-downloaded copy of the same paper is not parsed again; pass
+    cache_dir=None to always parse.
+    
+    Uses PDFium when pypdfium2 is installed. Otherwise pypdf parses page
+    ranges in a process pool; its page parsing is pure Python and its
+    reader is not safe to share between threads.
+    """
+    cache_file = None
+    if cache_dir is not None:
+        key = hashlib.blake2b(pdf_path.read_bytes(), digest_size=16).hexdigest()
+        cache_file = cache_dir / f"{key}.txt"
+        if cache_file.exists():
+            full_text = cache_file.read_text(encoding='utf-8')
+            print(f"✅ Loaded {len(full_text)} cached characters for {pdf_path.name}")
+            return full_text
+    
+    if not (PYPDF_AVAILABLE or PDFIUM_AVAILABLE):
         print(f"❌ pypdf not available. Cannot extract from {pdf_path}")
         return None
     
     try:
-        reader = PdfReader(pdf_path)
-        text_parts = []
-        for i, page in enumerate(reader.pages):
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
+        if PDFIUM_AVAILABLE:
+            text_parts = _extract_pages_pdfium(pdf_path)
+        else:
+            n_pages = len(PdfReader(pdf_path).pages)
+            workers = min(max_workers or os.cpu_count() or 1, n_pages)
+            if n_pages < _PARALLEL_PAGE_THRESHOLD or workers <= 1:
+                text_parts = _extract_pages_pypdf(str(pdf_path), 0, n_pages)
+            else:
+                # Contiguous page ranges, one per worker, joined back in order
+                bounds = [n_pages * i // workers for i in range(workers + 1)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunks = executor.map(
+                        _extract_pages_pypdf,
+                        [str(pdf_path)] * workers, bounds[:-1], bounds[1:]
+                    )
+                    text_parts = [text for chunk in chunks for text in chunk]
         
-        full_text = "\n".join(text_parts)
+        full_text = "\n".join(text for text in text_parts if text)
         print(f"✅ Extracted {len(full_text)} characters from {pdf_path.name}")
+        
+        if cache_file is not None:
+            # Write then rename so a concurrent reader never sees a partial file
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_file.write_text(full_text, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        
         return full_text
     except Exception as e:
         print(f"❌ Error extracting PDF {pdf_path}: {e}")
         return None
 
 
-def download_paper_from_semantic_scholar(paper_id: str, metadata: Dict, output_dir: Path) -> Optional[str]:
+def _make_http_client() -> httpx.AsyncClient:
+    """Pooled client for PDF downloads; retries failed connection attempts."""
+    return httpx.AsyncClient(
+        timeout=30.0,
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(retries=3),
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+    )
+
+
+async def download_pdf(
+    http: httpx.AsyncClient,
+    url: str,
+    pdf_path: Path,
+    semaphore: asyncio.Semaphore
+) -> bool:
+    """Stream a PDF to disk in chunks; returns True on success."""
+    async with semaphore:
+        tmp_path = pdf_path.with_name(pdf_path.name + ".part")
+        async with http.stream("GET", url) as response:
+            if response.status_code != 200:
+                print(f"❌ Failed to download PDF: HTTP {response.status_code}")
+                return False
+            with open(tmp_path, 'wb') as f:
+                async for chunk in response.aiter_bytes(65536):
+                    f.write(chunk)
+        os.replace(tmp_path, pdf_path)
+        return True
+
+
+async def download_paper_from_semantic_scholar(
+    paper_id: str,
+    metadata: Dict,
+    output_dir: Path,
+    http: httpx.AsyncClient,
+    download_semaphore: asyncio.Semaphore
+) -> Optional[str]:
     """Try to download paper from Semantic Scholar."""
+    target_doi = metadata['doi']
+    target_doi_lc = target_doi.lower()  # DOIs are case-insensitive
+    target_title_lc = metadata['title'].lower()
+    pdf_path = output_dir / metadata['pdf_filename']
+    
+    # A PDF downloaded by an earlier run is complete (downloads land via rename)
+    if pdf_path.exists():
+        print(f"📄 Using previously downloaded PDF: {pdf_path}")
+        return await asyncio.to_thread(extract_text_from_pdf, pdf_path)
+    
     try:
         client = SemanticScholarClient()
-        
-        # Search for paper
-        print(f"🔍 Searching Semantic Scholar for: {metadata['search_query']}")
-        results = client.search(
-            query=metadata['search_query'],
-            limit=3,
-            fields=['title', 'abstract', 'openAccessPdf', 'externalIds']
-        )
-        
-        if not results:
-            print(f"❌ No results found on Semantic Scholar")
-            return None
-        
-        # Find matching paper (check DOI or title)
-        target_paper = None
-        for paper in results:
-            external_ids = paper.get('externalIds', {})
-            if external_ids.get('DOI') == metadata['doi']:
-                target_paper = paper
-                print(f"✅ Found paper by DOI: {metadata['doi']}")
-                break
-            elif metadata['title'].lower() in paper.get('title', '').lower():
-                target_paper = paper
-                print(f"✅ Found paper by title match")
-                break
-        
-        if not target_paper:
-            print(f"❌ Could not match paper in results")
-            return None
+
+        # Direct DOI lookup: one request, no ranking ambiguity
+        print(f"🔍 Looking up DOI on Semantic Scholar: {target_doi}")
+        target_paper = await asyncio.to_thread(client.get_by_doi, target_doi)
+        if target_paper:
+            print(f"✅ Found paper by DOI: {target_doi}")
+        else:
+            # Fall back to search when the DOI is unknown
+            print(f"🔍 Searching Semantic Scholar for: {metadata['search_query']}")
+            results = await asyncio.to_thread(client.search, query=metadata['search_query'], limit=3)
+            
+            if not results:
+                print(f"❌ No results found on Semantic Scholar")
+                return None
+            
+            # Find matching paper by DOI, then by title
+            for paper in results:
+                ext = paper.get('externalIds') or {}
+                if (ext.get('DOI') or '').lower() == target_doi_lc:
+                    target_paper = paper
+                    print(f"✅ Found paper by DOI match")
+                    break
+                if target_title_lc in (paper.get('title') or '').lower():
+                    target_paper = paper
+                    print(f"✅ Found paper by title match")
+                    break
+
+            if not target_paper:
+                print(f"❌ Could not match paper in results")
+                return None
         
         # Check for open access PDF
         pdf_info = target_paper.get('openAccessPdf')
@@ -171,18 +378,11 @@ def download_paper_from_semantic_scholar(paper_id: str, metadata: Dict, output_d
             print(f"📥 Found open access PDF: {pdf_url}")
             
             # Download PDF
-            import requests
-            response = requests.get(pdf_url, timeout=30)
-            if response.status_code == 200:
-                pdf_path = output_dir / metadata['pdf_filename']
-                with open(pdf_path, 'wb') as f:
-                    f.write(response.content)
+            if await download_pdf(http, pdf_url, pdf_path, download_semaphore):
                 print(f"✅ Downloaded PDF to {pdf_path}")
                 
                 # Extract text
-                return extract_text_from_pdf(pdf_path)
-            else:
-                print(f"❌ Failed to download PDF: HTTP {response.status_code}")
+                return await asyncio.to_thread(extract_text_from_pdf, pdf_path)
         else:
             print(f"❌ No open access PDF available")
         
@@ -193,8 +393,33 @@ def download_paper_from_semantic_scholar(paper_id: str, metadata: Dict, output_d
         return None
 
 
-def load_paper_text(paper_id: str, pdf_dir: Optional[Path] = None, use_api: bool = False) -> str:
-    """Load paper text from PDF, API, or fallback to hardcoded examples."""
+async def load_paper_text(
+    paper_id: str,
+    pdf_dir: Optional[Path] = None,
+    use_api: bool = False,
+    http: Optional[httpx.AsyncClient] = None,
+    download_semaphore: Optional[asyncio.Semaphore] = None
+) -> str:
+    """
+    Load paper text from PDF, API, or fallback to hardcoded examples.
+    
+    Results are memoized per process, so asking for the same paper again
+    (another run, another --runs setting) skips the PDF and the API.
+    """
+    key = (paper_id, pdf_dir, use_api)
+    if key not in _PAPER_TEXTS:
+        _PAPER_TEXTS[key] = await _load_paper_text(paper_id, pdf_dir, use_api, http, download_semaphore)
+    return _PAPER_TEXTS[key]
+
+
+async def _load_paper_text(
+    paper_id: str,
+    pdf_dir: Optional[Path],
+    use_api: bool,
+    http: Optional[httpx.AsyncClient],
+    download_semaphore: Optional[asyncio.Semaphore]
+) -> str:
+    """Uncached body of load_paper_text."""
     metadata = PAPER_METADATA[paper_id]
     
     # Try 1: Local PDF file
@@ -202,7 +427,7 @@ def load_paper_text(paper_id: str, pdf_dir: Optional[Path] = None, use_api: bool
         pdf_path = pdf_dir / metadata['pdf_filename']
         if pdf_path.exists():
             print(f"📄 Loading from local PDF: {pdf_path}")
-            text = extract_text_from_pdf(pdf_path)
+            text = await asyncio.to_thread(extract_text_from_pdf, pdf_path)
             if text:
                 return text
     
@@ -211,7 +436,13 @@ def load_paper_text(paper_id: str, pdf_dir: Optional[Path] = None, use_api: bool
         pdf_cache_dir = Path(__file__).parent / "pdfs"
         pdf_cache_dir.mkdir(exist_ok=True)
         
-        text = download_paper_from_semantic_scholar(paper_id, metadata, pdf_cache_dir)
+        # Standalone callers get a client of their own
+        client = nullcontext(http) if http else _make_http_client()
+        async with client as http:
+            text = await download_paper_from_semantic_scholar(
+                paper_id, metadata, pdf_cache_dir, http,
+                download_semaphore or asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+            )
         if text:
             return text
     
@@ -220,114 +451,82 @@ def load_paper_text(paper_id: str, pdf_dir: Optional[Path] = None, use_api: bool
     return PAPERS[paper_id]
 
 
-# Fallback paper texts (abbreviated versions with force field tables)
-PAPERS = {
-    "garcia_sanchez_2009": """
-Transferable Force Field for Carbon Dioxide Adsorption in Zeolites
-J. Phys. Chem. C 2009, 113, 8814-8820
-
-Force Field Parameters
-The CO2 molecule is modeled using the TraPPE force field.
-
-Table 1: Lennard-Jones Parameters for CO2
-Atom Type    ε/kB (K)    σ (Å)     q (|e|)
-C_co2        27.0        2.80      +0.70
-O_co2        79.0        3.05      -0.35
-
-Mixing rules: Lorentz-Berthelot
-""",
+class ExtractionProgress:
+    """
+    Progress display for the extraction phase: one bar per paper.
     
-    "trappe_zeo_bai_2013": """
-TraPPE-zeo: Transferable Potentials for Phase Equilibria Force Field for All-Silica Zeolites
-J. Phys. Chem. C 2013, 117, 24375-24387
-
-Table 1: Force Field Parameters for Zeolite Framework
-Atom Type    ε/kB (K)    σ (Å)     q (|e|)
-Si           22.0        2.30      0.0
-O_z          53.0        3.30      0.0
-
-Additional note: The framework atoms have a small offset:
-O_b          85.7        2.96      0.0
-
-Mixing rules: Lorentz-Berthelot
-""",
+    Uses rich on an interactive terminal. Elsewhere (CI, redirected output)
+    only one summary line per paper is printed once its runs are done.
+    Per-run messages go through log(), which is safe to call from worker
+    threads; advance() is called from the event loop.
+    """
     
-    "vujic_2016": """
-Transferable Force-Field for Modelling of CO2, N2, O2 and Ar in All-Silica and Na+ Exchanged Zeolites
-Modelling Simul. Mater. Sci. Eng. 2016, 24, 045002
-
-Table 2: Lennard-Jones Parameters
-Atom Type    ε/kB (K)    σ (Å)     q (|e|)
-C_co2        28.129      2.757     +0.6512
-O_co2        80.507      3.033     -0.3256
-N_n2         38.298      3.310     -0.4050
-O_o2         49.0        3.020     -0.1130
-Ar           124.07      3.358     0.0
-
-Mixing rules: Lorentz-Berthelot
-""",
+    def __init__(self, papers: List[str], num_runs: int):
+        self.num_runs = num_runs
+        self._done = {paper_id: 0 for paper_id in papers}
+        self._failed = {paper_id: 0 for paper_id in papers}
+        self._progress = None
+        if RICH_AVAILABLE and sys.stdout.isatty():
+            self._progress = Progress(
+                TextColumn("{task.description:<28}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeElapsedColumn(),
+            )
+            self._tasks = {
+                paper_id: self._progress.add_task(paper_id, total=num_runs)
+                for paper_id in papers
+            }
     
-    "epm2_harris_1995": """
-Carbon Dioxide's Liquid-Vapor Coexistence Curve And Critical Properties
-J. Phys. Chem. 1995, 99, 12021-12024
-
-EPM2 Model Parameters
-Table I: Molecular Parameters for CO2
-Atom    ε/kB (K)    σ (Å)     q (|e|)
-C       28.129      2.757     +0.6512
-O       80.507      3.033     -0.3256
-
-Bond length: C-O = 1.149 Å
-Combining rules: Lorentz-Berthelot
-""",
+    def __enter__(self):
+        if self._progress:
+            self._progress.start()
+        return self
     
-    "martin_calvo_2015": """
-Transferable Force Fields for Adsorption of Small Gases in Zeolites
-Phys. Chem. Chem. Phys. 2015, 17, 24048-24055
-
-Force Field: TraPPE model for CO2
-Table 1: CO2 Parameters
-Atom Type    ε/kB (K)    σ (Å)     q (|e|)
-C_co2        27.0        2.80      +0.70
-O_co2        79.0        3.05      -0.35
-
-Lorentz-Berthelot mixing rules
-""",
+    def __exit__(self, *exc):
+        if self._progress:
+            self._progress.stop()
     
-    "multigas_trappe": """
-TraPPE: A Transferable Potential for Phase Equilibria
-Fluid Phase Equilibria 1998
-
-Table 3: United-Atom Parameters for Small Molecules
-Atom Type    ε/kB (K)    σ (Å)     q (|e|)
-CH4          148.0       3.73      0.0
-C_co2        27.0        2.80      +0.70
-O_co2        79.0        3.05      -0.35
-N_n2         36.0        3.31      -0.482
-O_o2         49.0        3.02      0.0
-
-Mixing rules: Lorentz-Berthelot
-""",
-}
-
-
-def run_extraction(paper_id: str, paper_text: str, run_num: int, output_dir: Path):
-    """Run a single extraction and save results."""
-    print(f"\n{'='*60}")
-    print(f"Run {run_num}: {paper_id}")
-    print(f"{'='*60}")
+    def log(self, message: str):
+        """Milestone or per-run message (only shown with the rich display)."""
+        if self._progress:
+            self._progress.console.log(message)
     
-    load_dotenv()
-    cfg = DeepSeekConfig.from_env()
-    llm_client = OpenAIChatClient(cfg)
-    workspace_root = Path.cwd()
+    def advance(self, paper_id: str, failed: bool = False):
+        """Record one finished run of paper_id."""
+        self._done[paper_id] += 1
+        self._failed[paper_id] += failed
+        if self._progress:
+            self._progress.update(self._tasks[paper_id], advance=1)
+        elif self._done[paper_id] == self.num_runs:
+            failed_runs = self._failed[paper_id]
+            icon = "❌" if failed_runs else "✅"
+            print(f"{icon} {paper_id}: {self.num_runs - failed_runs}/{self.num_runs} runs finished")
+
+
+def run_extraction(
+    paper_id: str,
+    paper_text: str,
+    run_num: int,
+    output_dir: Path,
+    agent: PaperExtractionAgent,
+    force: bool = False,
+    log: Callable[[str], None] = print
+) -> Dict:
+    """
+    Run a single extraction and save results (skipped if already saved, unless force).
     
-    agent = PaperExtractionAgent(
-        llm_client=llm_client,
-        workspace_root=workspace_root,
-        model="deepseek-chat",
-        verbose=True
-    )
+    Status is reported as a single line through log.
+    Returns the extracted data, so scoring does not have to read it back.
+    """
+    output_file = output_dir / f"{paper_id}_run{run_num}.json"
+    if output_file.exists() and not force:
+        saved = load_json(output_file)
+        # Failed runs are saved too ({"error": ...}); those are retried
+        if not (isinstance(saved, dict) and "error" in saved):
+            log(f"⏭️  Run {run_num}: {paper_id} already extracted ({output_file.name}), skipping")
+            return saved
+        log(f"🔁 Run {run_num}: {paper_id} failed before ({saved['error']}), retrying")
     
     result = agent.run(
         paper_text=paper_text,
@@ -339,30 +538,108 @@ def run_extraction(paper_id: str, paper_text: str, run_num: int, output_dir: Pat
         # Extract JSON from answer
         answer = result.answer
         try:
-            # Try to parse as JSON
-            if answer.strip().startswith('{'):
-                extracted_data = json.loads(answer)
+            # Decode the first JSON object in the answer; trailing prose
+            # after it (common in ReAct answers) is ignored
+            start = answer.find('{')
+            if start >= 0:
+                extracted_data, _ = _JSON_DECODER.raw_decode(answer, start)
             else:
-                # Look for JSON in the answer
-                import re
-                json_match = re.search(r'\{.*\}', answer, re.DOTALL)
-                if json_match:
-                    extracted_data = json.loads(json_match.group())
-                else:
-                    extracted_data = {"error": "Could not parse JSON", "raw": answer}
+                extracted_data = {"error": "Could not parse JSON", "raw": answer}
         except json.JSONDecodeError as e:
             extracted_data = {"error": f"JSON parse error: {e}", "raw": answer}
     else:
         extracted_data = {"error": result.error}
     
-    # Save result
-    output_file = output_dir / f"{paper_id}_run{run_num}.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(extracted_data, f, indent=2)
+    # Save result (atomically, so an interrupted run is never mistaken for a finished one)
+    save_json(output_file, extracted_data)
+    
+    icon = "✅" if result.success else "❌"
+    log(f"{icon} Run {run_num}: {paper_id} -> {output_file.name} "
+        f"({len(result.thought_action_history)} iterations)")
+    
+    return extracted_data
+
+
+async def run_extraction_async(
+    paper_id: str,
+    paper_text: str,
+    run_num: int,
+    output_dir: Path,
+    agent: PaperExtractionAgent,
+    semaphore: asyncio.Semaphore,
+    force: bool = False,
+    progress: Optional[ExtractionProgress] = None
+) -> Dict:
+    """Run one extraction in a worker thread, bounded by the shared semaphore."""
+    log = progress.log if progress else print
+    failed = True
+    try:
+        async with semaphore:
+            data = await asyncio.to_thread(
+                run_extraction, paper_id, paper_text, run_num, output_dir, agent, force, log
+            )
+        failed = False
+        return data
+    finally:
+        if progress:
+            progress.advance(paper_id, failed=failed)
+
+
+async def run_all_extractions(
+    papers: List[str],
+    num_runs: int,
+    output_dir: Path,
+    agent: PaperExtractionAgent,
+    workers: int,
+    pdf_dir: Optional[Path] = None,
+    use_api: bool = False,
+    force: bool = False
+) -> Dict[str, Dict[int, Dict]]:
+    """
+    Load every paper and run its extractions, with at most `workers` LLM
+    conversations in flight at once.
+    
+    Each paper starts its runs as soon as its own text is loaded, so PDF
+    downloads overlap with extractions of papers that are already ready.
+    
+    Returns {paper_id: {run_num: extracted data}} for every run that finished.
+    """
+    run_cache: Dict[str, Dict[int, Dict]] = {paper_id: {} for paper_id in papers}
+    llm_semaphore = asyncio.Semaphore(max(1, workers))
+    download_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
     
-    print(f"✅ Saved to {output_file}")
-    print(f"   Success: {result.success}")
-    print(f"   Iterations: {len(result.thought_action_history)}")
+    with ExtractionProgress(papers, num_runs) as progress:
+        async with _make_http_client() as http:
+            async def run_paper(paper_id: str):
+                # Every run of a paper reuses the same text
+                paper_text = await load_paper_text(
+                    paper_id, pdf_dir=pdf_dir, use_api=use_api,
+                    http=http, download_semaphore=download_semaphore
+                )
+                # Run 1 goes first on its own: the prompt prefix (system prompt + paper
+                # text) is the same for every run, so once it has been sent the
+                # provider's prompt cache serves it to runs 2..N.
+                results = await asyncio.gather(
+                    run_extraction_async(paper_id, paper_text, 1, output_dir, agent, llm_semaphore, force, progress),
+                    return_exceptions=True
+                )
+                results += await asyncio.gather(
+                    *(run_extraction_async(paper_id, paper_text, run_num, output_dir, agent, llm_semaphore, force, progress)
+                      for run_num in range(2, num_runs + 1)),
+                    return_exceptions=True
+                )
+                for run_num, outcome in enumerate(results, start=1):
+                    if isinstance(outcome, Exception):
+                        print(f"❌ Run {run_num} of {paper_id} failed: {outcome}")
+                    else:
+                        run_cache[paper_id][run_num] = outcome
+            
+            paper_results = await asyncio.gather(*(run_paper(paper_id) for paper_id in papers), return_exceptions=True)
+            for paper_id, outcome in zip(papers, paper_results):
+                if isinstance(outcome, Exception):
+                    print(f"❌ Loading {paper_id} failed: {outcome}")
+    
+    return run_cache
 
 
 def main():
@@ -372,9 +649,31 @@ def main():
     parser.add_argument('--use-api', action='store_true', help='Download papers from Semantic Scholar')
     parser.add_argument('--paper', type=str, help='Run specific paper only (e.g., garcia_sanchez_2009)')
     parser.add_argument('--runs', type=int, default=5, help='Number of runs per paper (default: 5)')
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent extraction runs (default: 8)')
+    parser.add_argument('--force', action='store_true', help='Re-run extractions whose output already exists')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Print full agent traces (best combined with --paper)')
+    parser.add_argument('--llm-cache', action='store_true',
+                        help='Serve repeated LLM requests from evaluation/.llm_cache.sqlite '
+                             '(identical runs then return identical answers)')
     args = parser.parse_args()
     
     eval_dir = Path(__file__).parent
+    
+    # Config, client and agent are built once and shared by every run.
+    # The agent keeps no state between runs (history lives inside run()).
+    load_dotenv()
+    cfg = DeepSeekConfig.from_env()
+    cache = LLMResponseCache(eval_dir / ".llm_cache.sqlite") if args.llm_cache else None
+    llm_client = OpenAIChatClient(cfg, cache=cache)
+    agent = PaperExtractionAgent(
+        llm_client=llm_client,
+        workspace_root=Path.cwd(),
+        model="deepseek-chat",
+        verbose=args.verbose,  # agent steps always go to the log file
+        log_file=eval_dir / "logs" / "table2_extraction.log"
+    )
+    
     extracted_dir = eval_dir / "extracted"
     gt_dir = eval_dir / "ground_truth"
     extracted_dir.mkdir(exist_ok=True)
@@ -389,42 +688,37 @@ def main():
     print(f"  PDF directory: {args.pdf_dir or 'Not specified'}")
     print(f"  Use Semantic Scholar API: {args.use_api}")
     print(f"  Specific paper: {args.paper or 'All papers'}")
+    print(f"  Concurrent runs: {args.workers}")
     print()
     
     # Select papers to run
-    papers_to_run = [args.paper] if args.paper else list(PAPERS.keys())
+    papers_to_run = [args.paper] if args.paper else list(_PAPER_IDS)
     
-    # Run extractions
-    for paper_id in papers_to_run:
-        if paper_id not in PAPERS:
-            print(f"❌ Unknown paper: {paper_id}")
-            continue
-            
-        print(f"\n{'#'*80}")
-        print(f"# {paper_id.upper()}")
-        print(f"{'#'*80}")
-        
-        # Load paper text (with PDF/API support)
-        paper_text = load_paper_text(paper_id, pdf_dir=args.pdf_dir, use_api=args.use_api)
-        
-        for run_num in range(1, num_runs + 1):
-            run_extraction(paper_id, paper_text, run_num, extracted_dir)
+    unknown = [paper_id for paper_id in papers_to_run if paper_id not in PAPERS]
+    for paper_id in unknown:
+        print(f"❌ Unknown paper: {paper_id}")
+    papers_to_load = [paper_id for paper_id in papers_to_run if paper_id in PAPERS]
+    
+    # Load papers and run extractions concurrently; each run is bound on LLM latency
+    print(f"\n📚 Loading {len(papers_to_load)} paper(s): {', '.join(papers_to_load)}")
+    run_cache = asyncio.run(run_all_extractions(
+        papers_to_load, num_runs, extracted_dir, agent, args.workers,
+        pdf_dir=args.pdf_dir, use_api=args.use_api, force=args.force
+    ))
     
     # Evaluate results
     print(f"\n\n{'='*80}")
     print("EVALUATION RESULTS")
     print(f"{'='*80}\n")
     
+    # Scored from the runs kept in memory; nothing is read back from disk
     summary = []
     for paper_id in papers_to_run:
-        from iou_calculator import compare_all_runs
-        
         try:
-            result = compare_all_runs(
-                extracted_dir=extracted_dir,
+            result = compare_runs_from_memory(
+                run_cache.get(paper_id, {}),
                 ground_truth_dir=gt_dir,
-                paper_id=paper_id,
-                num_runs=num_runs
+                paper_id=paper_id
             )
             summary.append(result)
             
@@ -439,8 +733,7 @@ def main():
     
     # Save summary
     summary_file = eval_dir / "table2_results.json"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2)
+    save_json(summary_file, summary)
     
     print(f"\n\n✅ Summary saved to {summary_file}")
     
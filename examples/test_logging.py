@@ -116,6 +116,7 @@ def test_logging_system():
     print(f"LLM calls: {llm_logger.call_count}")
     print(f"Total tokens: {llm_logger.total_tokens}")
     print(f"Estimated cost: ${llm_logger.total_cost:.4f}")
+    llm_logger.close()
     
     # 7. Analyze LLM calls
     if llm_logger.call_count > 0:
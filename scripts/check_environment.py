@@ -3,16 +3,26 @@
 Verify environment dependencies are correctly installed
 """
 
+import importlib
+import importlib.util
 import sys
 from pathlib import Path
 
-def check_import(module_name, package_name=None):
-    """Check if module can be imported"""
+def check_import(module_name, package_name=None, validate=False):
+    """
+    Check if module is installed.
+    
+    Only locates the module (no import) unless validate=True, which actually
+    imports it - use that for compiled extensions that can be present but broken.
+    """
     if package_name is None:
         package_name = module_name
     
     try:
-        __import__(module_name)
+        if validate:
+            importlib.import_module(module_name)
+        elif importlib.util.find_spec(module_name) is None:
+            raise ImportError(f"No module named '{module_name}'")
         print(f"✅ {package_name}")
         return True
     except ImportError as e:
@@ -44,7 +54,7 @@ def main():
     checks.append(check_import("pydantic", "pydantic"))
     
     print("\nData Analysis:")
-    checks.append(check_import("numpy", "numpy"))
+    checks.append(check_import("numpy", "numpy", validate=True))
     checks.append(check_import("pandas", "pandas"))
     checks.append(check_import("matplotlib", "matplotlib"))
     checks.append(check_import("seaborn", "seaborn"))
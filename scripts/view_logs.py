@@ -10,11 +10,24 @@ Features:
 - Export to HTML report
 """
 import argparse
-import json
+import mmap
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from string import Template
+from typing import List, Dict, Any, Optional
+
+import orjson
+
+# Optional: Hyperscan matches case-insensitively in one streaming pass
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -26,12 +39,173 @@ from gcmc_agent.logging_utils import (
 )
 
 
+# Errors listed by --llm-stats
+SHOWN_ERRORS = 5
+
+# Per-run cache of derived data, invalidated by the source file's (mtime_ns, size)
+CACHE_DIR_NAME = ".cache"
+
+
+def _fingerprint(path: Path) -> Optional[List[int]]:
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _read_cache(run_dir: Path, name: str, fingerprint: List[int]) -> Optional[Any]:
+    """Return the cached value stored under name if its fingerprint still matches."""
+    try:
+        entry = orjson.loads((run_dir / CACHE_DIR_NAME / name).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if entry.get("fingerprint") != fingerprint:
+        return None
+    return entry.get("value")
+
+
+def _write_cache(run_dir: Path, name: str, fingerprint: List[int], value: Any) -> None:
+    """Store value under name, atomically; a read-only log dir just skips caching."""
+    cache_file = run_dir / CACHE_DIR_NAME / name
+    tmp_file = cache_file.with_name(f"{name}.{os.getpid()}.tmp")
+    try:
+        if not cache_file.parent.exists():
+            # Runs are ordered by directory mtime; creating .cache must not
+            # make an old run look like the latest one
+            st = run_dir.stat()
+            cache_file.parent.mkdir()
+            os.utime(run_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+        tmp_file.write_bytes(orjson.dumps({"fingerprint": fingerprint, "value": value}))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _load_cached_stats(run_dir: Path) -> Optional[Dict[str, Any]]:
+    """LLM call statistics for a run, re-analyzed only when llm_calls.jsonl changed."""
+    llm_log = run_dir / "llm_calls.jsonl"
+    fingerprint = _fingerprint(llm_log)
+    if fingerprint is None:
+        return None
+    
+    stats = _read_cache(run_dir, "analysis.json", fingerprint)
+    if stats is None:
+        # Only the first few errors are ever displayed
+        stats = LLMCallLogger.analyze_calls(llm_log, max_errors=SHOWN_ERRORS)
+        _write_cache(run_dir, "analysis.json", fingerprint, stats)
+    if 'tokens' in stats:
+        # Thousands-separated token counts, formatted once for both the
+        # console summary and the HTML report
+        stats['tokens_text'] = {key: f"{stats['tokens'].get(key, 0):,}" for key in ('total', 'prompt', 'completion', 'cached_prompt')}
+    return stats
+
+
+def _load_cached_status(run_dir: Path) -> str:
+    """Status icon for a run, re-read only when run_metadata.json changed."""
+    metadata_file = run_dir / "run_metadata.json"
+    fingerprint = _fingerprint(metadata_file)
+    if fingerprint is None:
+        return "?"
+    
+    status = _read_cache(run_dir, "status.json", fingerprint)
+    if status is None:
+        data = orjson.loads(metadata_file.read_bytes())
+        status = "✅" if data.get('overall_success') else "❌"
+        _write_cache(run_dir, "status.json", fingerprint, status)
+    return status
+
+
+# HTML report fragments, parsed once at import
+_HTML_HEADER = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>GCMC-Agent Run Report: $run_id</title>
+""")
+
+# Static part of the page head, emitted verbatim (no template scan per report)
+_HTML_STYLE = """    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: auto; background: white; padding: 20px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }
+        h1 { color: #333; border-bottom: 3px solid #4CAF50; padding-bottom: 10px; }
+        h2 { color: #555; border-bottom: 1px solid #ddd; padding-bottom: 5px; margin-top: 30px; }
+        .stat { background: #f9f9f9; padding: 15px; margin: 10px 0; border-left: 4px solid #4CAF50; }
+        .stat-label { font-weight: bold; color: #666; }
+        .stat-value { font-size: 1.2em; color: #333; }
+        .success { color: #4CAF50; }
+        .failed { color: #f44336; }
+        .agent-card { background: #fff; border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 5px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🤖 GCMC-Agent Run Report</h1>
+"""
+
+_HTML_RUN_INFO = Template("""        <p><strong>Run ID:</strong> $run_id</p>
+        <p><strong>Start Time:</strong> $start_time</p>
+        <p><strong>End Time:</strong> $end_time</p>
+        <p><strong>Status:</strong> <span class="$status_class">
+            $status_text
+        </span></p>
+        
+        <h2>📊 LLM API Usage</h2>
+""")
+
+_HTML_LLM_STATS = Template("""
+        <div class="stat">
+            <span class="stat-label">Total API Calls:</span> 
+            <span class="stat-value">$total_calls</span>
+        </div>
+        <div class="stat">
+            <span class="stat-label">Total Tokens:</span> 
+            <span class="stat-value">$total_tokens</span>
+        </div>
+        <div class="stat">
+            <span class="stat-label">Estimated Cost:</span> 
+            <span class="stat-value">$$$total_cost</span>
+        </div>
+        <div class="stat">
+            <span class="stat-label">Total Duration:</span> 
+            <span class="stat-value">${total_seconds}s</span>
+        </div>
+""")
+
+_HTML_AGENTS_HEADING = """
+        <h2>👥 Agents</h2>
+"""
+
+_HTML_AGENT_CARD = Template("""
+        <div class="agent-card">
+            <h3>$status_icon $agent_name</h3>
+            <p><strong>Task:</strong> $task</p>
+            <p><strong>Iterations:</strong> $iterations</p>
+            <p><strong>Status:</strong> <span class="$status_class">$status</span></p>
+${error_html}
+        </div>
+""")
+
+_HTML_AGENT_ERROR = Template("""<p><strong>Error:</strong> <span class="failed">$error</span></p>""")
+
+_HTML_FOOTER = """
+    </div>
+</body>
+</html>
+"""
+
+
 def list_runs(base_dir: Path = Path("logs")) -> List[Path]:
     """List all run directories."""
     if not base_dir.exists():
         return []
-    return sorted([d for d in base_dir.iterdir() if d.is_dir()], 
-                   key=lambda x: x.stat().st_mtime, reverse=True)
+    # DirEntry.is_dir() comes from the directory read and stat() is cached,
+    # so this costs one directory scan instead of two stat() calls per run
+    with os.scandir(base_dir) as it:
+        entries = [(e.stat().st_mtime_ns, e.path) for e in it if e.is_dir()]
+    entries.sort(reverse=True)
+    return [Path(p) for _, p in entries]
 
 
 def show_summary(run_dir: Path):
@@ -44,14 +218,12 @@ def show_summary(run_dir: Path):
 
 def show_llm_stats(run_dir: Path):
     """Show LLM API usage statistics."""
-    llm_log = run_dir / "llm_calls.jsonl"
+    stats = _load_cached_stats(run_dir)
     
-    if not llm_log.exists():
+    if stats is None:
         print("\n⚠️  No LLM call logs found")
         return
-    
-    stats = LLMCallLogger.analyze_calls(llm_log)
-    
+
     print("\n" + "=" * 80)
     print("LLM API USAGE STATISTICS")
     print("=" * 80)
@@ -62,9 +234,11 @@ def show_llm_stats(run_dir: Path):
     print(f"   Failed:           {stats['failed_calls']}")
     
     print(f"\n💰 Token Usage:")
-    print(f"   Total tokens:     {stats['tokens']['total']:,}")
-    print(f"   Prompt tokens:    {stats['tokens']['prompt']:,}")
-    print(f"   Completion tokens:{stats['tokens']['completion']:,}")
+    tokens_text = stats['tokens_text']
+    print(f"   Total tokens:     {tokens_text['total']}")
+    print(f"   Prompt tokens:    {tokens_text['prompt']}")
+    print(f"   Completion tokens:{tokens_text['completion']}")
+    print(f"   Cached prompt:    {tokens_text['cached_prompt']}")
     print(f"   Avg per call:     {stats['tokens']['avg_per_call']:.1f}")
     
     print(f"\n💵 Estimated Cost:")
@@ -75,12 +249,25 @@ def show_llm_stats(run_dir: Path):
     print(f"   Total duration:   {stats['timing']['total_seconds']:.2f}s")
     print(f"   Avg per call:     {stats['timing']['avg_seconds']:.3f}s")
     
+    cache = stats.get('cache') or {}
+    if cache.get('hits') or cache.get('misses'):
+        print(f"\n🗄️  Response Cache:")
+        print(f"   Hits:             {cache['hits']}")
+        print(f"   Misses:           {cache['misses']}")
+    
     if stats.get('errors'):
         print(f"\n❌ Errors:")
-        for err in stats['errors'][:5]:  # Show first 5
+        for err in stats['errors'][:SHOWN_ERRORS]:
             print(f"   Call #{err['call']}: {err['error'][:60]}")
 
 
+def _truncate(text: str, limit: int) -> str:
+    """First limit characters of text, with an ellipsis line if anything was cut."""
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}\n   ..."
+
+
 def replay_conversation(run_dir: Path, agent_name: str = None):
     """Replay agent conversation from LLM logs."""
     llm_log = run_dir / "llm_calls.jsonl"
@@ -118,51 +305,163 @@ def replay_conversation(run_dir: Path, agent_name: str = None):
         
         # Show last user message (the task/observation)
         messages = call['request']['messages']
-        if messages:
-            last_user_msg = [m for m in messages if m['role'] == 'user']
-            if last_user_msg:
-                print(f"\n👤 USER:")
-                print(f"{last_user_msg[-1]['content'][:300]}")
-                if len(last_user_msg[-1]['content']) > 300:
-                    print("   ...")
+        last_user_msg = next((m for m in reversed(messages) if m['role'] == 'user'), None)
+        if last_user_msg:
+            content = last_user_msg['content']
+            print(f"\n👤 USER:")
+            print(_truncate(content, 300))
         
         # Show assistant response
         if call.get('response') and call['response'].get('content'):
             print(f"\n🤖 ASSISTANT:")
-            content = call['response']['content']
-            print(f"{content[:500]}")
-            if len(content) > 500:
-                print("   ...")
+            print(_truncate(call['response']['content'], 500))
         
         if call.get('error'):
             print(f"\n❌ ERROR: {call['error']}")
 
 
+def _count_newlines(buf, start: int, end: int, newline) -> int:
+    """Count newlines in buf[start:end], slicing at most 1 MiB at a time (mmap has no count())."""
+    step = 1 << 20
+    return sum(buf[i:min(i + step, end)].count(newline) for i in range(start, end, step))
+
+
+def _find_matching_lines(buf, pattern) -> List[tuple]:
+    """
+    Return (line_number, start, end) for every line of buf matching pattern.
+    
+    buf is bytes, str or an mmap; pattern a compiled regex of the same kind.
+    The buffer is scanned by the regex engine; line boundaries and numbers
+    are only worked out around hits, so non-matching lines cost nothing.
+    """
+    newline = b"\n" if isinstance(pattern.pattern, bytes) else "\n"
+    matches = []
+    line_num = 1
+    counted_to = 0
+    hit = pattern.search(buf)
+    while hit:
+        pos = hit.start()
+        start = buf.rfind(newline, 0, pos) + 1
+        end = buf.find(newline, pos)
+        if end == -1:
+            end = len(buf)
+        line_num += _count_newlines(buf, counted_to, start, newline)
+        counted_to = start
+        matches.append((line_num, start, end))
+        # One match per line: resume after this line
+        hit = pattern.search(buf, end)
+    return matches
+
+
+def _hyperscan_database(query: str):
+    """Compile a caseless literal Hyperscan database reporting match starts."""
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(query).encode('ascii')],
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST],
+    )
+    return db
+
+
+def _hyperscan_matching_lines(db, buf) -> List[tuple]:
+    """Like _find_matching_lines, with hit offsets found by a Hyperscan scan."""
+    starts = []
+    
+    def on_match(expr_id, start, end, flags, context):
+        starts.append(start)
+    
+    db.scan(buf, match_event_handler=on_match)
+    
+    matches = []
+    line_num = 1
+    counted_to = 0
+    line_end = -1
+    for pos in sorted(starts):
+        if pos < line_end:
+            continue  # one match per line
+        start = buf.rfind(b"\n", 0, pos) + 1
+        line_end = buf.find(b"\n", pos)
+        if line_end == -1:
+            line_end = len(buf)
+        line_num += _count_newlines(buf, counted_to, start, b"\n")
+        counted_to = start
+        matches.append((line_num, start, line_end))
+    return matches
+
+
+def _search_one(log_file: Path, query: str) -> tuple:
+    """
+    Search one log file; returns (match count, first 5 (line_number, line)).
+    
+    ASCII queries are matched directly on the memory-mapped bytes (no copy
+    of the file); others need the decoded text for Unicode case folding.
+    """
+    ascii_query = query.isascii()
+    needle = query.encode('ascii') if ascii_query else query
+    pattern = re.compile(re.escape(needle), re.IGNORECASE)
+    
+    if not ascii_query:
+        text = log_file.read_text(encoding='utf-8', errors='replace')
+        spans = _find_matching_lines(text, pattern)
+        return len(spans), [(line_num, text[start:end]) for line_num, start, end in spans[:5]]
+    
+    with open(log_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0, []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if HYPERSCAN_AVAILABLE:
+                # Hyperscan scratch space is not shareable between threads,
+                # so each file gets its own (cheap) single-literal database
+                spans = _hyperscan_matching_lines(_hyperscan_database(query), mm)
+            else:
+                spans = _find_matching_lines(mm, pattern)
+            return len(spans), [
+                (line_num, mm[start:end].decode('utf-8', errors='replace'))
+                for line_num, start, end in spans[:5]
+            ]
+
+
 def search_logs(run_dir: Path, query: str):
-    """Search for text in log files."""
+    """Search for text in log files (case-insensitive)."""
     print(f"\n🔍 Searching for: '{query}'")
     print("=" * 80)
     
+    # Files are searched in parallel (mmap I/O and the C-level scans release
+    # the GIL); results are printed afterwards in file order
+    log_files = list(run_dir.glob("*.log"))
+    workers = max(1, min(8, os.cpu_count() or 1, len(log_files)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_search_one, log_files, [query] * len(log_files)))
+    
     found_count = 0
-    for log_file in run_dir.glob("*.log"):
-        matches = []
-        lines = log_file.read_text(encoding='utf-8').splitlines()
-        
-        for line_num, line in enumerate(lines, 1):
-            if query.lower() in line.lower():
-                matches.append((line_num, line))
-        
+    for log_file, (count, matches) in zip(log_files, results):
         if matches:
             print(f"\n📄 {log_file.name}:")
-            for line_num, line in matches[:5]:  # Show first 5 matches
+            for line_num, line in matches:  # Show first 5 matches
                 print(f"   Line {line_num}: {line.strip()[:80]}")
-            if len(matches) > 5:
-                print(f"   ... and {len(matches) - 5} more matches")
-            found_count += len(matches)
+            if count > 5:
+                print(f"   ... and {count - 5} more matches")
+            found_count += count
     
     print(f"\n✓ Found {found_count} matches")
 
 
+def _agent_card_fields(agent_name: str, info: Dict[str, Any]) -> Dict[str, Any]:
+    """Flat substitution dict for one _HTML_AGENT_CARD."""
+    status = info.get('status', 'N/A')
+    ok = status == 'success'
+    error = info.get('error')
+    return {
+        'status_icon': '✅' if ok else '❌',
+        'agent_name': agent_name,
+        'task': info.get('task', 'N/A'),
+        'iterations': info.get('iterations', 'N/A'),
+        'status_class': 'success' if ok else 'failed',
+        'status': status.upper(),
+        'error_html': _HTML_AGENT_ERROR.substitute(error=error) if error else '',
+    }
+
+
 def export_html_report(run_dir: Path, output_file: Path):
     """Export run to HTML report."""
     print(f"\n📝 Generating HTML report: {output_file}")
@@ -171,92 +470,36 @@ def export_html_report(run_dir: Path, output_file: Path):
     metadata_file = run_dir / "run_metadata.json"
     metadata = {}
     if metadata_file.exists():
-        with open(metadata_file) as f:
-            metadata = json.load(f)
+        metadata = orjson.loads(metadata_file.read_bytes())
     
     # Read LLM stats
-    llm_stats = {}
-    llm_log = run_dir / "llm_calls.jsonl"
-    if llm_log.exists():
-        llm_stats = LLMCallLogger.analyze_calls(llm_log)
-    
+    llm_stats = _load_cached_stats(run_dir) or {}
+
     # Generate HTML
-    html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>GCMC-Agent Run Report: {run_dir.name}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: auto; background: white; padding: 20px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }}
-        h1 {{ color: #333; border-bottom: 3px solid #4CAF50; padding-bottom: 10px; }}
-        h2 {{ color: #555; border-bottom: 1px solid #ddd; padding-bottom: 5px; margin-top: 30px; }}
-        .stat {{ background: #f9f9f9; padding: 15px; margin: 10px 0; border-left: 4px solid #4CAF50; }}
-        .stat-label {{ font-weight: bold; color: #666; }}
-        .stat-value {{ font-size: 1.2em; color: #333; }}
-        .success {{ color: #4CAF50; }}
-        .failed {{ color: #f44336; }}
-        .agent-card {{ background: #fff; border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 5px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🤖 GCMC-Agent Run Report</h1>
-        <p><strong>Run ID:</strong> {run_dir.name}</p>
-        <p><strong>Start Time:</strong> {metadata.get('start_time', 'N/A')}</p>
-        <p><strong>End Time:</strong> {metadata.get('end_time', 'N/A')}</p>
-        <p><strong>Status:</strong> <span class="{'success' if metadata.get('overall_success') else 'failed'}">
-            {'✅ SUCCESS' if metadata.get('overall_success') else '❌ FAILED'}
-        </span></p>
-        
-        <h2>📊 LLM API Usage</h2>
-"""
+    success = metadata.get('overall_success')
+    parts = [_HTML_HEADER.substitute(run_id=run_dir.name), _HTML_STYLE, _HTML_RUN_INFO.substitute(
+        run_id=run_dir.name,
+        start_time=metadata.get('start_time', 'N/A'),
+        end_time=metadata.get('end_time', 'N/A'),
+        status_class='success' if success else 'failed',
+        status_text='✅ SUCCESS' if success else '❌ FAILED',
+    )]
     
     if llm_stats:
-        html += f"""
-        <div class="stat">
-            <span class="stat-label">Total API Calls:</span> 
-            <span class="stat-value">{llm_stats.get('total_calls', 0)}</span>
-        </div>
-        <div class="stat">
-            <span class="stat-label">Total Tokens:</span> 
-            <span class="stat-value">{llm_stats.get('tokens', {}).get('total', 0):,}</span>
-        </div>
-        <div class="stat">
-            <span class="stat-label">Estimated Cost:</span> 
-            <span class="stat-value">${llm_stats.get('cost', {}).get('total_usd', 0):.4f}</span>
-        </div>
-        <div class="stat">
-            <span class="stat-label">Total Duration:</span> 
-            <span class="stat-value">{llm_stats.get('timing', {}).get('total_seconds', 0):.2f}s</span>
-        </div>
-"""
-    
-    html += """
-        <h2>👥 Agents</h2>
-"""
-    
-    for agent_name, info in metadata.get('agents', {}).items():
-        status_class = 'success' if info.get('status') == 'success' else 'failed'
-        status_icon = '✅' if info.get('status') == 'success' else '❌'
-        html += f"""
-        <div class="agent-card">
-            <h3>{status_icon} {agent_name}</h3>
-            <p><strong>Task:</strong> {info.get('task', 'N/A')}</p>
-            <p><strong>Iterations:</strong> {info.get('iterations', 'N/A')}</p>
-            <p><strong>Status:</strong> <span class="{status_class}">{info.get('status', 'N/A').upper()}</span></p>
-"""
-        if info.get('error'):
-            html += f"""<p><strong>Error:</strong> <span class="failed">{info['error']}</span></p>"""
-        html += """
-        </div>
-"""
+        parts.append(_HTML_LLM_STATS.substitute(
+            total_calls=llm_stats.get('total_calls', 0),
+            total_tokens=llm_stats.get('tokens_text', {}).get('total', '0'),
+            total_cost=f"{llm_stats.get('cost', {}).get('total_usd', 0):.4f}",
+            total_seconds=f"{llm_stats.get('timing', {}).get('total_seconds', 0):.2f}",
+        ))
     
-    html += """
-    </div>
-</body>
-</html>
-"""
+    parts.append(_HTML_AGENTS_HEADING)
+    parts.append("".join(
+        _HTML_AGENT_CARD.substitute(_agent_card_fields(agent_name, info))
+        for agent_name, info in metadata.get('agents', {}).items()
+    ))
+    parts.append(_HTML_FOOTER)
+    html = "".join(parts)
     
     output_file.parent.mkdir(parents=True, exist_ok=True)
     output_file.write_text(html, encoding='utf-8')
@@ -317,13 +560,10 @@ Examples:
         print("\n" + "=" * 80)
         print("AVAILABLE RUNS")
         print("=" * 80)
-        for i, run in enumerate(runs, 1):
-            metadata_file = run / "run_metadata.json"
-            status = "?"
-            if metadata_file.exists():
-                with open(metadata_file) as f:
-                    data = json.load(f)
-                    status = "✅" if data.get('overall_success') else "❌"
+        # Status lookups are small stat/read calls; overlap them across runs
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            statuses = list(executor.map(_load_cached_status, runs))
+        for i, (run, status) in enumerate(zip(runs, statuses), 1):
             print(f"{i}. {status} {run.name}")
         return
     
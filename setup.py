@@ -13,12 +13,14 @@ setup(
     python_requires=">=3.10",
     install_requires=[
         "openai>=1.52.0",
+        "httpx>=0.24.0",
         "langchain>=0.3.0",
         "langchain-openai>=0.2.0",
         # "langgraph>=0.2.30",  # Optional - not used in ReAct implementation
         "python-dotenv>=1.0.1",
         "pymatgen>=2024.9.16",
         "requests>=2.31.0",
+        "orjson>=3.9.0",
         "pydantic>=2.0.0",
         "numpy>=1.24.0",
         "pandas>=2.0.0",
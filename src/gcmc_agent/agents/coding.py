@@ -75,6 +75,7 @@ class CodingExpert:
             max_iterations=15,
             verbose=verbose,
             log_file=log_file,
+            stream=True,
         )
     
     def run(
@@ -79,6 +79,8 @@ class Evaluator:
             max_iterations=20,
             verbose=verbose,
             log_file=log_file,
+            stream=True,
+            max_tokens=256,  # doubled automatically if a reply is cut off
         )
     
     def run(
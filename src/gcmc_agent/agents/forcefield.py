@@ -69,6 +69,7 @@ class ForceFieldExpert:
             max_iterations=15,
             verbose=verbose,
             log_file=log_file,
+            stream=True,
         )
     
     def run(
@@ -3,6 +3,7 @@ Simulation Input Expert Agent - creates simulation.input files.
 """
 
 from pathlib import Path
+from string import Template
 
 from ..react import ReActAgent, AgentResult
 from ..client import OpenAIChatClient
@@ -50,6 +51,34 @@ You must complete your task and provide a Final Answer with:
 """
 
 
+_TASK_TEMPLATE = Template("""Create a simulation.input file for RASPA.
+
+Simulation type: $simulation_type
+Structure: $structure_name
+Adsorbate: $adsorbate
+Temperature: $temperature K
+Pressures: $pressures Pa
+Template folder: $template_folder
+
+Steps:
+1. Look for example simulation.input files in $examples_dir
+2. Read an appropriate example as a template (use read_file)
+3. Modify the template for this specific simulation:
+   - Set SimulationType: MonteCarlo
+   - Set NumberOfCycles: 50000 (production), NumberOfInitializationCycles: 10000
+   - Set ExternalTemperature: $temperature
+   - Set Framework: $structure_name.cif
+   - Set Component: $adsorbate
+   - Set appropriate MC moves (Translation, Rotation, WidomInsertion for GCMC)
+   - Set Cutoff: 12.0 (Angstrom)
+   - Set UnitCells: auto-calculate based on structure size
+4. Write the file to: $output_file
+
+For $simulation_type, ensure correct keywords.
+If isotherm: this is a template, pressure will be set per-run.
+""")
+
+
 class SimulationInputExpert:
     """
     Simulation Input Expert - creates RASPA simulation.input files.
@@ -82,6 +111,8 @@ class SimulationInputExpert:
             max_iterations=15,
             verbose=verbose,
             log_file=log_file,
+            stream=True,
+            max_tokens=768,  # doubled automatically if a reply is cut off
         )
     
     def run(
@@ -109,31 +140,16 @@ class SimulationInputExpert:
         temperature = params.get("temperature", 298)
         pressures = params.get("pressures", [1e4, 1e5, 1e6])  # Pa
         
-        task = f"""Create a simulation.input file for RASPA.
-
-Simulation type: {simulation_type}
-Structure: {structure_name}
-Adsorbate: {adsorbate}
-Temperature: {temperature} K
-Pressures: {pressures} Pa
-Template folder: {template_folder}
-
-Steps:
-1. Look for example simulation.input files in {self.workspace_root / "templates" / "raspa"}
-2. Read an appropriate example as a template (use read_file)
-3. Modify the template for this specific simulation:
-   - Set SimulationType: MonteCarlo
-   - Set NumberOfCycles: 50000 (production), NumberOfInitializationCycles: 10000
-   - Set ExternalTemperature: {temperature}
-   - Set Framework: {structure_name}.cif
-   - Set Component: {adsorbate}
-   - Set appropriate MC moves (Translation, Rotation, WidomInsertion for GCMC)
-   - Set Cutoff: 12.0 (Angstrom)
-   - Set UnitCells: auto-calculate based on structure size
-4. Write the file to: {template_folder / "simulation.input"}
-
-For {simulation_type}, ensure correct keywords.
-If isotherm: this is a template, pressure will be set per-run.
-"""
+        task = _TASK_TEMPLATE.substitute(
+            simulation_type=simulation_type,
+            structure_name=structure_name,
+            adsorbate=adsorbate,
+            # Canonical numbers, so 298 and 298.0 give the same prompt
+            temperature=float(temperature),
+            pressures=[float(p) for p in pressures],
+            template_folder=template_folder,
+            output_file=template_folder / "simulation.input",
+            examples_dir=self.workspace_root / "templates" / "raspa",
+        )
         
         return self.agent.run(task)
@@ -4,11 +4,18 @@ Structure Expert Agent - finds and copies CIF structure files.
 This is the first real ReAct agent implementation following the paper's design.
 """
 
+import re
 from pathlib import Path
+from string import Template
+from typing import List, Optional
 
 from ..react import ReActAgent, AgentResult
 from ..client import OpenAIChatClient
 from ..tools.registry import create_tool_registry
+from ..tools import files
+
+# Unit cell lengths, e.g. "_cell_length_a   18.256(3)"
+_CELL_LENGTH_RE = re.compile(r"^_cell_length_([abc])\s+([0-9.]+)", re.MULTILINE)
 
 
 # System prompt based on Table S1 from the paper
@@ -34,12 +41,6 @@ Guidelines:
 - Report any issues with missing or invalid structures
 - Provide clear information about what was found and copied
 
-Available tools:
-- find_cif_files: Search for CIF files in directories
-- download_cif_from_iza: Download zeolite structures from IZA database (3-letter codes)
-- copy_file: Copy structure to destination
-- read_file: Verify structure content
-
 You must complete your task and provide a Final Answer with:
 - Path to the copied structure file
 - Atom types present
@@ -48,6 +49,54 @@ You must complete your task and provide a Final Answer with:
 """
 
 
+_TASK_TEMPLATE = Template("""Find the CIF structure file for '$structure_name' and copy it to the simulation template folder.
+
+Search locations: $search_paths
+Destination folder: $template_folder
+
+Workflow:
+1. Search for CIF files in the provided directories using find_cif_files
+2. Look for files matching '$structure_name' (may have .cif extension or similar naming)
+
+3. If NOT found locally:
+   - Extract the 3-letter structure code from '$structure_name' (e.g., 'MOR' from 'MOR_33')
+   - Use download_cif_from_iza to download from IZA zeolite database
+   - Save to the first search directory: $download_dir
+   
+4. Once you have the file (either found or downloaded):
+   - Read the structure using read_file to get atom types and unit cell dimensions
+   - Copy the file to: $template_folder/$structure_name.cif
+   
+5. Provide Final Answer with:
+   - Success/failure status
+   - Path to the copied file
+   - Structure details (atom types, unit cell)
+   - Whether it was found locally or downloaded
+
+If the structure cannot be found or downloaded, report that clearly.
+""")
+
+
+def _find_exact_cif(structure_name: str, search_paths: List[Path]) -> List[Path]:
+    """CIF files under search_paths whose name is exactly structure_name (case-insensitive)."""
+    target = f"{structure_name}.cif".lower()
+    matches = []
+    for search_dir in search_paths:
+        if search_dir.is_dir():
+            matches.extend(p for p in search_dir.rglob("*.cif") if p.name.lower() == target)
+    return matches
+
+
+def _read_cell_lengths(cif_path: Path) -> Optional[str]:
+    """'a x b x c' from the CIF header, or None if it is not in the first 200 lines."""
+    with open(cif_path, encoding="utf-8", errors="replace") as f:
+        head = "".join(line for _, line in zip(range(200), f))
+    lengths = dict(_CELL_LENGTH_RE.findall(head))
+    if len(lengths) != 3:
+        return None
+    return f"{lengths['a']} x {lengths['b']} x {lengths['c']} Å"
+
+
 class StructureExpert:
     """
     Structure Expert Agent - handles finding and preparing structure files.
@@ -82,13 +131,16 @@ class StructureExpert:
             max_iterations=15,  # Increased from 10 to allow file copy
             verbose=verbose,
             log_file=log_file,
+            stream=True,
+            max_tokens=512,  # doubled automatically if a reply is cut off
         )
     
     def run(
         self,
         structure_name: str,
         template_folder: Path,
-        cif_search_paths: list[Path] = None
+        cif_search_paths: list[Path] = None,
+        allow_shortcut: bool = True
     ) -> AgentResult:
         """
         Find and copy a structure file to the template folder.
@@ -97,6 +149,8 @@ class StructureExpert:
             structure_name: Name of the structure to find (e.g., "MOR_33")
             template_folder: Destination folder for the structure file
             cif_search_paths: Optional list of directories to search
+            allow_shortcut: Copy directly, without the LLM, when exactly one
+                local file is named exactly after the structure
             
         Returns:
             AgentResult with success status and details
@@ -108,34 +162,34 @@ class StructureExpert:
                 self.workspace_root / "structures",
             ]
         
-        # Build task description
-        search_paths_str = ", ".join([str(p) for p in cif_search_paths])
+        # Common case: the structure is already on disk under its own name.
+        # Finding and copying it needs no reasoning, so skip the ReAct loop;
+        # variants (MOR vs MOR_33) and IZA downloads still go to the agent
+        if allow_shortcut:
+            matches = _find_exact_cif(structure_name, cif_search_paths)
+            if len(matches) == 1:
+                return self._copy_local(matches[0], structure_name, Path(template_folder))
         
-        task = f"""Find the CIF structure file for '{structure_name}' and copy it to the simulation template folder.
-
-Search locations: {search_paths_str}
-Destination folder: {template_folder}
-
-Workflow:
-1. Search for CIF files in the provided directories using find_cif_files
-2. Look for files matching '{structure_name}' (may have .cif extension or similar naming)
-
-3. If NOT found locally:
-   - Extract the 3-letter structure code from '{structure_name}' (e.g., 'MOR' from 'MOR_33')
-   - Use download_cif_from_iza to download from IZA zeolite database
-   - Save to the first search directory: {cif_search_paths[0]}
-   
-4. Once you have the file (either found or downloaded):
-   - Read the structure using read_file to get atom types and unit cell dimensions
-   - Copy the file to: {template_folder}/{structure_name}.cif
-   
-5. Provide Final Answer with:
-   - Success/failure status
-   - Path to the copied file
-   - Structure details (atom types, unit cell)
-   - Whether it was found locally or downloaded
-
-If the structure cannot be found or downloaded, report that clearly.
-"""
+        task = _TASK_TEMPLATE.substitute(
+            structure_name=structure_name,
+            search_paths=", ".join(str(p) for p in cif_search_paths),
+            template_folder=template_folder,
+            download_dir=cif_search_paths[0],
+        )
         
         return self.agent.run(task)
+    
+    def _copy_local(self, source: Path, structure_name: str, template_folder: Path) -> AgentResult:
+        """Copy a found CIF file into the template folder without calling the LLM."""
+        destination = template_folder / f"{structure_name}.cif"
+        try:
+            files.copy_file(source, destination)
+            cell = _read_cell_lengths(destination)
+        except OSError as e:
+            return AgentResult(success=False, answer="", thought_action_history=[], error=str(e))
+        
+        answer = (
+            f"Copied {source} to {destination} (found locally).\n"
+            f"Unit cell: {cell or 'not found in CIF header'}"
+        )
+        return AgentResult(success=True, answer=answer, thought_action_history=[])
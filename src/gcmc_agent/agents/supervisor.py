@@ -2,8 +2,14 @@
 Supervisor Agent - coordinates the experiment setup team.
 """
 
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional
+from string import Template
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 
 from ..react import ReActAgent, AgentResult
 from ..client import OpenAIChatClient
@@ -54,6 +60,9 @@ Guidelines:
 - Always run Evaluator after major steps
 - If Evaluator reports FAIL, retry the failed agent
 - Maximum 2 retries per agent
+- When steps do not depend on each other (StructureExpert and
+  SimulationInputExpert only need the structure name), run them together
+  with delegate_parallel instead of one after the other
 - Provide clear final summary
 
 You must provide a Final Answer with:
@@ -65,6 +74,70 @@ You must provide a Final Answer with:
 """
 
 
+_TASK_TEMPLATE = Template("""Process this user request and set up a molecular simulation.
+
+USER REQUEST:
+$user_request
+
+Your workflow:
+1. Parse the request to extract:
+   - Structure name (e.g., "MOR", "MFI", "LTA", etc.)
+   - Adsorbate molecule (e.g., "CO2", "CH4", etc.)
+   - Simulation type (e.g., "isotherm", "HOA", "single-point")
+   - Conditions (temperature, pressures, etc.)
+
+2. Create a workspace folder: $runs_dir/[structure]_[adsorbate]_[type]
+
+3. Delegate to agents in sequence:
+   - Use delegate_structure_expert to find and copy structure file and
+     delegate_siminput_expert to create simulation.input template; they are
+     independent, so run both in one delegate_parallel call
+   - Use delegate_forcefield_expert to prepare force field files
+   - Use delegate_evaluator to validate the setup
+   - Use delegate_coding_expert to generate batch run scripts for multiple pressures
+   - Use delegate_evaluator for final check
+
+4. Each delegation will return SUCCESS/FAILED/PASS/FAIL with details.
+   If a step fails, you can retry or report the failure.
+
+5. Provide Final Answer with:
+   - Status: SUCCESS or FAILURE
+   - Location of simulation files
+   - Summary of what was created
+   - Any issues or warnings
+   - Next steps (how to run the simulation)
+
+Remember: All agents will execute real actions. Check their results carefully.
+""")
+
+# Task for later requests in a session: the workflow above is already in the
+# conversation, so only the new request is sent
+_FOLLOW_UP_TEMPLATE = Template("""Process this next user request with the same workflow as before.
+
+USER REQUEST:
+$user_request
+""")
+
+# Completed requests a session keeps: the first (it carries the workflow)
+# and the most recent ones
+SESSION_MAX_EXCHANGES = 4
+
+
+def _folder_fingerprint(folder: Path) -> str:
+    """Hash of (relative path, mtime, size) for every file under folder."""
+    entries = []
+    for dirpath, _, filenames in os.walk(folder):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append(f"{os.path.relpath(path, folder)}\0{st.st_mtime_ns}\0{st.st_size}")
+    entries.sort()
+    return hashlib.blake2b("\n".join(entries).encode("utf-8"), digest_size=16).hexdigest()
+
+
 class Supervisor:
     """
     Supervisor - coordinates multi-agent simulation setup.
@@ -101,46 +174,23 @@ class Supervisor:
             {"workspace": str(workspace_root), "model": model}
         )
         
-        # Initialize the actual agents
-        self.structure_expert = StructureExpert(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model=model,
-            verbose=verbose,
-        )
-        
-        self.forcefield_expert = ForceFieldExpert(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model=model,
-            verbose=verbose,
-        )
-        
-        self.siminput_expert = SimulationInputExpert(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model=model,
-            verbose=verbose,
-        )
-        
-        self.coding_expert = CodingExpert(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model=model,
-            verbose=verbose,
-        )
-        
-        self.evaluator = Evaluator(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model=model,
-            verbose=verbose,
-        )
-        
+        # The expert agents are built on first delegation (see the cached
+        # properties below), so requests that never need one skip its setup
+
         # Create a special tool registry for supervisor
         # Supervisor doesn't use all tools, just delegation and file inspection
         self.tools = create_tool_registry(workspace_root)
         
+        # Evaluator verdicts by (folder fingerprint, check type): re-checking an
+        # unchanged folder during retries reuses the earlier verdict
+        self._evaluator_results: Dict[Tuple[str, str], str] = {}
+        
+        # Set by run() when custom force fields are still being written (see there)
+        self._wait_for_force_fields: Optional[Callable[[], Optional[Path]]] = None
+        
+        # Conversations continued across run() calls, by session id
+        self._sessions: Dict[str, List[Dict[str, str]]] = {}
+        
         # Add delegation tools (these would be placeholders that describe how to call agents)
         self._add_delegation_tools()
         
@@ -151,10 +201,39 @@ class Supervisor:
             tools=self.tools.to_dict(),
             model=model,
             max_iterations=30,  # Supervisor may need more iterations
+            max_tokens=1024,  # doubled automatically if a reply is cut off
             verbose=verbose,
             log_file=log_file,
         )
     
+    def _expert_kwargs(self) -> Dict[str, Any]:
+        return {
+            "llm_client": self.llm_client,
+            "workspace_root": self.workspace_root,
+            "model": self.model,
+            "verbose": self.verbose,
+        }
+    
+    @cached_property
+    def structure_expert(self) -> StructureExpert:
+        return StructureExpert(**self._expert_kwargs())
+    
+    @cached_property
+    def forcefield_expert(self) -> ForceFieldExpert:
+        return ForceFieldExpert(**self._expert_kwargs())
+    
+    @cached_property
+    def siminput_expert(self) -> SimulationInputExpert:
+        return SimulationInputExpert(**self._expert_kwargs())
+    
+    @cached_property
+    def coding_expert(self) -> CodingExpert:
+        return CodingExpert(**self._expert_kwargs())
+    
+    @cached_property
+    def evaluator(self) -> Evaluator:
+        return Evaluator(**self._expert_kwargs())
+    
     def _add_delegation_tools(self):
         """Add tools for delegating to other agents."""
         
@@ -182,6 +261,11 @@ class Supervisor:
         def delegate_to_forcefield_expert(structure_file: str, adsorbate: str, template_folder: str, custom_force_field_dir: str = None) -> str:
             """Delegate force field setup to ForceFieldExpert."""
             try:
+                if self._wait_for_force_fields is not None:
+                    # Use the custom files once they are written, or the
+                    # built-in force fields if writing them failed
+                    ready_dir = self._wait_for_force_fields()
+                    custom_force_field_dir = str(ready_dir) if ready_dir else None
                 self.run_logger.record_agent_start("ForceFieldExpert", f"Setup FF for {adsorbate}")
                 result = self.forcefield_expert.run(
                     structure_file=Path(structure_file),
@@ -229,8 +313,14 @@ class Supervisor:
         def delegate_to_coding_expert(template_folder: str, output_folder: str, pressures: str) -> str:
             """Delegate code generation to CodingExpert."""
             try:
-                # Parse pressures from string like "10, 30, 100, 300, 1000"
-                pressure_list = [float(p.strip()) for p in pressures.split(',')]
+                # Parse pressures from string like "10, 30, 100, 300, 1000";
+                # repeated values would only create duplicate run folders
+                pressure_list = list(dict.fromkeys(float(p.strip()) for p in pressures.split(',')))
+                
+                # One call covers every pressure: CodingExpert writes a single
+                # generate_runs.py that loops over them, so splitting the list
+                # across parallel calls would multiply LLM calls and have them
+                # overwrite each other's script
                 
                 self.run_logger.record_agent_start("CodingExpert", f"Generate scripts for {len(pressure_list)} pressures")
                 result = self.coding_expert.run(
@@ -255,6 +345,12 @@ class Supervisor:
             """Delegate validation to Evaluator."""
             try:
                 self.run_logger.record_agent_start("Evaluator", f"Check {check_type}")
+                cache_key = (_folder_fingerprint(Path(template_folder)), check_type)
+                cached = self._evaluator_results.get(cache_key)
+                if cached is not None:
+                    self.run_logger.record_agent_finish("Evaluator", success=cached.startswith("PASS"), iterations=0)
+                    return f"{cached} (unchanged since last check)"
+                
                 result = self.evaluator.run(
                     template_folder=Path(template_folder),
                     agent_name="Supervisor",
@@ -265,14 +361,56 @@ class Supervisor:
                     success=result.success,
                     iterations=getattr(result, 'iterations', 0)
                 )
-                if result.success:
-                    return f"PASS: {result.answer}"
-                else:
+                if not result.success:
+                    # The Evaluator run itself broke (LLM error, iteration
+                    # limit); not a verdict on the files, so not cached
                     return f"FAIL: {result.error or result.answer}"
+                verdict = f"PASS: {result.answer}"
+                self._evaluator_results[cache_key] = verdict
+                return verdict
             except Exception as e:
                 self.run_logger.record_agent_finish("Evaluator", success=False, iterations=0, error=str(e))
                 return f"ERROR: {str(e)}"
         
+        # Delegations that may run side by side: both only need the structure
+        # name. ForceFieldExpert needs the CIF StructureExpert writes, and
+        # CodingExpert and the Evaluator need the finished template
+        parallel_delegations = {
+            "delegate_structure_expert": delegate_to_structure_expert,
+            "delegate_siminput_expert": delegate_to_siminput_expert,
+        }
+        
+        def delegate_parallel(tasks: Union[str, List[Dict[str, Any]]]) -> str:
+            """Run independent delegations concurrently, one thread per agent."""
+            try:
+                if isinstance(tasks, str):
+                    tasks = json.loads(tasks)
+                calls = [(t["agent"], t.get("kwargs", {})) for t in tasks]
+            except (ValueError, TypeError, KeyError) as e:
+                return f"ERROR: tasks must be a list of {{\"agent\", \"kwargs\"}} objects ({e})"
+            
+            names = [name for name, _ in calls]
+            unknown = [name for name in names if name not in parallel_delegations]
+            if unknown:
+                return f"ERROR: cannot run in parallel: {', '.join(unknown)}"
+            if len(set(names)) != len(names):
+                return "ERROR: each agent can appear only once in a parallel delegation"
+            
+            # LLM calls are network-bound, so threads overlap them fully
+            with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+                # Each delegation logs with the Supervisor's metadata
+                futures = [
+                    pool.submit(self.llm_client.with_metadata(parallel_delegations[name]), **kwargs)
+                    for name, kwargs in calls
+                ]
+                results = []
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except TypeError as e:  # bad kwargs for that delegation
+                        results.append(f"ERROR: {e}")
+            return "\n".join(f"{name}: {result}" for name, result in zip(names, results))
+        
         self.tools.register_function(
             name="delegate_structure_expert",
             description="Delegate structure file finding and copying to StructureExpert",
@@ -328,14 +466,41 @@ class Supervisor:
                 "check_type": "string - type of check ('structure', 'forcefield', 'simulation', 'complete')"
             }
         )
+        
+        self.tools.register_function(
+            name="delegate_parallel",
+            description=(
+                "Run delegate_structure_expert and delegate_siminput_expert at the same time; "
+                "other delegations depend on their files and must run afterwards. "
+                "Returns one result line per agent"
+            ),
+            func=delegate_parallel,
+            parameters={
+                "tasks": "list - [{\"agent\": \"delegate_structure_expert\", \"kwargs\": {...}}, "
+                         "{\"agent\": \"delegate_siminput_expert\", \"kwargs\": {...}}]"
+            }
+        )
     
-    def run(self, user_request: str) -> AgentResult:
+    def run(
+        self,
+        user_request: str,
+        wait_for_force_fields: Optional[Callable[[], Optional[Path]]] = None,
+        session_id: Optional[str] = None
+    ) -> AgentResult:
         """
         Process user request and coordinate simulation setup.
         
         Args:
             user_request: User's simulation request in natural language
-            
+            wait_for_force_fields: Blocks until custom force field files being
+                written elsewhere are ready and returns their folder (None if
+                that failed); ForceFieldExpert calls it before starting, so the
+                other experts can run in the meantime
+            session_id: Continue the conversation of earlier runs with this
+                id: they are resent as an unchanged prefix (cheap with prompt
+                caching) and only the new request is added, without repeating
+                the workflow instructions
+                                                
         Returns:
             AgentResult with final status and setup location
         """
@@ -345,42 +510,23 @@ class Supervisor:
             {"request": user_request[:200]}
         )
         
-        task = f"""Process this user request and set up a molecular simulation.
-
-USER REQUEST:
-{user_request}
-
-Your workflow:
-1. Parse the request to extract:
-   - Structure name (e.g., "MOR", "MFI", "LTA", etc.)
-   - Adsorbate molecule (e.g., "CO2", "CH4", etc.)
-   - Simulation type (e.g., "isotherm", "HOA", "single-point")
-   - Conditions (temperature, pressures, etc.)
-
-2. Create a workspace folder: {self.workspace_root / "runs"}/[structure]_[adsorbate]_[type]
-
-3. Delegate to agents in sequence:
-   - Use delegate_structure_expert to find and copy structure file
-   - Use delegate_forcefield_expert to prepare force field files
-   - Use delegate_siminput_expert to create simulation.input template
-   - Use delegate_evaluator to validate the setup
-   - Use delegate_coding_expert to generate batch run scripts for multiple pressures
-   - Use delegate_evaluator for final check
-
-4. Each delegation will return SUCCESS/FAILED/PASS/FAIL with details.
-   If a step fails, you can retry or report the failure.
-
-5. Provide Final Answer with:
-   - Status: SUCCESS or FAILURE
-   - Location of simulation files
-   - Summary of what was created
-   - Any issues or warnings
-   - Next steps (how to run the simulation)
-
-Remember: All agents will execute real actions. Check their results carefully.
-"""
+        session = self._sessions.setdefault(session_id, []) if session_id is not None else None
+        if session:
+            task = _FOLLOW_UP_TEMPLATE.substitute(user_request=user_request)
+        else:
+            task = _TASK_TEMPLATE.substitute(
+                user_request=user_request,
+                runs_dir=self.workspace_root / "runs",
+            )
+        
+        self._wait_for_force_fields = wait_for_force_fields
+        try:
+            result = self.agent.run(task, session=session)
+        finally:
+            self._wait_for_force_fields = None
         
-        result = self.agent.run(task)
+        if session is not None and len(session) > 2 * SESSION_MAX_EXCHANGES:
+            del session[2:len(session) - 2 * (SESSION_MAX_EXCHANGES - 1)]
         
         self.run_logger.record_workflow_event(
             "supervisor_run_complete",
@@ -1,12 +1,99 @@
 from __future__ import annotations
 
+import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Protocol, Sequence
 
-from openai import OpenAI
+from .config import DEFAULT_LLM_CACHE_PATH, DeepSeekConfig
+from .llm_cache import LLMResponseCache, SemanticResponseCache
+from .rate_limit import TokenBucket
 
-from .config import DeepSeekConfig
+if TYPE_CHECKING:  # imported on first use, like the OpenAI SDK (see OpenAIChatClient)
+    import httpx
+
+# Agents whose answers must come from a live call: the Evaluator's PASS/FAIL
+# verdict has to reflect the exact files it is shown
+SEMANTIC_CACHE_EXCLUDED_AGENTS = frozenset({"Evaluator"})
+
+# Transient API errors (429, 5xx, timeouts, dropped connections) are retried
+# by the OpenAI SDK itself with exponential backoff and jitter; it defaults
+# to 2 retries
+API_MAX_RETRIES = 4
+
+# Once this many calls have failed after all retries within the window, new
+# calls fail immediately instead of waiting out the retries again
+BREAKER_FAILURES = 10
+BREAKER_WINDOW_SECONDS = 30.0
+
+
+class LLMUnavailableError(RuntimeError):
+    """Raised without calling the API while the circuit breaker is open."""
+
+
+class _CircuitBreaker:
+    """Counts recent transient failures; open while there are too many."""
+    
+    def __init__(self, max_failures: int = BREAKER_FAILURES, window: float = BREAKER_WINDOW_SECONDS):
+        self.max_failures = max_failures
+        self.window = window
+        self._failures: deque = deque()
+        self._lock = threading.Lock()
+    
+    def _expire(self, now: float):
+        while self._failures and now - self._failures[0] > self.window:
+            self._failures.popleft()
+    
+    def record_failure(self):
+        with self._lock:
+            now = time.monotonic()
+            self._failures.append(now)
+            self._expire(now)
+    
+    def is_open(self) -> bool:
+        with self._lock:
+            self._expire(time.monotonic())
+            return len(self._failures) >= self.max_failures
+
+
+# One keep-alive connection pool for the whole process, so every agent and
+# client instance reuses warm TCP/TLS connections to the API. Idle
+# connections are kept for a minute (httpx default: 5 s), long enough to
+# survive the tool calls between two ReAct steps.
+_SHARED_HTTP_CLIENT: Optional[httpx.Client] = None
+_SHARED_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def get_shared_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _SHARED_HTTP_CLIENT
+    with _SHARED_HTTP_CLIENT_LOCK:
+        if _SHARED_HTTP_CLIENT is None:
+            import httpx
+            _SHARED_HTTP_CLIENT = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0
+                )
+            )
+        return _SHARED_HTTP_CLIENT
+
+
+def _response_dict(resp) -> Dict[str, Any]:
+    """The parts of a ChatCompletion that agents and the call logger read."""
+    choice = resp.choices[0]
+    message = {"role": "assistant", "content": choice.message.content}
+    if choice.message.tool_calls:
+        message["tool_calls"] = [call.model_dump() for call in choice.message.tool_calls]
+    response = {
+        "id": resp.id,
+        "model": resp.model,
+        "object": "chat.completion",
+        "choices": [{"index": 0, "message": message, "finish_reason": choice.finish_reason}],
+    }
+    if resp.usage is not None:
+        response["usage"] = resp.usage.model_dump()
+    return response
 
 
 class LLMClient(Protocol):
@@ -19,15 +106,73 @@ class LLMClient(Protocol):
 class OpenAIChatClient(LLMClient):
     """Thin wrapper for OpenAI-compatible chat completions with logging support."""
 
-    def __init__(self, cfg: DeepSeekConfig, llm_logger=None):
-        self._client = OpenAI(api_key=cfg.api_key, base_url=cfg.base_url)
+    def __init__(
+        self,
+        cfg: DeepSeekConfig,
+        llm_logger=None,
+        http_client: Optional[httpx.Client] = None,
+        cache: Optional[LLMResponseCache] = None,
+        semantic_cache: Optional[SemanticResponseCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
+        # Imported here so that importing gcmc_agent (e.g. for the log viewer
+        # or type hints in agent modules) does not load the OpenAI SDK
+        from openai import APIConnectionError, InternalServerError, OpenAI, RateLimitError
+        
+        self._client = OpenAI(
+            api_key=cfg.api_key,
+            base_url=cfg.base_url,
+            http_client=http_client or get_shared_http_client(),
+            max_retries=API_MAX_RETRIES,
+        )
+        self._transient_errors = (APIConnectionError, InternalServerError, RateLimitError)
+        self._rate_limit_error = RateLimitError
+        self._breaker = _CircuitBreaker()
         self._cfg = cfg
+        self.json_mode = cfg.json_mode  # Default for ReActAgent(json_mode=None)
         self.llm_logger = llm_logger  # Optional LLMCallLogger instance
-        self.metadata = {}  # Can be set by agents to add context
+        if cache is None and cfg.llm_cache_path is not None:
+            cache = LLMResponseCache(cfg.llm_cache_path)
+        self.cache = cache  # Optional LLMResponseCache; identical requests are served from it
+        if semantic_cache is None and cfg.semantic_cache_threshold is not None:
+            semantic_cache = SemanticResponseCache(
+                cfg.llm_cache_path or DEFAULT_LLM_CACHE_PATH, threshold=cfg.semantic_cache_threshold
+            )
+        self.semantic_cache = semantic_cache  # Optional; consulted after an exact-cache miss
+        if rate_limiter is None and cfg.requests_per_minute:
+            rate_limiter = TokenBucket(rate=cfg.requests_per_minute / 60.0)
+        # Optional; paces API calls (cache hits are free) and pauses all
+        # threads after a 429 that outlasted the SDK's own retries
+        self.rate_limiter = rate_limiter
+        # Per-thread, so agents running in parallel (Supervisor.delegate_parallel)
+        # each log under their own name
+        self._local = threading.local()
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Context added to LLM call logs by agents (set per thread)."""
+        if not hasattr(self._local, "metadata"):
+            self._local.metadata = {}
+        return self._local.metadata
 
     def set_metadata(self, **kwargs):
         """Set metadata to be included in LLM call logs."""
         self.metadata.update(kwargs)
+    
+    def with_metadata(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap fn to run with a copy of the calling thread's metadata.
+        
+        Metadata is per thread, so work handed to a worker thread (e.g. a
+        ThreadPoolExecutor) would otherwise log without what the caller set,
+        such as supervisor="GlobalSupervisor"; wrap it when submitting.
+        """
+        parent = dict(self.metadata)
+        
+        def run(*args, **kwargs):
+            self._local.metadata = dict(parent)
+            return fn(*args, **kwargs)
+        return run
 
     def chat(
         self, 
@@ -37,6 +182,11 @@ class OpenAIChatClient(LLMClient):
         timeout: int | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        bypass_cache: bool = False,
+        stream: bool = False,
+        stop_markers: Sequence[str] = (),
+        full_response: bool = False,
+        response_format: Dict[str, Any] | None = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -48,11 +198,22 @@ class OpenAIChatClient(LLMClient):
             timeout: Request timeout
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            bypass_cache: Always call the API (e.g. when retrying after a bad
+                answer); the fresh response still replaces the cached one
+            stream: Stream the completion; the result has the same shape
+            stop_markers: With stream, stop reading as soon as one of these
+                appears and cut the content there
+            full_response: Return the complete SDK response dump (logprobs,
+                fingerprints, ...) instead of the fields callers use
+            response_format: Structured output mode, e.g. {"type": "json_object"}
             **kwargs: Additional parameters
             
         Returns:
             Response dict from API
         """
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+        
         # Build request dict for logging
         request_dict = {
             "model": model,
@@ -62,26 +223,82 @@ class OpenAIChatClient(LLMClient):
             "timeout": timeout or self._cfg.timeout,
         }
         request_dict.update(kwargs)
+        if stream and stop_markers:
+            # Cut-off responses differ from full ones, so this is part of the key
+            request_dict["stop_markers"] = list(stop_markers)
+        if full_response:
+            request_dict["full_response"] = True  # cached separately from trimmed responses
+        
+        # Timeout does not change the answer, so it is left out of the key
+        cache_request = {k: v for k, v in request_dict.items() if k != "timeout"}
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(cache_request)
+        use_semantic = (
+            self.semantic_cache is not None
+            and self.metadata.get("agent") not in SEMANTIC_CACHE_EXCLUDED_AGENTS
+        )
         
         # Call API with timing
         start_time = time.time()
         error = None
         response = None
+        cache_status = None
         
         try:
-            resp = self._client.chat.completions.create(
-                model=model,
-                messages=messages,
-                timeout=timeout or self._cfg.timeout,
-                temperature=temperature if temperature is not None else 0.7,
-                max_tokens=max_tokens,
-                **kwargs
-            )
-            # Return a simple dict to keep callers decoupled from SDK objects.
-            response = resp.model_dump() if hasattr(resp, "model_dump") else resp.to_dict()
+            if cache_key is not None and not bypass_cache:
+                response = self.cache.get(cache_key)
+                cache_status = "hit" if response is not None else "miss"
+            if response is None and use_semantic and not bypass_cache:
+                response = self.semantic_cache.get(cache_request)
+                cache_status = "semantic-hit" if response is not None else "miss"
+            if bypass_cache and (cache_key is not None or use_semantic):
+                cache_status = "bypass"
+            
+            fresh = response is None
+            if fresh and self._breaker.is_open():
+                raise LLMUnavailableError(
+                    f"LLM API unavailable: {BREAKER_FAILURES}+ failed calls in the last "
+                    f"{BREAKER_WINDOW_SECONDS:.0f}s; not retrying"
+                )
+            if fresh and self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if fresh and stream:
+                response = self._stream_completion(
+                    stop_markers,
+                    model=model,
+                    messages=messages,
+                    timeout=timeout or self._cfg.timeout,
+                    temperature=temperature if temperature is not None else 0.7,
+                    max_tokens=max_tokens,
+                    **kwargs
+                )
+            elif fresh:
+                resp = self._client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    timeout=timeout or self._cfg.timeout,
+                    temperature=temperature if temperature is not None else 0.7,
+                    max_tokens=max_tokens,
+                    **kwargs
+                )
+                # Return a simple dict to keep callers decoupled from SDK objects.
+                response = resp.model_dump() if full_response else _response_dict(resp)
+            
+            if fresh and self.rate_limiter is not None:
+                self.rate_limiter.reset_backoff()
+            if fresh:
+                if cache_key is not None:
+                    self.cache.set(cache_key, response)
+                if use_semantic:
+                    self.semantic_cache.set(cache_request, response)
             
         except Exception as e:
             error = str(e)
+            if isinstance(e, self._transient_errors):
+                self._breaker.record_failure()
+            if isinstance(e, self._rate_limit_error) and self.rate_limiter is not None:
+                self.rate_limiter.backoff()
             raise
         
         finally:
@@ -89,12 +306,72 @@ class OpenAIChatClient(LLMClient):
             
             # Log the call if logger is available
             if self.llm_logger:
+                # log_call() serializes the record before returning, so the
+                # live dict can be passed without a defensive copy
+                metadata = self.metadata
+                if cache_status:
+                    metadata = {**metadata, "cache": cache_status}
                 self.llm_logger.log_call(
                     request=request_dict,
                     response=response,
                     error=error,
                     duration=duration,
-                    metadata=self.metadata.copy()
+                    metadata=metadata
                 )
         
         return response
+
+    def _stream_completion(self, stop_markers: Sequence[str], **create_kwargs) -> Dict[str, Any]:
+        """
+        Stream a completion and rebuild the non-streaming response dict.
+        
+        Reading stops at the first stop marker (e.g. a ReAct agent's
+        "\nObservation:", which the model would otherwise go on to invent),
+        and the stream is closed so the rest is never downloaded.
+        """
+        stream = self._client.chat.completions.create(
+            stream=True, stream_options={"include_usage": True}, **create_kwargs
+        )
+        content = ""
+        finish_reason = None
+        usage = None
+        response_id = response_model = None
+        longest_marker = max((len(m) for m in stop_markers), default=0)
+        try:
+            for chunk in stream:
+                response_id = response_id or chunk.id
+                response_model = response_model or chunk.model
+                if chunk.usage is not None:
+                    usage = chunk.usage.model_dump()
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                delta = choice.delta.content
+                if not delta:
+                    continue
+                # Only the new text (plus room for a marker split across chunks) is searched
+                search_from = max(0, len(content) - longest_marker)
+                content += delta
+                cut = min((i for i in (content.find(m, search_from) for m in stop_markers) if i >= 0), default=-1)
+                if cut >= 0:
+                    content = content[:cut]
+                    finish_reason = "stop"
+                    break
+        finally:
+            stream.close()
+        
+        response = {
+            "id": response_id,
+            "model": response_model,
+            "object": "chat.completion",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason,
+            }],
+        }
+        # Usage arrives in the last chunk, so it is missing if we stopped early
+        if usage is not None:
+            response["usage"] = usage
+        return response
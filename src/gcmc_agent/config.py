@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Optional
 
@@ -14,6 +15,12 @@ except ImportError:  # pragma: no cover - optional dependency
     pass
 
 
+DEFAULT_LLM_CACHE_PATH = Path.home() / ".cache" / "gcmc_agent" / "llm.sqlite"
+
+# Repository root, the default workspace (resolved once at import)
+_DEFAULT_ROOT = Path(__file__).resolve().parents[2]
+
+
 @dataclass
 class DeepSeekConfig:
     api_key: str
@@ -21,15 +28,42 @@ class DeepSeekConfig:
     chat_model: str = "deepseek-chat"
     reasoner_model: str = "deepseek-reasoner"
     timeout: Optional[int] = None
-
+    llm_cache_path: Optional[Path] = None  # Opt-in response cache (see llm_cache.py)
+    semantic_cache_threshold: Optional[float] = None  # Opt-in similarity cache, e.g. 0.97
+    json_mode: bool = False  # ReAct steps as JSON objects (needs a model with JSON output)
+    requests_per_minute: Optional[float] = None  # Opt-in client-side rate limit
+    
     @classmethod
     def from_env(cls) -> "DeepSeekConfig":
+        """
+        Config from the environment, read once per process.
+        
+        Each call returns a copy, so a caller changing a field does not
+        affect later callers; use reload_config() after changing the
+        environment.
+        """
+        return replace(_load_deepseek_config(cls))
+    
+    @classmethod
+    def _read_env(cls) -> "DeepSeekConfig":
         api_key = os.getenv("DEEPSEEK_API_KEY", "").strip()
         base_url = os.getenv("DEEPSEEK_BASE_URL", cls.base_url).strip() or cls.base_url
         chat_model = os.getenv("DEEPSEEK_CHAT_MODEL", cls.chat_model).strip() or cls.chat_model
         reasoner_model = os.getenv("DEEPSEEK_REASONER_MODEL", cls.reasoner_model).strip() or cls.reasoner_model
         timeout_val = os.getenv("DEEPSEEK_TIMEOUT", "").strip()
         timeout: Optional[int] = int(timeout_val) if timeout_val.isdigit() else None
+        # "1"/"true" selects the default location, anything else is a path
+        cache_val = os.getenv("DEEPSEEK_LLM_CACHE", "").strip()
+        llm_cache_path: Optional[Path] = None
+        if cache_val.lower() in ("1", "true", "yes"):
+            llm_cache_path = DEFAULT_LLM_CACHE_PATH
+        elif cache_val and cache_val.lower() not in ("0", "false", "no"):
+            llm_cache_path = Path(cache_val).expanduser()
+        threshold_val = os.getenv("DEEPSEEK_SEMANTIC_CACHE_THRESHOLD", "").strip()
+        semantic_cache_threshold: Optional[float] = float(threshold_val) if threshold_val else None
+        json_mode = os.getenv("DEEPSEEK_JSON_MODE", "").strip().lower() in ("1", "true", "yes")
+        rpm_val = os.getenv("DEEPSEEK_RPM", "").strip()
+        requests_per_minute: Optional[float] = float(rpm_val) if rpm_val else None
 
         if not api_key:
             raise ValueError("DEEPSEEK_API_KEY is required; set it in the environment or .env")
@@ -40,6 +74,10 @@ class DeepSeekConfig:
             chat_model=chat_model,
             reasoner_model=reasoner_model,
             timeout=timeout,
+            llm_cache_path=llm_cache_path,
+            semantic_cache_threshold=semantic_cache_threshold,
+            json_mode=json_mode,
+            requests_per_minute=requests_per_minute,
         )
 
 
@@ -50,6 +88,24 @@ class AppConfig:
 
     @classmethod
     def load(cls, workspace_root: Optional[Path] = None) -> "AppConfig":
-        root = Path(workspace_root) if workspace_root else Path(__file__).resolve().parents[2]
-        deepseek = DeepSeekConfig.from_env()
-        return cls(deepseek=deepseek, workspace_root=root)
+        """Config for workspace_root (default: the repository root), cached per root; returns a copy."""
+        root = Path(workspace_root) if workspace_root else _DEFAULT_ROOT
+        cached = _load_app_config(cls, root)
+        return replace(cached, deepseek=replace(cached.deepseek))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_deepseek_config(cls) -> DeepSeekConfig:
+    # Failures (missing API key) raise and are therefore not cached
+    return cls._read_env()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_app_config(cls, root: Path) -> AppConfig:
+    return cls(deepseek=DeepSeekConfig.from_env(), workspace_root=root)
+
+
+def reload_config() -> None:
+    """Forget cached configs so the next from_env()/load() rereads the environment."""
+    _load_deepseek_config.cache_clear()
+    _load_app_config.cache_clear()
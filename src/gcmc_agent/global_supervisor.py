@@ -7,21 +7,30 @@ the force field from [18] and setting up an adsorption isotherm simulation
 for a structure using the extracted force field."
 """
 
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-import json
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional, List
+import re
+
+import orjson
 
 from gcmc_agent.react import ReActAgent, AgentResult
 from gcmc_agent.client import OpenAIChatClient
-from gcmc_agent.tools.registry import create_tool_registry
-from gcmc_agent.research.search_agent import PaperSearchAgent
-from gcmc_agent.research.extraction_agent import PaperExtractionAgent
-from gcmc_agent.research.ff_writer_agent import ForceFieldWriterAgent
+from gcmc_agent.llm_cache import LLMResponseCache, SemanticResponseCache
 from gcmc_agent.agents.supervisor import Supervisor
 from gcmc_agent.tools.raspa_runner import RaspaRunner, RaspaResult
 from gcmc_agent.tools.result_parser import ResultParser
 from gcmc_agent.logging_utils import RunLogger, LLMCallLogger
 
+if TYPE_CHECKING:  # the Research Team is imported on first use
+    from gcmc_agent.research.search_agent import PaperSearchAgent
+    from gcmc_agent.research.extraction_agent import PaperExtractionAgent
+    from gcmc_agent.research.ff_writer_agent import ForceFieldWriterAgent
+    from gcmc_agent.research.extract_write_agent import ExtractAndWriteAgent
+
 
 GLOBAL_SUPERVISOR_PROMPT = """You are the Global Supervisor coordinating molecular simulation workflows.
 
@@ -78,6 +87,44 @@ Provide Final Answer with JSON:
 """
 
 
+# Keywords indicating literature extraction needed (lowercase)
+_LITERATURE_KEYWORDS = frozenset(keyword.lower() for keyword in (
+    "from paper", "from literature", "extract from",
+    "taken from", "using parameters from", "force field from",
+    "garcia", "sanchez", "dubbeldam", "calero", "martin-calvo",
+    "trappe-zeo", "epm2", "harris", "vujic"
+))
+
+# The keywords as one pattern, so a request is scanned once; sorted for a
+# stable pattern regardless of set order
+_LITERATURE_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(_LITERATURE_KEYWORDS)),
+    re.IGNORECASE
+)
+
+# Year patterns (e.g., "2009", "et al. 2015")
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+
+# Words that make a year look like a paper reference
+_PAPER_HINT_RE = re.compile(r"et al|force field|parameters", re.IGNORECASE)
+
+# Opening of the final report (_generate_summary); the phase lines follow
+_SUMMARY_HEADER = """
+=== Global Supervisor - Workflow Complete ===
+
+Output Directory: {output_folder}
+
+Phases Executed:
+"""
+
+
+def _simulation_workers(n_simulations: int) -> int:
+    """How many RASPA processes to run at once: cores / RASPA_THREADS (cores per simulation)."""
+    threads_val = os.getenv("RASPA_THREADS", "").strip()
+    threads_per_run = int(threads_val) if threads_val.isdigit() and int(threads_val) > 0 else 1
+    return max(1, min(n_simulations, (os.cpu_count() or 1) // threads_per_run))
+
+
 class GlobalSupervisor:
     """
     Global Supervisor coordinating Research Team and Experiment Setup Team.
@@ -92,11 +139,15 @@ class GlobalSupervisor:
         model: str = "deepseek-chat",
         verbose: bool = False,
         log_file: Optional[Path] = None,
+        llm_cache: bool = False,  # replay identical LLM requests from workspace_root/.llm_cache
+        search_cache_threshold: Optional[float] = None,  # e.g. 0.92; reuse paper searches for similar requests
+        fused_research: bool = False,  # extract + write force fields in one agent run (ExtractAndWriteAgent)
     ):
         self.workspace_root = workspace_root
         self.llm_client = llm_client
         self.model = model
         self.verbose = verbose
+        self.fused_research = fused_research
         
         # Initialize logging system
         self.run_logger = RunLogger(run_name="gcmc_workflow")
@@ -107,30 +158,28 @@ class GlobalSupervisor:
         self.llm_client.llm_logger = self.llm_logger
         self.llm_client.set_metadata(supervisor="GlobalSupervisor")
         
-        # Initialize Research Team agents
-        self.paper_search = PaperSearchAgent(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model=model,
-            verbose=verbose,
-            log_file=log_file
-        )
-        
-        self.paper_extraction = PaperExtractionAgent(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model=model,
-            verbose=verbose,
-            log_file=log_file
-        )
+        # One client serves every agent below, so a cache attached here covers
+        # the Research Team and the Setup Team alike; rerunning a workflow
+        # then does not pay for the same calls again. Hits and misses are
+        # counted in the LLM call log
+        if llm_cache and self.llm_client.cache is None:
+            self.llm_client.cache = LLMResponseCache(Path(workspace_root) / ".llm_cache" / "llm.sqlite")
+        
+        # Paper searches for differently worded requests about the same paper
+        # ("TraPPE for CO2 in MFI" / "TraPPE force field, CO2 on MFI") are
+        # answered from here, skipping the search agent and Semantic Scholar
+        # (needs sentence-transformers)
+        self.search_cache = None
+        if search_cache_threshold is not None:
+            self.search_cache = SemanticResponseCache(
+                Path(workspace_root) / ".semantic_cache" / "paper_search.sqlite",
+                threshold=search_cache_threshold
+            )
         
-        self.ff_writer = ForceFieldWriterAgent(
-            llm_client=llm_client,
-            workspace_root=workspace_root,
-            model=model,
-            verbose=verbose,
-            log_file=log_file
-        )
+        # The Research Team agents and the coordination agent are built on
+        # first use (see the cached properties below): most requests use a
+        # known force field and never need them
+        self._log_file = log_file
         
         # Initialize Setup Team Supervisor
         self.setup_supervisor = Supervisor(
@@ -141,18 +190,54 @@ class GlobalSupervisor:
             log_file=log_file,
             run_logger=self.run_logger
         )
-        
-        # Create coordination agent (not really needed now, simplified)
-        tools = create_tool_registry(workspace_root)
-        self.agent = ReActAgent(
+        # Setup Team conversation shared by the run() calls of this instance,
+        # so later setups only send their new request; started on the first
+        # setup, set back to None to start a fresh one
+        self.setup_session_id: Optional[str] = None
+    
+    def _agent_kwargs(self) -> Dict[str, Any]:
+        return {
+            "llm_client": self.llm_client,
+            "workspace_root": self.workspace_root,
+            "model": self.model,
+            "verbose": self.verbose,
+            "log_file": self._log_file,
+        }
+    
+    @cached_property
+    def paper_search(self) -> "PaperSearchAgent":
+        from gcmc_agent.research.search_agent import PaperSearchAgent
+        return PaperSearchAgent(**self._agent_kwargs())
+    
+    @cached_property
+    def paper_extraction(self) -> "PaperExtractionAgent":
+        from gcmc_agent.research.extraction_agent import PaperExtractionAgent
+        return PaperExtractionAgent(**self._agent_kwargs())
+    
+    @cached_property
+    def ff_writer(self) -> "ForceFieldWriterAgent":
+        from gcmc_agent.research.ff_writer_agent import ForceFieldWriterAgent
+        return ForceFieldWriterAgent(**self._agent_kwargs())
+    
+    @cached_property
+    def extract_and_write(self) -> "ExtractAndWriteAgent":
+        from gcmc_agent.research.extract_write_agent import ExtractAndWriteAgent
+        return ExtractAndWriteAgent(**self._agent_kwargs())
+    
+    @cached_property
+    def agent(self) -> ReActAgent:
+        """Coordination agent (not really needed now, simplified)."""
+        from gcmc_agent.tools.registry import create_tool_registry
+        tools = create_tool_registry(self.workspace_root)
+        return ReActAgent(
             name="GlobalSupervisor",
             system_prompt=GLOBAL_SUPERVISOR_PROMPT,
-            llm_client=llm_client,
+            llm_client=self.llm_client,
             tools=tools.to_dict(),
-            model=model,
+            model=self.model,
             max_iterations=15,
-            verbose=verbose,
-            log_file=log_file,
+            verbose=self.verbose,
+            log_file=self._log_file,
         )
     
     def _needs_literature_search(
@@ -174,27 +259,11 @@ class GlobalSupervisor:
             return True
         
         # Check for paper/literature keywords in request
-        request_lower = user_request.lower()
-        
-        # Keywords indicating literature extraction needed
-        literature_keywords = [
-            "from paper", "from literature", "extract from",
-            "taken from", "using parameters from", "force field from",
-            "garcia", "sanchez", "dubbeldam", "calero", "martin-calvo",
-            "trappe-zeo", "epm2", "harris", "vujic"
-        ]
-        
-        # Year patterns (e.g., "2009", "et al. 2015")
-        import re
-        year_pattern = r'\b(19|20)\d{2}\b'
-        has_year = bool(re.search(year_pattern, user_request))
-        
-        for keyword in literature_keywords:
-            if keyword in request_lower:
-                return True
+        if _LITERATURE_RE.search(user_request):
+            return True
         
         # If there's a year and author-like words, likely a paper reference
-        if has_year and any(word in request_lower for word in ["et al", "force field", "parameters"]):
+        if _YEAR_RE.search(user_request) and _PAPER_HINT_RE.search(user_request):
             return True
         
         return False
@@ -215,7 +284,7 @@ class GlobalSupervisor:
             
             # Parse search result to get best paper
             try:
-                result_data = json.loads(search_result.answer)
+                result_data = orjson.loads(search_result.answer)
                 papers = result_data.get("papers", [])
                 recommended_id = result_data.get("recommended")
                 
@@ -251,7 +320,7 @@ Abstract:
                     "paper_text": paper_text
                 }
                 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # If not JSON, use raw answer as context
                 return {
                     "success": True,
@@ -261,6 +330,21 @@ Abstract:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def _find_paper(self, user_request: str) -> Dict[str, Any]:
+        """_search_paper_from_request(), served from the search cache when a similar request was seen."""
+        if self.search_cache is None:
+            return self._search_paper_from_request(user_request)
+        
+        request = {"cache": "paper_search", "messages": [{"role": "user", "content": user_request}]}
+        cached = self.search_cache.get(request)
+        if cached is not None:
+            return {**cached, "cached": True}
+        
+        search_result = self._search_paper_from_request(user_request)
+        if search_result["success"]:
+            self.search_cache.set(request, search_result)
+        return search_result
+    
     def run(
         self,
         user_request: str,
@@ -292,8 +376,7 @@ Abstract:
         # Analyze user request to determine if Research Team is needed
         research_needed = self._needs_literature_search(user_request, paper_text, paper_doi)
         
-        # Step 1: Execute Research Team if needed
-        force_field_dir = None
+        # Step 1: Find the paper for the Research Team if needed
         extracted_paper_text = paper_text
         
         if research_needed:
@@ -307,12 +390,13 @@ Abstract:
                 if self.verbose:
                     print("\n>> PaperSearchAgent: Searching Semantic Scholar...")
                 
-                search_result = self._search_paper_from_request(user_request)
+                search_result = self._find_paper(user_request)
                 if search_result["success"]:
                     paper_doi = search_result.get("doi")
                     extracted_paper_text = search_result.get("paper_text")
                     if self.verbose:
-                        print(f">> Found paper: {search_result.get('title', 'Unknown')}")
+                        source = " (from search cache)" if search_result.get("cached") else ""
+                        print(f">> Found paper: {search_result.get('title', 'Unknown')}{source}")
                 else:
                     if self.verbose:
                         print(f">> Paper search failed: {search_result.get('error')}")
@@ -320,34 +404,26 @@ Abstract:
                     # If search fails, skip Research Team and use Setup Team's built-in force fields
                     research_needed = False
             
-            # Only run Research Team if we have paper text
-            if research_needed and extracted_paper_text:
-                research_result = self._run_research_team(
-                    user_request=user_request,
-                    paper_text=extracted_paper_text,
-                    paper_doi=paper_doi,
-                    output_folder=output_folder
-                )
-                
-                if not research_result["success"]:
-                    if self.verbose:
-                        print(f">> Research Team failed: {research_result['error']}")
-                        print(f">> Fallback: Using Setup Team's built-in force fields")
-                    # Continue with Setup Team even if Research fails
-                else:
-                    force_field_dir = research_result["force_field_dir"]
-        
-        # Step 2: Execute Setup Team
+        # Step 2: Execute Setup Team (with the Research Team alongside it if
+        # we have paper text)
         if self.verbose:
             print("\n" + "="*80)
             print("PHASE 2: Experiment Setup Team - Simulation Files")
             print("="*80)
         
-        setup_result = self._run_setup_team(
-            user_request=user_request,
-            output_folder=output_folder,
-            custom_force_field_dir=force_field_dir
-        )
+        if research_needed and extracted_paper_text:
+            setup_result = self._run_research_and_setup(
+                user_request=user_request,
+                paper_text=extracted_paper_text,
+                paper_doi=paper_doi,
+                output_folder=output_folder
+            )
+        else:
+            setup_result = self._run_setup_team(
+                user_request=user_request,
+                output_folder=output_folder,
+                custom_force_field_dir=None
+            )
         
         if not setup_result["success"]:
             return AgentResult(
@@ -387,6 +463,7 @@ Abstract:
         # Finish run logging
         overall_success = simulation_results.get("success", False) if simulation_results else setup_result["success"]
         self.run_logger.finish_run(overall_success=overall_success)
+        self.llm_logger.close()
         
         return AgentResult(
             success=True,
@@ -406,6 +483,21 @@ Abstract:
         ff_dir = output_folder / "force_fields"
         ff_dir.mkdir(exist_ok=True)
         
+        if paper_text and self.fused_research:
+            # One agent run does both steps below
+            result = self.extract_and_write.run(
+                paper_text=paper_text,
+                output_folder=ff_dir,
+                paper_title=paper_doi or "User provided paper"
+            )
+            if not result.success:
+                return {"success": False, "error": result.error}
+            return {
+                "success": True,
+                "force_field_dir": ff_dir,
+                "params": orjson.loads(result.answer)
+            }
+        
         # Extract parameters
         if paper_text:
             extract_result = self.paper_extraction.run(
@@ -417,13 +509,14 @@ Abstract:
                 return {"success": False, "error": extract_result.error}
             
             try:
-                params = json.loads(extract_result.answer)
-            except:
+                params = orjson.loads(extract_result.answer)
+            except orjson.JSONDecodeError:
                 return {"success": False, "error": "Failed to parse extraction result"}
             
-            # Write force field files
+            # Write force field files (the answer text was just validated,
+            # so it is handed over instead of re-serializing params)
             writer_result = self.ff_writer.run(
-                extracted_params=params,
+                extracted_params=extract_result.answer,
                 output_folder=ff_dir
             )
             
@@ -438,11 +531,58 @@ Abstract:
         
         return {"success": False, "error": "No paper text provided"}
     
+    def _run_research_and_setup(
+        self,
+        user_request: str,
+        paper_text: str,
+        paper_doi: Optional[str],
+        output_folder: Path
+    ) -> Dict[str, Any]:
+        """
+        Run the Research Team and the Setup Team concurrently.
+        
+        Of the Setup Team, only ForceFieldExpert needs the extracted force
+        field; it waits for the Research Team while the structure and
+        simulation.input steps go ahead. Returns the Setup Team result.
+        """
+        def run_research() -> Dict[str, Any]:
+            # An exception becomes a failed result, so the Setup Team falls
+            # back to its built-in force fields instead of seeing it re-raised
+            try:
+                return self._run_research_team(
+                    user_request=user_request,
+                    paper_text=paper_text,
+                    paper_doi=paper_doi,
+                    output_folder=output_folder
+                )
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+        
+        def wait_for_force_fields() -> Optional[Path]:
+            result = research.result()
+            return result["force_field_dir"] if result["success"] else None
+        
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            research = pool.submit(self.llm_client.with_metadata(run_research))
+            setup_result = self._run_setup_team(
+                user_request=user_request,
+                output_folder=output_folder,
+                custom_force_field_dir=output_folder / "force_fields",
+                wait_for_force_fields=wait_for_force_fields
+            )
+            research_result = research.result()
+        
+        if not research_result["success"] and self.verbose:
+            print(f">> Research Team failed: {research_result['error']}")
+            print(f">> Fallback: Setup Team used its built-in force fields")
+        return setup_result
+    
     def _run_setup_team(
         self,
         user_request: str,
         output_folder: Path,
-        custom_force_field_dir: Optional[Path]
+        custom_force_field_dir: Optional[Path],
+        wait_for_force_fields: Optional[Callable[[], Optional[Path]]] = None
     ) -> Dict[str, Any]:
         """Execute Experiment Setup Team workflow."""
         # Build setup request with explicit output directory
@@ -452,11 +592,24 @@ Abstract:
         setup_request += f"\n\nIMPORTANT OUTPUT DIRECTORY: Create all simulation files in: {output_folder}"
         setup_request += f"\nUse {output_folder} as the base template folder, not a different location."
         
-        if custom_force_field_dir:
+        if custom_force_field_dir and wait_for_force_fields is not None:
+            # Still being extracted; ForceFieldExpert gets the folder only if that succeeds
+            setup_request += (
+                f"\n\nNOTE: Custom force field files are being extracted into {custom_force_field_dir}; "
+                "they will be provided to ForceFieldExpert if extraction succeeds, "
+                "otherwise it uses the built-in force fields."
+            )
+        elif custom_force_field_dir:
             setup_request += f"\n\nIMPORTANT: Use custom force field files from: {custom_force_field_dir}"
         
         # Call Setup Team Supervisor
-        result = self.setup_supervisor.run(setup_request)
+        if self.setup_session_id is None:
+            self.setup_session_id = uuid.uuid4().hex
+        result = self.setup_supervisor.run(
+            setup_request,
+            wait_for_force_fields=wait_for_force_fields,
+            session_id=self.setup_session_id
+        )
         
         if not result.success:
             return {"success": False, "error": result.error}
@@ -483,27 +636,7 @@ Abstract:
             }
         
         # Find simulation directories (pressure point directories)
-        simulation_dirs = []
-        
-        # Search in multiple possible locations
-        search_dirs = [
-            output_folder,
-            output_folder / "runs",
-            output_folder / "template",
-        ]
-        
-        for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
-            
-            # Check subdirectories (e.g., P_100Pa, run_0.1bar)
-            for subdir in search_dir.iterdir():
-                if subdir.is_dir() and (subdir / "simulation.input").exists():
-                    simulation_dirs.append(subdir)
-            
-            # Also check the directory itself
-            if (search_dir / "simulation.input").exists() and search_dir not in simulation_dirs:
-                simulation_dirs.append(search_dir)
+        simulation_dirs = self._find_simulation_dirs(output_folder)
         
         if not simulation_dirs:
             if self.verbose:
@@ -517,15 +650,20 @@ Abstract:
         if self.verbose:
             print(f"   Found {len(simulation_dirs)} simulation(s) to run")
         
-        # Execute each simulation
+        # Execute the simulations (pressure points are independent). Each is
+        # its own RASPA process, so threads suffice here: they only wait on
+        # the subprocesses
         results = []
         all_success = True
         
-        for sim_dir in sorted(simulation_dirs):
-            if self.verbose:
-                print(f"\n   Running: {sim_dir.name}")
-            
-            result = runner.run(sim_dir)
+        workers = _simulation_workers(len(simulation_dirs))
+        if self.verbose:
+            print(f"   Running: {', '.join(d.name for d in simulation_dirs)} ({workers} at a time)")
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            run_results = list(pool.map(runner.run, simulation_dirs))
+        
+        for sim_dir, result in zip(simulation_dirs, run_results):
             results.append({
                 "directory": str(sim_dir),
                 "success": result.success,
@@ -537,10 +675,10 @@ Abstract:
             if not result.success:
                 all_success = False
                 if self.verbose:
-                    print(f"   ❌ Failed: {result.error_message}")
+                    print(f"   ❌ {sim_dir.name} failed: {result.error_message}")
             else:
                 if self.verbose:
-                    print(f"   ✅ Completed in {result.execution_time:.1f}s")
+                    print(f"   ✅ {sim_dir.name} completed in {result.execution_time:.1f}s")
         
         return {
             "success": all_success,
@@ -549,40 +687,79 @@ Abstract:
             "successful": sum(1 for r in results if r["success"])
         }
     
+    @staticmethod
+    def _find_simulation_dirs(output_folder: Path) -> List[Path]:
+        """
+        Sorted folders containing a simulation.input.
+        
+        Looks at output_folder, its subfolders, and the subfolders of
+        output_folder/runs and output_folder/template (e.g. P_100Pa,
+        run_0.1bar); RASPA Output/ trees are never walked.
+        """
+        found = set()
+        root = os.fspath(output_folder)
+        if os.path.isfile(os.path.join(root, "simulation.input")):
+            found.add(output_folder)
+        
+        # os.scandir entries know whether they are directories without a
+        # stat, so only folders cost a lookup of their simulation.input;
+        # runs/ and template/ are picked up from the same listing
+        pending = [root]
+        while pending:
+            search_dir = pending.pop()
+            try:
+                with os.scandir(search_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+                        if os.path.isfile(os.path.join(entry.path, "simulation.input")):
+                            found.add(Path(entry.path))
+                        if search_dir == root and entry.name in ("runs", "template"):
+                            pending.append(entry.path)
+            except OSError:  # output folder missing or unreadable
+                continue
+        
+        return sorted(found)
+    
     def _parse_results(self, simulation_results: List[Dict]) -> Dict[str, Any]:
         """Parse RASPA output to extract isotherm data."""
+        # ResultParser keeps no per-file state, so one instance is shared by
+        # the threads; outputs are independent and parsing is mostly file reads
         parser = ResultParser()
-        isotherms = []
+        to_parse = [sim for sim in simulation_results if sim["success"]]
         
-        for sim in simulation_results:
-            if not sim["success"]:
-                continue
-            
-            output_dir = Path(sim["output_dir"])
-            if not output_dir.exists():
-                continue
-            
-            try:
-                # Look for System_0 output directory
-                system_dir = output_dir / "System_0"
-                if not system_dir.exists():
-                    system_dir = output_dir
-                
-                isotherm_data = parser.parse_isotherm(system_dir)
-                if isotherm_data:
-                    isotherms.append({
-                        "directory": sim["directory"],
-                        "data": isotherm_data
-                    })
-            except Exception as e:
-                if self.verbose:
-                    print(f"   ⚠️  Failed to parse {sim['directory']}: {e}")
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(to_parse)))) as pool:
+            parsed = pool.map(lambda sim: self._parse_one(parser, sim), to_parse)
+            isotherms = [isotherm for isotherm in parsed if isotherm is not None]
         
         return {
             "isotherms": isotherms,
             "total_parsed": len(isotherms)
         }
     
+    def _parse_one(self, parser: ResultParser, sim: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Isotherm data of one successful simulation, or None."""
+        output_dir = Path(sim["output_dir"])
+        if not output_dir.exists():
+            return None
+        
+        try:
+            # Look for System_0 output directory
+            system_dir = output_dir / "System_0"
+            if not system_dir.exists():
+                system_dir = output_dir
+            
+            isotherm_data = parser.parse_isotherm(system_dir)
+            if isotherm_data:
+                return {
+                    "directory": sim["directory"],
+                    "data": isotherm_data
+                }
+        except Exception as e:
+            if self.verbose:
+                print(f"   ⚠️  Failed to parse {sim['directory']}: {e}")
+        return None
+    
     def _generate_summary(
         self,
         research_needed: bool,
@@ -592,32 +769,26 @@ Abstract:
         parsed_results: Optional[Dict[str, Any]] = None
     ) -> str:
         """Generate final summary report."""
-        summary = f"""
-=== Global Supervisor - Workflow Complete ===
-
-Output Directory: {output_folder}
-
-Phases Executed:
-"""
+        parts = [_SUMMARY_HEADER.format(output_folder=output_folder)]
         if research_needed:
-            summary += "  ✅ Research Team: Force field extracted from literature\n"
+            parts.append("  ✅ Research Team: Force field extracted from literature\n")
         
-        summary += "  ✅ Setup Team: Simulation files generated\n"
+        parts.append("  ✅ Setup Team: Simulation files generated\n")
         
         if simulation_results:
             if simulation_results["success"]:
-                summary += f"  ✅ Simulator: {simulation_results.get('successful', 0)}/{simulation_results.get('total_simulations', 0)} simulations completed\n"
+                parts.append(f"  ✅ Simulator: {simulation_results.get('successful', 0)}/{simulation_results.get('total_simulations', 0)} simulations completed\n")
             else:
                 error = simulation_results.get('error', 'Unknown error')
                 if error == "RASPA not installed":
-                    summary += "  ⏭️  Simulator: Skipped (RASPA not installed)\n"
+                    parts.append("  ⏭️  Simulator: Skipped (RASPA not installed)\n")
                 else:
-                    summary += f"  ❌ Simulator: Failed - {error}\n"
+                    parts.append(f"  ❌ Simulator: Failed - {error}\n")
         
         if parsed_results and parsed_results.get("total_parsed", 0) > 0:
-            summary += f"  ✅ Result Parser: {parsed_results['total_parsed']} isotherm(s) extracted\n"
+            parts.append(f"  ✅ Result Parser: {parsed_results['total_parsed']} isotherm(s) extracted\n")
         
-        summary += f"\nSetup Details:\n{setup_result.get('details', 'N/A')}\n"
-        summary += "\n✅ End-to-end workflow completed!"
+        parts.append(f"\nSetup Details:\n{setup_result.get('details', 'N/A')}\n")
+        parts.append("\n✅ End-to-end workflow completed!")
         
-        return summary
+        return "".join(parts)
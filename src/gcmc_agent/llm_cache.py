@@ -0,0 +1,229 @@
+"""
+Persistent response cache for LLM chat completions.
+
+Exact-match cache backed by SQLite: a request (model, messages, sampling
+parameters) is hashed and the full response dict is stored under that key.
+Changing the model or any prompt text, including system prompts, changes
+the key, so stale entries are never served for a new prompt version.
+
+SemanticResponseCache is an optional second layer for near-identical
+requests: everything except the last user message must match exactly, and
+that message is compared by embedding similarity (needs
+sentence-transformers unless an embedding function is passed in).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+
+if TYPE_CHECKING:  # numpy is imported on first use, so the exact cache stays import-light
+    import numpy as np
+
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed exact-match cache for chat completion responses.
+
+    Safe to share between threads; all access goes through one connection
+    guarded by a lock.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file to store responses in
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Hash a request dict into a cache key (order-insensitive)."""
+        payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """Store a response under key, replacing any earlier entry."""
+        payload = orjson.dumps(response, option=orjson.OPT_NON_STR_KEYS, default=str).decode("utf-8")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)",
+                (key, payload, time.time())
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class SemanticResponseCache:
+    """
+    SQLite-backed similarity cache for chat completion responses.
+
+    A request is split into a scope (model, sampling parameters and every
+    message except the last user message) and a query (that last message).
+    A cached response is returned only for the same scope and a query whose
+    embedding has cosine similarity >= threshold to a stored one.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        threshold: float = 0.97,
+        embed: Optional[Callable[[str], np.ndarray]] = None,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file to store responses in (may be shared with
+                LLMResponseCache)
+            threshold: Minimum cosine similarity for a hit
+            embed: Function mapping text to a vector; defaults to a
+                sentence-transformers model, loaded on first use
+            model_name: sentence-transformers model used when embed is None
+        """
+        if embed is None and not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError("SemanticResponseCache needs sentence-transformers (pip install sentence-transformers)")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self._embed = embed
+        self._model_name = model_name
+        # scope -> (unit-norm embedding matrix, row ids), loaded lazily
+        self._index: Dict[str, Tuple[np.ndarray, List[int]]] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS semantic_responses ("
+                "id INTEGER PRIMARY KEY, scope TEXT NOT NULL, embedding BLOB NOT NULL, "
+                "response TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS semantic_scope ON semantic_responses (scope)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def split_request(request: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Return (scope key, query text); query is None if the request ends without a user message."""
+        messages = request.get("messages") or []
+        if not messages or messages[-1].get("role") != "user":
+            return LLMResponseCache.make_key(request), None
+        scope = {**request, "messages": messages[:-1]}
+        return LLMResponseCache.make_key(scope), str(messages[-1].get("content", ""))
+
+    def _vector(self, text: str) -> np.ndarray:
+        import numpy as np
+        if self._embed is None:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(self._model_name)
+            self._embed = lambda t: model.encode(t)
+        vec = np.asarray(self._embed(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def _load_scope(self, scope: str) -> Tuple[np.ndarray, List[int]]:
+        # Caller holds the lock
+        import numpy as np
+        if scope not in self._index:
+            rows = self._conn.execute(
+                "SELECT id, embedding FROM semantic_responses WHERE scope = ?", (scope,)
+            ).fetchall()
+            ids = [row[0] for row in rows]
+            matrix = (np.stack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+                      if rows else np.empty((0, 0), dtype=np.float32))
+            self._index[scope] = (matrix, ids)
+        return self._index[scope]
+
+    def get(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the response cached for the most similar request, or None."""
+        scope, query = self.split_request(request)
+        if query is None:
+            return None
+        import numpy as np
+        vec = self._vector(query)
+        with self._lock:
+            matrix, ids = self._load_scope(scope)
+            if not ids:
+                return None
+            scores = matrix @ vec
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            row = self._conn.execute(
+                "SELECT response FROM semantic_responses WHERE id = ?", (ids[best],)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, request: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Store a response for request."""
+        import numpy as np
+        scope, query = self.split_request(request)
+        if query is None:
+            return
+        vec = self._vector(query)
+        payload = orjson.dumps(response, option=orjson.OPT_NON_STR_KEYS, default=str).decode("utf-8")
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT INTO semantic_responses (scope, embedding, response, created) VALUES (?, ?, ?, ?)",
+                (scope, vec.tobytes(), payload, time.time())
+            )
+            self._conn.commit()
+            if scope in self._index:
+                matrix, ids = self._index[scope]
+                matrix = np.vstack([matrix, vec]) if ids else vec[np.newaxis, :]
+                self._index[scope] = (matrix, ids + [cur.lastrowid])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM semantic_responses").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
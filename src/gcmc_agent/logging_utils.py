@@ -5,12 +5,19 @@ Provides centralized logging management with automatic run ID generation,
 structured log directories, and progress tracking with rich formatting.
 """
 
-import json
+import atexit
+import os
+import queue
+import threading
 import time
+import weakref
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+import orjson
+
 try:
     from rich.console import Console
     from rich.table import Table
@@ -60,6 +67,9 @@ class RunLogger:
         self.run_dir = self.base_dir / self.run_id
         self.run_dir.mkdir(parents=True, exist_ok=True)
         
+        # Agents may finish concurrently (Supervisor.delegate_parallel)
+        self._save_lock = threading.Lock()
+        
         # Metadata
         self.metadata = {
             "run_id": self.run_id,
@@ -187,8 +197,10 @@ class RunLogger:
     def _save_metadata(self):
         """Save metadata to JSON file."""
         metadata_file = self.run_dir / "run_metadata.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(self.metadata, indent=2, fp=f)
+        with self._save_lock:
+            metadata_file.write_bytes(
+                orjson.dumps(self.metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
     
     def _create_summary(self):
         """Create human-readable summary."""
@@ -218,8 +230,7 @@ class RunLogger:
         lines.append(f"Logs saved in: {self.run_dir}")
         lines.append("=" * 80)
         
-        with open(summary_file, 'w') as f:
-            f.write('\n'.join(lines))
+        summary_file.write_text('\n'.join(lines), encoding='utf-8')
         
         # Also print to console
         print('\n'.join(lines))
@@ -233,24 +244,120 @@ def get_latest_run_dir(base_dir: Path = None) -> Optional[Path]:
     if not base_dir.exists():
         return None
     
-    run_dirs = [d for d in base_dir.iterdir() if d.is_dir()]
+    # One directory scan; DirEntry caches is_dir() and stat()
+    with os.scandir(base_dir) as it:
+        run_dirs = [(e.stat().st_mtime_ns, e.path) for e in it if e.is_dir()]
     if not run_dirs:
         return None
     
-    # Sort by modification time
-    latest = max(run_dirs, key=lambda d: d.stat().st_mtime)
-    return latest
+    # Most recently modified
+    return Path(max(run_dirs)[1])
 
 
 def print_run_summary(run_dir: Path):
     """Print summary of a run."""
     summary_file = run_dir / "SUMMARY.txt"
     if summary_file.exists():
-        print(summary_file.read_text())
+        print(summary_file.read_text(encoding='utf-8'))
     else:
         print(f"No summary found for {run_dir}")
 
 
+@dataclass(slots=True)
+class _CallStats:
+    """Running totals over LLM calls; fixed primitive fields, updated per call."""
+    max_errors: Optional[int] = None
+    total_calls: int = 0
+    failed_calls: int = 0
+    total_tokens: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    cache_hits: int = 0  # served from the client's response cache
+    cache_misses: int = 0
+    total_cost: float = 0.0
+    total_duration: float = 0.0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    
+    def add(self, call_number: int, prompt: int, completion: int, total: int,
+            cost: float, duration: float, error: Optional[str], cached: int = 0,
+            cache_status: Optional[str] = None):
+        """Fold one call into the totals."""
+        self.total_calls += 1
+        self.total_tokens += total
+        self.prompt_tokens += prompt
+        self.completion_tokens += completion
+        self.cached_tokens += cached
+        self.total_cost += cost
+        self.total_duration += duration
+        if cache_status in ("hit", "semantic-hit"):
+            self.cache_hits += 1
+        elif cache_status == "miss":
+            self.cache_misses += 1
+        if error:
+            self.failed_calls += 1
+            if self.max_errors is None or len(self.errors) < self.max_errors:
+                self.errors.append({"call": call_number, "error": error})
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Statistics in the shape returned by LLMCallLogger.analyze_calls()."""
+        n = self.total_calls
+        return {
+            "total_calls": n,
+            "successful_calls": n - self.failed_calls,
+            "failed_calls": self.failed_calls,
+            "tokens": {
+                "total": self.total_tokens,
+                "prompt": self.prompt_tokens,
+                "completion": self.completion_tokens,
+                "cached_prompt": self.cached_tokens,
+                "avg_per_call": round(self.total_tokens / n, 1) if n > 0 else 0
+            },
+            "cost": {
+                "total_usd": round(self.total_cost, 4),
+                "avg_per_call_usd": round(self.total_cost / n, 6) if n > 0 else 0
+            },
+            "timing": {
+                "total_seconds": round(self.total_duration, 2),
+                "avg_seconds": round(self.total_duration / n, 3) if n > 0 else 0
+            },
+            "cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses
+            },
+            "errors": self.errors
+        }
+
+
+# Loggers that may still have queued records; closed at interpreter exit.
+# Held weakly so that a logger nobody uses any more can be collected.
+_open_call_loggers: "weakref.WeakSet[LLMCallLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_call_loggers():
+    for logger in list(_open_call_loggers):
+        logger.close()
+
+
+def _write_records(records: "queue.Queue[Optional[bytes]]", fp):
+    """Writer thread of LLMCallLogger: append queued records in batches until the None sentinel."""
+    with fp:
+        while True:
+            batch = [records.get()]
+            try:
+                while len(batch) < 32:
+                    batch.append(records.get_nowait())
+            except queue.Empty:
+                pass
+            fp.write(b"".join(record for record in batch if record is not None))
+            fp.flush()
+            for _ in batch:
+                records.task_done()
+            if None in batch:
+                return
+
+
 class LLMCallLogger:
     """
     Logger for LLM API calls with detailed request/response tracking.
@@ -272,10 +379,55 @@ class LLMCallLogger:
         """
         self.log_file = log_file
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
-        self.call_count = 0
-        self.total_tokens = 0
-        self.total_cost = 0.0  # Estimated cost
-        
+        # Totals are kept as calls are logged; error details are in the log
+        self._stats = _CallStats(max_errors=0)
+        self._stats_lock = threading.Lock()  # agents may log from several threads
+        
+        # Records are serialized by the caller and written by a background
+        # thread, so an agent never waits on disk I/O between LLM calls.
+        # Each batch is flushed, so the log can still be followed live.
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        # Guards starting/stopping the writer and queueing records, so that no
+        # record is queued behind the sentinel of a writer that is stopping
+        self._writer_lock = threading.Lock()
+        _open_call_loggers.add(self)
+    
+    @property
+    def call_count(self) -> int:
+        return self._stats.total_calls
+    
+    @property
+    def total_tokens(self) -> int:
+        return self._stats.total_tokens
+    
+    @property
+    def total_cost(self) -> float:
+        """Estimated cost in USD."""
+        return self._stats.total_cost
+    
+    def _start_writer(self):
+        # Caller holds self._writer_lock. The thread gets the queue, not the
+        # logger, so it does not keep an unused logger alive.
+        self._writer = threading.Thread(
+            target=_write_records, args=(self._queue, open(self.log_file, 'ab')),
+            name="LLMCallLogger-writer", daemon=True
+        )
+        self._writer.start()
+
+    def flush(self):
+        """Block until every logged call has been written to the file."""
+        self._queue.join()
+    
+    def close(self):
+        """Write pending records and close the log file; a later log_call() reopens it."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                self._queue.put(None)
+                # Joined under the lock: log_call() waits, then starts a new writer
+                writer.join()
+                
     def log_call(
         self,
         request: Dict[str, Any],
@@ -292,21 +444,25 @@ class LLMCallLogger:
             response: Response dict from LLM API
             error: Error message if call failed
             duration: Call duration in seconds
-            metadata: Additional metadata (agent name, iteration, etc.)
+            metadata: Additional metadata (agent name, iteration, etc.);
+                serialized before this returns, so callers may reuse the dict
         """
-        self.call_count += 1
-        
         # Extract token usage
         tokens_used = 0
         prompt_tokens = 0
         completion_tokens = 0
+        cached_tokens = 0
         
         if response and "usage" in response:
             usage = response["usage"]
             prompt_tokens = usage.get("prompt_tokens", 0)
             completion_tokens = usage.get("completion_tokens", 0)
             tokens_used = usage.get("total_tokens", 0)
-            self.total_tokens += tokens_used
+            # Prompt-prefix cache hits: DeepSeek reports prompt_cache_hit_tokens,
+            # OpenAI-style APIs prompt_tokens_details.cached_tokens
+            cached_tokens = (usage.get("prompt_cache_hit_tokens")
+                             or (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+                             or 0)
         
         # Estimate cost (rough approximation for GPT-4)
         # You can adjust these rates based on actual model
@@ -314,12 +470,16 @@ class LLMCallLogger:
         cost_per_1k_completion = 0.06  # $0.06 per 1K completion tokens
         estimated_cost = (prompt_tokens / 1000 * cost_per_1k_prompt +
                          completion_tokens / 1000 * cost_per_1k_completion)
-        self.total_cost += estimated_cost
+        with self._stats_lock:
+            call_number = self._stats.total_calls + 1
+            self._stats.add(call_number, prompt_tokens, completion_tokens, tokens_used,
+                            estimated_cost, duration, error, cached_tokens,
+                            (metadata or {}).get("cache"))
         
         # Build log entry
         log_entry = {
             "timestamp": datetime.now().isoformat(),
-            "call_number": self.call_count,
+            "call_number": call_number,
             "duration_seconds": round(duration, 3),
             "request": {
                 "model": request.get("model", "unknown"),
@@ -333,7 +493,8 @@ class LLMCallLogger:
             "tokens": {
                 "prompt": prompt_tokens,
                 "completion": completion_tokens,
-                "total": tokens_used
+                "total": tokens_used,
+                "cached_prompt": cached_tokens
             },
             "estimated_cost_usd": round(estimated_cost, 6),
             "metadata": metadata or {}
@@ -352,18 +513,23 @@ class LLMCallLogger:
                 log_entry["response"] = {"raw": response}
         
         # Write to JSON Lines file (one JSON object per line)
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+        record = orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+        with self._writer_lock:
+            if self._writer is None:
+                self._start_writer()
+            self._queue.put(record)
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics."""
         return {
             "total_calls": self.call_count,
             "total_tokens": self.total_tokens,
-            "total_prompt_tokens": 0,  # Not tracked separately in current implementation
-            "total_completion_tokens": 0,  # Not tracked separately in current implementation
-            "total_duration": 0.0,  # Not tracked separately in current implementation
-            "total_cost_usd": round(self.total_cost, 4)
+            "total_prompt_tokens": self._stats.prompt_tokens,
+            "total_completion_tokens": self._stats.completion_tokens,
+            "total_duration": round(self._stats.total_duration, 2),
+            "total_cost_usd": round(self.total_cost, 4),
+            "cache_hits": self._stats.cache_hits,
+            "cache_misses": self._stats.cache_misses
         }
     
     @staticmethod
@@ -373,51 +539,47 @@ class LLMCallLogger:
             return []
         
         calls = []
-        with open(log_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        calls.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+        for line in log_file.read_bytes().splitlines():
+            if line.strip():
+                try:
+                    calls.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue
         return calls
     
     @staticmethod
-    def analyze_calls(log_file: Path) -> Dict[str, Any]:
-        """Analyze LLM calls and provide statistics."""
-        calls = LLMCallLogger.load_calls(log_file)
-        
-        if not calls:
-            return {"error": "No calls found"}
+    def analyze_calls(log_file: Path, *, max_errors: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Analyze LLM calls and provide statistics.
         
-        total_calls = len(calls)
-        total_tokens = sum(c["tokens"]["total"] for c in calls)
-        total_cost = sum(c.get("estimated_cost_usd", 0) for c in calls)
-        total_duration = sum(c.get("duration_seconds", 0) for c in calls)
+        Streams the log one record at a time, so memory use does not grow
+        with the number of calls.
         
-        errors = [c for c in calls if c.get("error")]
+        Args:
+            log_file: JSON Lines log written by LLMCallLogger
+            max_errors: Keep details for at most this many failed calls
+                (failed_calls still counts all of them); None keeps all
+        """
+        if not log_file.exists():
+            return {"error": "No calls found"}
         
-        # Token distribution
-        prompt_tokens = sum(c["tokens"]["prompt"] for c in calls)
-        completion_tokens = sum(c["tokens"]["completion"] for c in calls)
+        stats = _CallStats(max_errors=max_errors)
+
+        with open(log_file, 'rb', buffering=1 << 20) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    c = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                
+                tokens = c["tokens"]
+                stats.add(c.get("call_number"), tokens["prompt"], tokens["completion"], tokens["total"],
+                          c.get("estimated_cost_usd", 0), c.get("duration_seconds", 0), c.get("error"),
+                          tokens.get("cached_prompt", 0), (c.get("metadata") or {}).get("cache"))
+        
+        if not stats.total_calls:
+            return {"error": "No calls found"}
         
-        return {
-            "total_calls": total_calls,
-            "successful_calls": total_calls - len(errors),
-            "failed_calls": len(errors),
-            "tokens": {
-                "total": total_tokens,
-                "prompt": prompt_tokens,
-                "completion": completion_tokens,
-                "avg_per_call": round(total_tokens / total_calls, 1) if total_calls > 0 else 0
-            },
-            "cost": {
-                "total_usd": round(total_cost, 4),
-                "avg_per_call_usd": round(total_cost / total_calls, 6) if total_calls > 0 else 0
-            },
-            "timing": {
-                "total_seconds": round(total_duration, 2),
-                "avg_seconds": round(total_duration / total_calls, 3) if total_calls > 0 else 0
-            },
-            "errors": [{"call": c["call_number"], "error": c["error"]} for c in errors]
-        }
+        return stats.to_dict()
@@ -0,0 +1,48 @@
+"""
+Client-side rate limiting for LLM API calls and evaluation runs.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how often calls start.
+    
+    Callers only block when the budget is exhausted or after a rate-limit
+    response from the provider (see backoff).
+    """
+    
+    def __init__(self, rate: float = 1.0, capacity: int = 5):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._backoff = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+    
+    def backoff(self) -> None:
+        """Pause all callers after a 429, doubling the pause on repeats (max 60 s)."""
+        with self._lock:
+            self._backoff = min(self._backoff * 2 or 1.0, 60.0)
+            self._blocked_until = time.monotonic() + self._backoff
+    
+    def reset_backoff(self) -> None:
+        """Forget earlier 429s once a request gets through."""
+        with self._lock:
+            self._backoff = 0.0
@@ -16,6 +16,25 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..client import OpenAIChatClient
+from .prompts import REACT_FORMAT_RULES, REACT_JSON_FORMAT_RULES
+
+# Observations come from tool runs; anything the model writes from here on is invented
+OBSERVATION_MARKERS = ("\nObservation:",)
+
+# Observations older than the last KEEP_RECENT_OBSERVATIONS steps are cut to
+# OLD_OBSERVATION_CHARS when the prompt is rebuilt; the model has already
+# acted on them, and resending full tool output every turn grows the prompt
+# with the square of the iteration count
+KEEP_RECENT_OBSERVATIONS = 4
+OLD_OBSERVATION_CHARS = 512
+
+# A reply cut off by max_tokens is retried with twice the budget, this many times
+MAX_TOKENS_RETRIES = 2
+
+# JSON mode: the API guarantees a syntactically valid JSON reply. DeepSeek
+# only supports "json_object" (not "json_schema"), so the step layout is
+# described in the system prompt instead of a schema
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
 
 
 @dataclass
@@ -53,6 +72,9 @@ class ReActAgent:
         verbose: bool = False,
         log_file: Optional[Path] = None,
         llm_call_logger = None,  # LLMCallLogger instance
+        stream: bool = False,
+        max_tokens: Optional[int] = None,
+        json_mode: Optional[bool] = None,
     ):
         self.name = name
         self.system_prompt = system_prompt
@@ -63,6 +85,17 @@ class ReActAgent:
         self.verbose = verbose
         self.log_file = log_file
         self.llm_call_logger = llm_call_logger
+        self.stream = stream  # Stream replies and stop at a hallucinated "Observation:"
+        self.max_tokens = max_tokens  # Per-reply cap; doubled on retry if a reply hits it
+        # Ask for JSON steps instead of Thought/Action prose; None follows the client's setting
+        if json_mode is None:
+            json_mode = getattr(llm_client, "json_mode", False)
+        self.json_mode = json_mode
+        
+        # The system message is identical for every run of this agent, so it is
+        # rendered once; byte-identical prefixes let the provider's prompt cache
+        # serve it on later calls.
+        self._system_content = self._build_system_content()
         
         # Setup logging
         if log_file:
@@ -92,57 +125,63 @@ class ReActAgent:
         return logger
     
     def _log(self, message: str):
-        """Log message to file and optionally print."""
+        """Log message to file and, when verbose, print it (the only stdout path)."""
         if self.logger:
             self.logger.info(message)
         if self.verbose:
             print(message)
 
     def _format_tools_description(self) -> str:
-        """Format tools for the system prompt."""
+        """Format tools for the system prompt (deterministic, see _build_system_content)."""
         tool_descriptions = []
         for name, tool in self.tools.items():
             desc = f"- {name}: {tool.get('description', 'No description')}"
             if "parameters" in tool:
-                desc += f"\n  Parameters: {tool['parameters']}"
+                params = json.dumps(tool["parameters"], sort_keys=True, ensure_ascii=False)
+                desc += f"\n  Parameters: {params}"
             tool_descriptions.append(desc)
         return "\n".join(tool_descriptions)
 
-    def _build_prompt(self, task: str, history: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        """Build the full prompt including system, task, and history."""
+    def _build_system_content(self) -> str:
+        """Render the system message: ReAct format rules, tools and prompt."""
         tools_desc = self._format_tools_description()
         
-        system_content = f"""{self.system_prompt}
-
+        # Most-shared text first: the format rules are the same for every
+        # agent and most agents get the same workspace tools, so the agents'
+        # system messages start with a common prefix that the provider's
+        # prompt cache serves across agents, not only across iterations.
+        # The agent's own prompt comes last and the task goes in a separate
+        # user message.
+        content = f"""{REACT_JSON_FORMAT_RULES if self.json_mode else REACT_FORMAT_RULES}
 Available Tools:
 {tools_desc}
 
-You MUST follow this exact format:
-
-Thought: <your reasoning about what to do next>
-Action: <tool_name>
-Action Input: <JSON object with tool parameters>
-
-OR when you have the final answer:
-
-Thought: <reasoning why you're done>
-Final Answer: <your final response>
-
-CRITICAL RULES:
-1. Output EXACTLY one Thought followed by EXACTLY one Action OR Final Answer
-2. Action Input MUST be valid JSON
-3. Do not skip steps or combine multiple actions
-4. If a tool fails, think about why and try a different approach
-"""
+{self.system_prompt.strip()}"""
+        # Trailing whitespace is normalized so that prompt edits which only
+        # touch whitespace do not change the cached prefix
+        return "\n".join(line.rstrip() for line in content.splitlines()) + "\n"
 
-        messages = [{"role": "system", "content": system_content}]
+    def _build_prompt(
+        self,
+        task: str,
+        history: List[Dict[str, str]],
+        session: Optional[List[Dict[str, str]]] = None
+    ) -> List[Dict[str, str]]:
+        """Build the full prompt including system, earlier session turns, task, and history."""
+        messages = [{"role": "system", "content": self._system_content}]
+        if session:
+            messages.extend(session)
         messages.append({"role": "user", "content": f"Task: {task}"})
         
         # Add conversation history
-        for entry in history:
+        recent_from = len(history) - KEEP_RECENT_OBSERVATIONS
+        for i, entry in enumerate(history):
             messages.append({"role": "assistant", "content": entry["assistant"]})
             if "observation" in entry:
-                messages.append({"role": "user", "content": f"Observation: {entry['observation']}"})
+                observation = entry["observation"]
+                if i < recent_from and len(observation) > OLD_OBSERVATION_CHARS:
+                    observation = f"{observation[:OLD_OBSERVATION_CHARS]}…[truncated]"
+                messages.append({"role": "user", "content": f"Observation: {observation}"})
         
         return messages
 
@@ -216,6 +255,44 @@ CRITICAL RULES:
             "error": "Could not parse Action or Final Answer from response"
         }
 
+    def _parse_json_response(self, response: str) -> Dict[str, Any]:
+        """
+        Parse a JSON-mode reply; same return shapes as _parse_response.
+        
+        Replies that are not JSON after all are handed to the text parser.
+        """
+        try:
+            step = json.loads(response)
+        except json.JSONDecodeError:
+            return self._parse_response(response)
+        if not isinstance(step, dict):
+            return {"type": "error", "thought": "", "error": "Reply must be a JSON object"}
+        
+        thought = str(step.get("thought") or "")
+        final_answer = step.get("final_answer")
+        if final_answer is not None:
+            if not isinstance(final_answer, str):
+                final_answer = json.dumps(final_answer, ensure_ascii=False)
+            return {"type": "final", "thought": thought, "final_answer": final_answer.strip()}
+        
+        action = step.get("action")
+        if action:
+            action_input = step.get("action_input") or {}
+            if not isinstance(action_input, dict):
+                return {"type": "error", "thought": thought, "error": "action_input must be a JSON object"}
+            return {
+                "type": "action",
+                "thought": thought,
+                "action": str(action).strip(),
+                "action_input": action_input
+            }
+        
+        return {
+            "type": "error",
+            "thought": thought,
+            "error": "Reply has neither \"action\" nor \"final_answer\""
+        }
+    
     def _execute_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> str:
         """Execute a tool and return the observation."""
         if tool_name not in self.tools:
@@ -232,14 +309,49 @@ CRITICAL RULES:
         except Exception as e:
             return f"Error executing {tool_name}: {str(e)}"
 
-    def run(self, task: str, context: Optional[Dict[str, Any]] = None) -> AgentResult:
+    def _call_llm(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """One chat call with this agent's streaming and max_tokens settings."""
+        kwargs: Dict[str, Any] = {}
+        if self.json_mode:
+            # A JSON reply never runs on into an invented "Observation:"
+            kwargs.update(stream=self.stream, response_format=JSON_RESPONSE_FORMAT)
+        elif self.stream:
+            kwargs.update(stream=True, stop_markers=OBSERVATION_MARKERS)
+        
+        max_tokens = self.max_tokens
+        for attempt in range(MAX_TOKENS_RETRIES + 1):
+            if max_tokens is not None:
+                kwargs["max_tokens"] = max_tokens
+            response = self.llm_client.chat(
+                model=self.model,
+                messages=messages,
+                timeout=60,
+                **kwargs
+            )
+            if max_tokens is None or response["choices"][0].get("finish_reason") != "length":
+                break
+            if attempt < MAX_TOKENS_RETRIES:
+                self._log(f"⚠️  Reply hit max_tokens={max_tokens}, retrying with {max_tokens * 2}")
+                max_tokens *= 2
+        return response
+    
+    def run(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]] = None,
+        session: Optional[List[Dict[str, str]]] = None
+    ) -> AgentResult:
         """
         Run the ReAct agent on a task.
         
         Args:
             task: The task description
             context: Optional context dict (e.g., global memory, working_dir)
-            
+            session: Messages of earlier runs to continue from; sent between
+                the system message and the task, unchanged, so the provider's
+                prompt cache serves them. On success the task and the final
+                reply are appended to it (intermediate steps are not kept).
+                        
         Returns:
             AgentResult with success status and answer
         """
@@ -247,26 +359,18 @@ CRITICAL RULES:
         self._log(f"Agent: {self.name}")
         self._log(f"Task: {task}")
         self._log(f"{'='*60}\n")
-        
-        if self.verbose:
-            print(f"\n{'='*60}")
-            print(f"Agent: {self.name}")
-            print(f"Task: {task}")
-            print(f"{'='*60}\n")
 
         history = []
         
         for iteration in range(self.max_iterations):
             self._log(f"\n--- Iteration {iteration + 1} ---")
-            
-            if self.verbose:
-                print(f"\n--- Iteration {iteration + 1} ---")
 
             # Build prompt and get LLM response
-            messages = self._build_prompt(task, history)
+            messages = self._build_prompt(task, history, session)
             
-            # Set metadata for this LLM call
-            if self.llm_call_logger:
+            # Set metadata for this LLM call (the agent name also decides
+            # whether the client may answer from its semantic cache)
+            if hasattr(self.llm_client, "set_metadata"):
                 self.llm_client.set_metadata(
                     agent=self.name,
                     iteration=iteration + 1,
@@ -274,11 +378,7 @@ CRITICAL RULES:
                 )
             
             try:
-                response = self.llm_client.chat(
-                    model=self.model,
-                    messages=messages,
-                    timeout=60
-                )
+                response = self._call_llm(messages)
                 assistant_content = response["choices"][0]["message"]["content"]
                 
                 # Log LLM response
@@ -294,17 +394,14 @@ CRITICAL RULES:
                     error=error_msg
                 )
 
-            if self.verbose:
-                print(f"\nA:\n{assistant_content}")
-
             # Parse response
-            parsed = self._parse_response(assistant_content)
+            if self.json_mode:
+                parsed = self._parse_json_response(assistant_content)
+            else:
+                parsed = self._parse_response(assistant_content)
             
             if parsed["type"] == "error":
                 self._log(f"⚠️  Parse error: {parsed['error']}")
-                
-                if self.verbose:
-                    print(f"⚠️  Parse error: {parsed['error']}")
                 # Continue and let LLM correct itself
                 history.append({
                     "assistant": assistant_content,
@@ -315,9 +412,9 @@ CRITICAL RULES:
             if parsed["type"] == "final":
                 self._log(f"\n✅ Final Answer: {parsed['final_answer']}")
                 self._log(f"Total iterations: {iteration + 1}")
-                
-                if self.verbose:
-                    print(f"\n✅ Final Answer: {parsed['final_answer']}")
+                if session is not None:
+                    session.append({"role": "user", "content": f"Task: {task}"})
+                    session.append({"role": "assistant", "content": assistant_content})
                 return AgentResult(
                     success=True,
                     answer=parsed["final_answer"],
@@ -332,11 +429,6 @@ CRITICAL RULES:
                 observation = self._execute_tool(parsed["action"], parsed["action_input"])
                 
                 self._log(f"   Observation: {observation[:500]}{'...' if len(observation) > 500 else ''}")
-                
-                if self.verbose:
-                    print(f"\n🔧 Tool: {parsed['action']}")
-                    print(f"   Input: {parsed['action_input']}")
-                    print(f"   Observation: {observation[:200]}{'...' if len(observation) > 200 else ''}")
 
                 history.append({
                     "assistant": assistant_content,
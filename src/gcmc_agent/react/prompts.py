@@ -0,0 +1,41 @@
+"""
+Prompt text shared by every ReAct agent.
+
+Kept in one place so the common part of each system message is identical
+across agents; agent prompts only describe their role and final answer.
+"""
+
+# Opens every agent's system message, before its tools and role prompt
+REACT_FORMAT_RULES = """You MUST follow this exact format:
+
+Thought: <your reasoning about what to do next>
+Action: <tool_name>
+Action Input: <JSON object with tool parameters>
+
+OR when you have the final answer:
+
+Thought: <reasoning why you're done>
+Final Answer: <your final response>
+
+CRITICAL RULES:
+1. Output EXACTLY one Thought followed by EXACTLY one Action OR Final Answer
+2. Action Input MUST be valid JSON
+3. Do not skip steps or combine multiple actions
+4. If a tool fails, think about why and try a different approach
+"""
+
+# Used instead of REACT_FORMAT_RULES when the agent runs in JSON mode
+REACT_JSON_FORMAT_RULES = """You MUST reply with a single JSON object and nothing else:
+
+{"thought": "<your reasoning about what to do next>", "action": "<tool_name>", "action_input": {<tool parameters>}}
+
+OR when you have the final answer:
+
+{"thought": "<reasoning why you're done>", "final_answer": "<your final response>"}
+
+CRITICAL RULES:
+1. Output EXACTLY one action OR final_answer per reply
+2. action_input MUST be a JSON object
+3. Do not skip steps or combine multiple actions
+4. If a tool fails, think about why and try a different approach
+"""
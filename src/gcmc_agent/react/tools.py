@@ -49,10 +49,12 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
-
+        self._schema: Optional[Dict[str, Dict[str, Any]]] = None  # to_dict() result, until the next register()
+    
     def register(self, tool: Tool):
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._schema = None
 
     def register_function(
         self,
@@ -69,10 +71,24 @@ class ToolRegistry:
         """Get a tool by name."""
         return self._tools.get(name)
 
+    def copy(self) -> "ToolRegistry":
+        """Return a new registry with the same tools (Tool objects are shared)."""
+        clone = ToolRegistry()
+        clone._tools = self._tools.copy()
+        clone._schema = self.to_dict()  # built here once, then shared by every copy
+        return clone
+    
     def get_all(self) -> Dict[str, Tool]:
         """Get all registered tools."""
         return self._tools.copy()
 
     def to_dict(self) -> Dict[str, Dict[str, Any]]:
-        """Convert all tools to dict format for ReActAgent."""
-        return {name: tool.to_dict() for name, tool in self._tools.items()}
+        """
+        Convert all tools to dict format for ReActAgent.
+        
+        Built once and shared by copies of this registry until a tool is
+        registered; treat the result as read-only.
+        """
+        if self._schema is None:
+            self._schema = {name: tool.to_dict() for name, tool in self._tools.items()}
+        return self._schema
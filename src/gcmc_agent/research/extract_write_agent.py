@@ -0,0 +1,167 @@
+"""
+Extract-and-Write Agent - extracts force field parameters from a paper and
+returns them as RASPA force field files in a single agent run.
+
+Fuses PaperExtractionAgent and ForceFieldWriterAgent: one system prompt and
+one conversation instead of two, so the Research Team pays for one prompt
+prefix and skips the round trips of the second agent.
+"""
+
+from pathlib import Path
+
+import orjson
+
+from ..react import ReActAgent, AgentResult
+from ..client import OpenAIChatClient
+from ..tools.registry import create_tool_registry
+from .extraction_agent import (
+    EXTRACTION_GUIDE, EXTRACTED_PARAMS_FORMAT, EXTRACTION_GUIDELINES, paper_text_file, paper_text_path
+)
+from .ff_writer_agent import RASPA_FF_FORMAT
+
+
+# Files the agent may return; anything else in its answer is ignored
+FORCE_FIELD_FILES = ("pseudo_atoms.def", "force_field_mixing_rules.def", "force_field.def")
+
+EXTRACT_WRITE_PROMPT = f"""You are a Force Field Extraction Agent: you extract force field parameters from a paper and convert them to RASPA force field files.
+
+{EXTRACTION_GUIDE}{RASPA_FF_FORMAT}Output format:
+Your Final Answer MUST be valid JSON in this exact format:
+{{
+  "params": <extracted parameters, format below>,
+  "files": {{
+    "pseudo_atoms.def": "<file content>",
+    "force_field_mixing_rules.def": "<file content>",
+    "force_field.def": "<file content>"
+  }}
+}}
+
+Extracted parameters format:
+{EXTRACTED_PARAMS_FORMAT}
+CRITICAL: Output the JSON directly as your Final Answer. Do NOT use write_file tool;
+the files are written from your answer. Escape newlines in file contents as \\n.
+
+{EXTRACTION_GUIDELINES}"""
+
+
+class ExtractAndWriteAgent:
+    """
+    Extract-and-Write Agent - paper text in, RASPA force field files out.
+    
+    Same result as PaperExtractionAgent followed by ForceFieldWriterAgent,
+    in one agent run.
+    """
+    
+    def __init__(
+        self,
+        llm_client: OpenAIChatClient,
+        workspace_root: Path,
+        model: str = "deepseek-chat",
+        verbose: bool = False,
+        log_file: Path = None,
+    ):
+        self.workspace_root = workspace_root
+        self.llm_client = llm_client
+        self.model = model
+        self.verbose = verbose
+        
+        # Create tool registry (read_file for long papers)
+        self.tools = create_tool_registry(workspace_root)
+        
+        self.agent = ReActAgent(
+            name="ExtractAndWriteAgent",
+            system_prompt=EXTRACT_WRITE_PROMPT,
+            llm_client=llm_client,
+            tools=self.tools.to_dict(),
+            model=model,
+            max_iterations=30,
+            verbose=verbose,
+            log_file=log_file,
+        )
+    
+    def run(
+        self,
+        paper_text: str,
+        output_folder: Path,
+        paper_title: str = "",
+        adsorbate: str = None
+    ) -> AgentResult:
+        """
+        Extract parameters from paper text and write the force field files.
+        
+        Args:
+            paper_text: Full text or relevant sections of the paper
+            output_folder: Where to write force field files
+            paper_title: Paper title for reference
+            adsorbate: Target molecule (optional, helps focus extraction)
+        
+        Returns:
+            AgentResult whose answer is the extracted parameters as JSON
+            (the same answer PaperExtractionAgent gives)
+        """
+        output_folder = Path(output_folder)
+        output_folder.mkdir(parents=True, exist_ok=True)
+        
+        adsorbate_hint = f" Focus on parameters for {adsorbate}." if adsorbate else ""
+        title_info = f"\nPaper: {paper_title}" if paper_title else ""
+        
+        text_preview = paper_text[:2000]
+        temp_file = paper_text_path(self.workspace_root, paper_text) if len(paper_text) > 2000 else None
+        
+        task = f"""Extract force field parameters from this scientific paper and convert them to RASPA files.{title_info}{adsorbate_hint}
+
+PAPER TEXT ({f"first 2000 chars, full text available via read_file at {temp_file}" if temp_file else "complete"}):
+```
+{text_preview}
+```
+
+Your workflow:
+1. Find the force field parameter tables and the mixing rule
+2. Extract every atom type with exact values and units
+3. Convert epsilon to Kelvin and sigma to Angstrom
+4. Produce pseudo_atoms.def, force_field_mixing_rules.def and force_field.def
+   following the RASPA formats in the system prompt
+5. Output Final Answer: the JSON with "params" and "files"
+
+Remember: Accuracy is critical - these parameters will be used in simulations!
+"""
+        
+        with paper_text_file(temp_file, paper_text):
+            result = self.agent.run(task)
+        if not result.success:
+            return result
+        
+        try:
+            answer = orjson.loads(result.answer)
+            params, files = answer["params"], answer["files"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            return AgentResult(
+                success=False,
+                answer=result.answer,
+                thought_action_history=result.thought_action_history,
+                error="Final Answer is not JSON with \"params\" and \"files\""
+            )
+        
+        written = []
+        for name in FORCE_FIELD_FILES:
+            content = files.get(name) if isinstance(files, dict) else None
+            if isinstance(content, str) and content.strip():
+                (output_folder / name).write_text(content.rstrip() + "\n", encoding='utf-8')
+                written.append(name)
+        
+        if "pseudo_atoms.def" not in written or "force_field_mixing_rules.def" not in written:
+            return AgentResult(
+                success=False,
+                answer=result.answer,
+                thought_action_history=result.thought_action_history,
+                error=f"Missing force field files in answer (got: {', '.join(written) or 'none'})"
+            )
+        
+        if self.verbose:
+            print(f"[ExtractAndWriteAgent] Wrote {', '.join(written)} to {output_folder}")
+        
+        return AgentResult(
+            success=True,
+            answer=orjson.dumps(params).decode('utf-8'),
+            thought_action_history=result.thought_action_history
+        )
@@ -2,18 +2,21 @@
 Paper Extraction Agent - extracts force field parameters from papers using LLM.
 """
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
+import hashlib
 import json
+import os
+import threading
 
 from ..react import ReActAgent, AgentResult
 from ..client import OpenAIChatClient
 from ..tools.registry import create_tool_registry
 
 
-PAPER_EXTRACTION_PROMPT = """You are a Paper Extraction Agent specialized in extracting force field parameters.
-
-Your role:
+# Reading parameter tables: shared with ExtractAndWriteAgent
+EXTRACTION_GUIDE = """Your role:
 - Read scientific papers (text format)
 - Identify force field parameter tables
 - Extract Lennard-Jones parameters (epsilon, sigma)
@@ -36,9 +39,10 @@ Atom naming:
 - Map to chemical elements
 - Preserve original atom type names
 
-Output format:
-Your Final Answer MUST be valid JSON in this exact format:
-{
+"""
+
+# JSON layout of extracted parameters (the input of ForceFieldWriterAgent)
+EXTRACTED_PARAMS_FORMAT = """{
   "source": "paper title or DOI",
   "force_field_name": "TraPPE / OPLS / etc",
   "atoms": [
@@ -57,10 +61,9 @@ Your Final Answer MUST be valid JSON in this exact format:
   "notes": "any special comments",
   "extraction_confidence": "high / medium / low"
 }
+"""
 
-CRITICAL: Output the JSON directly as your Final Answer. Do NOT use write_file tool.
-
-Guidelines:
+EXTRACTION_GUIDELINES = """Guidelines:
 - Be precise with numbers (don't round)
 - Preserve scientific notation if used
 - Note any assumptions made
@@ -69,6 +72,56 @@ Guidelines:
 - Check for parameter updates in supplementary material
 """
 
+PAPER_EXTRACTION_PROMPT = f"""You are a Paper Extraction Agent specialized in extracting force field parameters.
+
+{EXTRACTION_GUIDE}Output format:
+Your Final Answer MUST be valid JSON in this exact format:
+{EXTRACTED_PARAMS_FORMAT}
+CRITICAL: Output the JSON directly as your Final Answer. Do NOT use write_file tool.
+
+{EXTRACTION_GUIDELINES}"""
+
+
+# Full-text files in use by concurrent runs in this process, with their
+# number of users; a file is deleted when its last run finishes
+_paper_files_lock = threading.Lock()
+_paper_file_users: Dict[Path, int] = {}
+
+
+def paper_text_path(workspace_root: Path, paper_text: str) -> Path:
+    """Full-text file for paper_text, named after its content so runs on
+    different papers never share one."""
+    digest = hashlib.blake2b(paper_text.encode('utf-8'), digest_size=8).hexdigest()
+    return Path(workspace_root) / f"temp_paper_{digest}.txt"
+
+
+@contextmanager
+def paper_text_file(path: Optional[Path], paper_text: str) -> Iterator[None]:
+    """
+    Keep the full paper text at path while the block runs (no-op if path is None).
+    
+    Runs on the same paper share the file: the first one writes it, atomically
+    through a temporary name so a concurrent read_file never sees it half
+    written, and the last one deletes it.
+    """
+    if path is None:
+        yield
+        return
+    with _paper_files_lock:
+        if not _paper_file_users.get(path):
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(paper_text, encoding='utf-8')
+            os.replace(tmp, path)
+        _paper_file_users[path] = _paper_file_users.get(path, 0) + 1
+    try:
+        yield
+    finally:
+        with _paper_files_lock:
+            _paper_file_users[path] -= 1
+            if not _paper_file_users[path]:
+                del _paper_file_users[path]
+                path.unlink(missing_ok=True)
+
 
 class PaperExtractionAgent:
     """
@@ -136,9 +189,11 @@ class PaperExtractionAgent:
         text_preview = paper_text[:2000] if len(paper_text) > 2000 else paper_text
         has_more = len(paper_text) > 2000
         
+        temp_file = paper_text_path(self.workspace_root, paper_text) if has_more else None
+        
         task = f"""Extract force field parameters from this scientific paper.{title_info}{adsorbate_hint}{ff_hint}
 
-PAPER TEXT ({"first 2000 chars, full text available via read_file" if has_more else "complete"}):
+PAPER TEXT ({f"first 2000 chars, full text available via read_file at {temp_file}" if has_more else "complete"}):
 ```
 {text_preview}
 ```
@@ -176,13 +231,10 @@ Remember: Accuracy is critical - these parameters will be used in simulations!
 """
         
         # Store full text in a temporary file if needed
-        if has_more:
-            temp_file = self.workspace_root / "temp_paper.txt"
-            temp_file.write_text(paper_text, encoding='utf-8')
-            if self.verbose:
+        with paper_text_file(temp_file, paper_text):
+            if temp_file is not None and self.verbose:
                 print(f"[PaperExtractionAgent] Stored full paper text in {temp_file}")
-        
-        return self.agent.run(task)
+            return self.agent.run(task)
     
     def run_from_file(
         self,
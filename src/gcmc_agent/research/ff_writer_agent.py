@@ -3,7 +3,7 @@ Force Field Writer Agent - converts extracted parameters to RASPA format.
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import json
 
 from ..react import ReActAgent, AgentResult
@@ -11,17 +11,8 @@ from ..client import OpenAIChatClient
 from ..tools.registry import create_tool_registry
 
 
-FF_WRITER_PROMPT = """You are a Force Field Writer Agent specialized in RASPA force field format.
-
-Your role:
-- Take extracted force field parameters (JSON)
-- Convert to RASPA format files:
-  * pseudo_atoms.def - atom type definitions
-  * force_field_mixing_rules.def - mixing rules and LJ parameters
-- Handle unit conversions
-- Apply mixing rules if needed
-
-CRITICAL: RASPA format is FIXED-WIDTH columns. Follow examples EXACTLY!
+# RASPA file layouts and unit conversions: shared with ExtractAndWriteAgent
+RASPA_FF_FORMAT = """CRITICAL: RASPA format is FIXED-WIDTH columns. Follow examples EXACTLY!
 
 1. pseudo_atoms.def FORMAT (EXACT spacing required):
 ```
@@ -103,7 +94,19 @@ O              lennard-jones    93.53     3.033
 Lorentz-Berthelot
 ```
 
-ALWAYS write both files using write_file tool. Never skip files.
+"""
+
+FF_WRITER_PROMPT = f"""You are a Force Field Writer Agent specialized in RASPA force field format.
+
+Your role:
+- Take extracted force field parameters (JSON)
+- Convert to RASPA format files:
+  * pseudo_atoms.def - atom type definitions
+  * force_field_mixing_rules.def - mixing rules and LJ parameters
+- Handle unit conversions
+- Apply mixing rules if needed
+
+{RASPA_FF_FORMAT}ALWAYS write both files using write_file tool. Never skip files.
 """
 
 
@@ -147,7 +150,7 @@ class ForceFieldWriterAgent:
     
     def run(
         self,
-        extracted_params: Dict[str, Any],
+        extracted_params: Union[Dict[str, Any], str],
         output_folder: Path,
         mixing_rule: str = None
     ) -> AgentResult:
@@ -155,7 +158,8 @@ class ForceFieldWriterAgent:
         Convert extracted parameters to RASPA force field files.
         
         Args:
-            extracted_params: JSON dict from PaperExtractionAgent
+            extracted_params: JSON dict from PaperExtractionAgent, or its
+                JSON answer text as is
             output_folder: Where to write force field files
             mixing_rule: Override mixing rule (default: use from extracted_params)
             
@@ -165,8 +169,12 @@ class ForceFieldWriterAgent:
         output_folder = Path(output_folder)
         output_folder.mkdir(parents=True, exist_ok=True)
         
-        # Format extracted params as readable text
-        params_str = json.dumps(extracted_params, indent=2)
+        # Format extracted params as readable text; JSON text is used as is
+        # rather than parsed and serialized again
+        if isinstance(extracted_params, str):
+            params_str = extracted_params.strip()
+        else:
+            params_str = json.dumps(extracted_params, indent=2)
         
         mixing_hint = f"\nUse mixing rule: {mixing_rule}" if mixing_rule else ""
         
@@ -4,6 +4,26 @@ import os
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _make_session() -> requests.Session:
+    """Keep-alive session with retries on transient gateway and rate-limit errors."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        raise_on_status=False,  # hand the last response to raise_for_status()
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry))
+    return session
+
+
+# Shared by every client so repeated lookups reuse pooled TLS connections
+_SESSION = _make_session()
 
 
 class SemanticScholarClient:
@@ -63,7 +83,7 @@ class SemanticScholarClient:
         if min_citation_count is not None:
             params["minCitationCount"] = min_citation_count
         
-        resp = requests.get(url, headers=headers, params=params, timeout=30)
+        resp = _SESSION.get(url, headers=headers, params=params, timeout=30)
         resp.raise_for_status()
         data = resp.json()
         return data.get("data", [])
@@ -83,7 +103,27 @@ class SemanticScholarClient:
         params = {
             "fields": "title,abstract,year,venue,authors,url,externalIds,citationCount,referenceCount,isOpenAccess,openAccessPdf,influentialCitationCount,publicationDate"
         }
-        resp = requests.get(url, headers=headers, params=params, timeout=30)
+        resp = _SESSION.get(url, headers=headers, params=params, timeout=30)
+        resp.raise_for_status()
+        return resp.json()
+    
+    def get_by_doi(self, doi: str, fields: str = "title,externalIds,openAccessPdf") -> Optional[Dict[str, Any]]:
+        """
+        Look up a single paper directly by DOI.
+        
+        Args:
+            doi: DOI without prefix (e.g. "10.1021/jp810871f")
+            fields: Comma-separated fields to include
+            
+        Returns:
+            Paper dictionary, or None if Semantic Scholar has no paper with this DOI
+        """
+        url = f"{self.base_url}/paper/DOI:{doi}"
+        headers = {"x-api-key": self.api_key} if self.api_key else {}
+        params = {"fields": fields}
+        resp = _SESSION.get(url, headers=headers, params=params, timeout=30)
+        if resp.status_code == 404:
+            return None
         resp.raise_for_status()
         return resp.json()
     
@@ -106,7 +146,7 @@ class SemanticScholarClient:
             "limit": limit,
             "offset": offset
         }
-        resp = requests.get(url, headers=headers, params=params, timeout=30)
+        resp = _SESSION.get(url, headers=headers, params=params, timeout=30)
         resp.raise_for_status()
         return resp.json()
     
@@ -129,7 +169,7 @@ class SemanticScholarClient:
             "limit": limit,
             "offset": offset
         }
-        resp = requests.get(url, headers=headers, params=params, timeout=30)
+        resp = _SESSION.get(url, headers=headers, params=params, timeout=30)
         resp.raise_for_status()
         return resp.json()
     
@@ -156,6 +196,6 @@ class SemanticScholarClient:
         params = {"fields": fields}
         payload = {"ids": paper_ids}
         
-        resp = requests.post(url, headers=headers, params=params, json=payload, timeout=30)
+        resp = _SESSION.post(url, headers=headers, params=params, json=payload, timeout=30)
         resp.raise_for_status()
         return resp.json()
@@ -9,15 +9,80 @@ RASPA Runner - 执行RASPA模拟并验证结果
 5. 解析结果
 """
 
+import errno
+import functools
 import os
 import subprocess
 import shutil
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 import re
 
 
+@functools.lru_cache(maxsize=4)
+def _locate_raspa(raspa_dir: Optional[str]) -> Optional[Path]:
+    """
+    Locate the RASPA executable; cached per RASPA_DIR value, since the
+    install does not move during a run (call _locate_raspa.cache_clear()
+    after installing RASPA in a running process).
+    """
+    if raspa_dir:
+        exe = Path(raspa_dir) / "bin" / "simulate"
+        if exe.exists():
+            return exe
+    
+    # Check common locations (prioritize software/installed versions)
+    common_paths = [
+        Path.home() / "software" / "raspa2" / "raspa" / "bin" / "simulate",
+        Path("/usr/local/bin/simulate"),
+        Path("/opt/raspa/bin/simulate"),
+        Path.home() / "RASPA" / "bin" / "simulate",
+        Path.home() / "RASPA2" / "src" / ".libs" / "simulate",
+        Path.home() / "RASPA2" / "src" / "simulate",
+    ]
+    
+    for path in common_paths:
+        if path.exists():
+            return path
+    
+    # Check if in PATH
+    exe = shutil.which("simulate")
+    if exe:
+        return Path(exe)
+    
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def _raspa_installed(raspa_exe: Path) -> bool:
+    """Whether raspa_exe is an executable file (cached like _locate_raspa)."""
+    # RASPA doesn't support --version flag reliably
+    # Just check if executable exists and is executable
+    return raspa_exe.is_file() and os.access(raspa_exe, os.X_OK)
+
+
+# fork/exec failures worth retrying: the machine is briefly out of processes
+# or memory, typically when many simulations are started at once
+_SPAWN_RETRY_ERRNOS = (errno.EAGAIN, errno.ENOMEM)
+SPAWN_RETRIES = 2
+SPAWN_RETRY_DELAY = 2.0  # seconds; doubled after each failed attempt
+
+
+def _run_process(args: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run, retried when the process could not be spawned for lack of resources."""
+    delay = SPAWN_RETRY_DELAY
+    for attempt in range(SPAWN_RETRIES + 1):
+        try:
+            return subprocess.run(args, **kwargs)
+        except OSError as e:
+            if e.errno not in _SPAWN_RETRY_ERRNOS or attempt == SPAWN_RETRIES:
+                raise
+            time.sleep(delay)
+            delay *= 2
+
+
 @dataclass
 class RaspaResult:
     """RASPA execution result."""
@@ -72,43 +137,14 @@ class RaspaRunner:
             print("⚠️  RASPA not found. Set RASPA_DIR environment variable or provide path.")
     
     def _find_raspa(self) -> Optional[Path]:
-        """Locate RASPA executable."""
-        # Check environment variable
-        raspa_dir = os.getenv("RASPA_DIR")
-        if raspa_dir:
-            exe = Path(raspa_dir) / "bin" / "simulate"
-            if exe.exists():
-                return exe
-        
-        # Check common locations (prioritize software/installed versions)
-        common_paths = [
-            Path.home() / "software" / "raspa2" / "raspa" / "bin" / "simulate",
-            Path("/usr/local/bin/simulate"),
-            Path("/opt/raspa/bin/simulate"),
-            Path.home() / "RASPA" / "bin" / "simulate",
-            Path.home() / "RASPA2" / "src" / ".libs" / "simulate",
-            Path.home() / "RASPA2" / "src" / "simulate",
-        ]
-        
-        for path in common_paths:
-            if path.exists():
-                return path
-        
-        # Check if in PATH
-        exe = shutil.which("simulate")
-        if exe:
-            return Path(exe)
-        
-        return None
+        """Locate RASPA executable (RASPA_DIR first, then common locations and PATH)."""
+        return _locate_raspa(os.getenv("RASPA_DIR"))
     
     def check_installation(self) -> bool:
         """Check if RASPA is properly installed."""
-        if not self.raspa_exe or not self.raspa_exe.exists():
+        if not self.raspa_exe:
             return False
-        
-        # RASPA doesn't support --version flag reliably
-        # Just check if executable exists and is executable
-        return self.raspa_exe.is_file() and os.access(self.raspa_exe, os.X_OK)
+        return _raspa_installed(self.raspa_exe)
     
     def run(
         self,
@@ -125,7 +161,6 @@ class RaspaRunner:
         Returns:
             RaspaResult with execution details
         """
-        import time
         start_time = time.time()
         
         # Validate setup
@@ -162,7 +197,7 @@ class RaspaRunner:
         
         # Execute RASPA
         try:
-            result = subprocess.run(
+            result = _run_process(
                 [str(self.raspa_exe), input_file],
                 cwd=simulation_dir,
                 capture_output=True,
@@ -2,6 +2,7 @@
 Tool registry with all GCMC-agent tools for ReAct agents.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Set
 
@@ -13,12 +14,22 @@ def create_tool_registry(workspace_root: Path) -> ToolRegistry:
     """
     Create and populate tool registry with all available tools.
     
+    The registry is built once per workspace root and shared; each call
+    returns a copy, so callers may register extra tools (as the Supervisor
+    does) without affecting other agents.
+    
     Args:
         workspace_root: Root directory of the project
-        
+    
     Returns:
         ToolRegistry with all tools registered
     """
+    return _build_tool_registry(Path(workspace_root)).copy()
+
+
+@lru_cache(maxsize=8)
+def _build_tool_registry(workspace_root: Path) -> ToolRegistry:
+    """Build the full tool registry for a workspace root (cached, do not mutate)."""
     registry = ToolRegistry()
     
     # ============================================================
@@ -0,0 +1,120 @@
+"""
+Unit tests for LLMResponseCache.
+
+Tests key derivation and SQLite persistence of cached responses, and
+similarity lookup in SemanticResponseCache.
+"""
+
+import numpy as np
+import pytest
+from gcmc_agent.llm_cache import LLMResponseCache, SemanticResponseCache
+
+
+REQUEST = {
+    "model": "deepseek-chat",
+    "messages": [{"role": "user", "content": "Hi"}],
+    "temperature": 0.7,
+    "max_tokens": None,
+}
+
+RESPONSE = {"choices": [{"message": {"role": "assistant", "content": "Hello"}}]}
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "cache.sqlite")
+        yield cache
+        cache.close()
+
+    def test_key_ignores_dict_order(self):
+        """Keys depend on content, not on dict insertion order."""
+        reordered = dict(reversed(list(REQUEST.items())))
+        assert LLMResponseCache.make_key(REQUEST) == LLMResponseCache.make_key(reordered)
+
+    def test_key_changes_with_prompt(self):
+        """A different prompt must not hit the same entry."""
+        other = {**REQUEST, "messages": [{"role": "user", "content": "Bye"}]}
+        assert LLMResponseCache.make_key(REQUEST) != LLMResponseCache.make_key(other)
+
+    def test_miss_returns_none(self, cache):
+        """Unknown keys are cache misses."""
+        assert cache.get(LLMResponseCache.make_key(REQUEST)) is None
+
+    def test_roundtrip(self, cache):
+        """Stored responses come back unchanged."""
+        key = LLMResponseCache.make_key(REQUEST)
+        cache.set(key, RESPONSE)
+        assert cache.get(key) == RESPONSE
+        assert len(cache) == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """Entries survive reopening the database."""
+        path = tmp_path / "cache.sqlite"
+        key = LLMResponseCache.make_key(REQUEST)
+
+        first = LLMResponseCache(path)
+        first.set(key, RESPONSE)
+        first.close()
+
+        second = LLMResponseCache(path)
+        assert second.get(key) == RESPONSE
+        second.close()
+
+    def test_clear(self, cache):
+        """clear() drops every entry."""
+        cache.set(LLMResponseCache.make_key(REQUEST), RESPONSE)
+        cache.clear()
+        assert len(cache) == 0
+
+
+def _letter_counts(text: str) -> np.ndarray:
+    """Toy embedding: letter histogram (so near-identical texts score ~1)."""
+    vec = np.zeros(26)
+    for ch in text.lower():
+        if "a" <= ch <= "z":
+            vec[ord(ch) - ord("a")] += 1
+    return vec
+
+
+class TestSemanticResponseCache:
+    """Tests for SemanticResponseCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = SemanticResponseCache(tmp_path / "cache.sqlite", threshold=0.97, embed=_letter_counts)
+        yield cache
+        cache.close()
+
+    def test_similar_query_hits(self, cache):
+        """A near-identical last user message is served from the cache."""
+        cache.set(REQUEST, RESPONSE)
+        similar = {**REQUEST, "messages": [{"role": "user", "content": "Hi!"}]}
+        assert cache.get(similar) == RESPONSE
+
+    def test_different_query_misses(self, cache):
+        """Unrelated queries fall below the threshold."""
+        cache.set(REQUEST, RESPONSE)
+        other = {**REQUEST, "messages": [{"role": "user", "content": "Summarize the zeolite paper"}]}
+        assert cache.get(other) is None
+
+    def test_scope_must_match_exactly(self, cache):
+        """Earlier messages and parameters are part of the exact-match scope."""
+        cache.set(REQUEST, RESPONSE)
+        assert cache.get({**REQUEST, "model": "deepseek-reasoner"}) is None
+        with_system = {**REQUEST, "messages": [{"role": "system", "content": "Be brief"}] + REQUEST["messages"]}
+        assert cache.get(with_system) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        """Entries survive reopening the database."""
+        path = tmp_path / "cache.sqlite"
+        first = SemanticResponseCache(path, embed=_letter_counts)
+        first.set(REQUEST, RESPONSE)
+        first.close()
+
+        second = SemanticResponseCache(path, embed=_letter_counts)
+        assert second.get(REQUEST) == RESPONSE
+        assert len(second) == 1
+        second.close()
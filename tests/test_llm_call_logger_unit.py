@@ -0,0 +1,112 @@
+"""
+Unit tests for LLMCallLogger.
+
+Tests JSON Lines logging and the streaming call analysis.
+"""
+
+import pytest
+from gcmc_agent.logging_utils import LLMCallLogger
+
+
+def _response(prompt: int, completion: int) -> dict:
+    return {
+        "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+        "usage": {
+            "prompt_tokens": prompt,
+            "completion_tokens": completion,
+            "total_tokens": prompt + completion,
+        },
+    }
+
+
+class TestLLMCallLogger:
+    """Tests for LLMCallLogger."""
+
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        logger = LLMCallLogger(tmp_path / "llm_calls.jsonl")
+        request = {"model": "deepseek-chat", "messages": [{"role": "user", "content": "Hi"}]}
+        logger.log_call(request, _response(100, 20), duration=0.5)
+        logger.log_call(request, _response(200, 30), duration=1.5)
+        logger.log_call(request, None, error="timeout", duration=2.0)
+        logger.close()
+        return logger.log_file
+
+    def test_load_calls(self, log_file):
+        """Every logged call is read back in order."""
+        calls = LLMCallLogger.load_calls(log_file)
+        assert [c["call_number"] for c in calls] == [1, 2, 3]
+
+    def test_analyze_totals(self, log_file):
+        """Token, timing and error totals are accumulated over all calls."""
+        stats = LLMCallLogger.analyze_calls(log_file)
+        assert stats["total_calls"] == 3
+        assert stats["successful_calls"] == 2
+        assert stats["failed_calls"] == 1
+        assert stats["tokens"]["total"] == 350
+        assert stats["tokens"]["prompt"] == 300
+        assert stats["tokens"]["completion"] == 50
+        assert stats["timing"]["total_seconds"] == 4.0
+        assert stats["errors"] == [{"call": 3, "error": "timeout"}]
+
+    def test_analyze_skips_corrupt_lines(self, log_file):
+        """A truncated trailing record does not break the analysis."""
+        with open(log_file, "ab") as f:
+            f.write(b'{"call_number": 4, "tok')
+        assert LLMCallLogger.analyze_calls(log_file)["total_calls"] == 3
+
+    def test_analyze_missing_file(self, tmp_path):
+        """A missing log reports no calls."""
+        assert LLMCallLogger.analyze_calls(tmp_path / "none.jsonl") == {"error": "No calls found"}
+
+    def test_analyze_caps_error_details(self, log_file):
+        """max_errors limits the error list but not the failure count."""
+        stats = LLMCallLogger.analyze_calls(log_file, max_errors=0)
+        assert stats["failed_calls"] == 1
+        assert stats["errors"] == []
+
+    def test_summary_tracks_running_totals(self, tmp_path):
+        """get_summary() reflects logged calls without re-reading the log."""
+        logger = LLMCallLogger(tmp_path / "llm_calls.jsonl")
+        logger.log_call({"model": "deepseek-chat", "messages": []}, _response(100, 20), duration=0.5)
+        logger.log_call({"model": "deepseek-chat", "messages": []}, None, error="timeout", duration=2.0)
+        logger.close()
+        summary = logger.get_summary()
+        assert summary["total_calls"] == logger.call_count == 2
+        assert summary["total_tokens"] == 120
+        assert summary["total_prompt_tokens"] == 100
+        assert summary["total_completion_tokens"] == 20
+        assert summary["total_duration"] == 2.5
+
+    def test_cached_prompt_tokens(self, tmp_path):
+        """Prefix-cache hits are counted for DeepSeek and OpenAI usage formats."""
+        logger = LLMCallLogger(tmp_path / "llm_calls.jsonl")
+        deepseek = _response(100, 20)
+        deepseek["usage"]["prompt_cache_hit_tokens"] = 64
+        openai_style = _response(100, 20)
+        openai_style["usage"]["prompt_tokens_details"] = {"cached_tokens": 32}
+        logger.log_call({"model": "deepseek-chat", "messages": []}, deepseek)
+        logger.log_call({"model": "gpt-4o", "messages": []}, openai_style)
+        logger.close()
+        assert LLMCallLogger.analyze_calls(logger.log_file)["tokens"]["cached_prompt"] == 96
+
+    def test_cache_hits_counted(self, tmp_path):
+        """Response-cache status from the client metadata is tallied."""
+        logger = LLMCallLogger(tmp_path / "llm_calls.jsonl")
+        for status in ("hit", "semantic-hit", "miss", "bypass"):
+            logger.log_call({"model": "deepseek-chat", "messages": []}, _response(1, 1), metadata={"cache": status})
+        logger.close()
+        assert logger.get_summary()["cache_hits"] == 2
+        assert LLMCallLogger.analyze_calls(logger.log_file)["cache"] == {"hits": 2, "misses": 1}
+    
+    def test_flush_and_reopen(self, tmp_path):
+        """flush() makes queued records visible; logging after close() appends."""
+        logger = LLMCallLogger(tmp_path / "llm_calls.jsonl")
+        logger.log_call({"model": "deepseek-chat", "messages": []}, _response(1, 1))
+        logger.flush()
+        assert len(LLMCallLogger.load_calls(logger.log_file)) == 1
+        logger.close()
+        logger.log_call({"model": "deepseek-chat", "messages": []}, _response(1, 1))
+        logger.close()
+        calls = LLMCallLogger.load_calls(logger.log_file)
+        assert [c["call_number"] for c in calls] == [1, 2]
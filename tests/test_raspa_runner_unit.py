@@ -4,10 +4,11 @@ Unit tests for RaspaRunner.
 Tests RASPA execution and validation functionality.
 """
 
+import errno
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
-from gcmc_agent.tools.raspa_runner import RaspaRunner, RaspaResult
+from gcmc_agent.tools.raspa_runner import RaspaRunner, RaspaResult, _run_process
 
 
 class TestRaspaResult:
@@ -153,3 +154,17 @@ class TestRaspaRunnerUnit:
         error = runner._extract_error(stdout, stderr)
         assert "ERROR: Line 1" in error
         assert len(error.split('\n')) <= 5  # Should limit to 5 lines
+
+    def test_spawn_retried_when_out_of_resources(self):
+        """EAGAIN on spawn is retried; other OS errors are not."""
+        done = Mock(returncode=0)
+        with patch("gcmc_agent.tools.raspa_runner.time.sleep"), \
+                patch("gcmc_agent.tools.raspa_runner.subprocess.run",
+                      side_effect=[OSError(errno.EAGAIN, "busy"), done]) as run:
+            assert _run_process(["simulate"]) is done
+            assert run.call_count == 2
+        with patch("gcmc_agent.tools.raspa_runner.subprocess.run",
+                   side_effect=OSError(errno.ENOENT, "missing")) as run:
+            with pytest.raises(OSError):
+                _run_process(["simulate"])
+            assert run.call_count == 1
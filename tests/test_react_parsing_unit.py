@@ -0,0 +1,95 @@
+"""
+Unit tests for ReActAgent reply parsing.
+
+Tests the JSON-mode step parser and its fallback to the text format, and
+how earlier session turns are placed in the prompt.
+"""
+
+import pytest
+from gcmc_agent.react import ReActAgent
+
+
+class TestJsonModeParsing:
+    """Tests for ReActAgent._parse_json_response."""
+
+    @pytest.fixture
+    def agent(self):
+        return ReActAgent(
+            name="TestAgent",
+            system_prompt="You test things.",
+            llm_client=None,
+            tools={},
+            json_mode=True,
+        )
+
+    def test_system_prompt_describes_json(self, agent):
+        """JSON mode swaps the format rules in the system message."""
+        assert '"final_answer"' in agent._system_content
+        assert "Action Input:" not in agent._system_content
+
+    def test_action(self, agent):
+        """An action step carries its tool input through unchanged."""
+        parsed = agent._parse_json_response(
+            '{"thought": "look", "action": "read_file", "action_input": {"path": "a.cif"}}'
+        )
+        assert parsed == {
+            "type": "action",
+            "thought": "look",
+            "action": "read_file",
+            "action_input": {"path": "a.cif"},
+        }
+
+    def test_final_answer(self, agent):
+        """Structured final answers are returned as JSON text."""
+        assert agent._parse_json_response('{"thought": "done", "final_answer": "ok"}')["final_answer"] == "ok"
+        assert agent._parse_json_response('{"final_answer": {"status": "PASS"}}')["final_answer"] == '{"status": "PASS"}'
+
+    def test_invalid_steps(self, agent):
+        """Objects without a usable action or answer are parse errors."""
+        assert agent._parse_json_response('{"thought": "hmm"}')["type"] == "error"
+        assert agent._parse_json_response('{"action": "x", "action_input": [1]}')["type"] == "error"
+        assert agent._parse_json_response("[1, 2]")["type"] == "error"
+
+    def test_text_fallback(self, agent):
+        """A reply in the text format is still understood."""
+        parsed = agent._parse_json_response("Thought: done\nFinal Answer: SUCCESS")
+        assert parsed["type"] == "final"
+        assert parsed["final_answer"] == "SUCCESS"
+
+
+class _FinalAnswerClient:
+    """Stand-in LLM client that answers every call at once and records the prompts."""
+
+    json_mode = False
+
+    def __init__(self):
+        self.prompts = []
+
+    def chat(self, messages, **kwargs):
+        self.prompts.append(messages)
+        return {"choices": [{"message": {"content": "Thought: done\nFinal Answer: OK"}}]}
+
+
+class TestSession:
+    """Tests for ReActAgent.run(session=...)."""
+
+    def test_session_is_prompt_prefix(self):
+        """A later run resends the earlier task and answer unchanged before its own task."""
+        client = _FinalAnswerClient()
+        agent = ReActAgent(name="TestAgent", system_prompt="You test things.", llm_client=client, tools={})
+        session = []
+        agent.run("first", session=session)
+        agent.run("second", session=session)
+        first, second = client.prompts
+        assert second[:2] == first
+        assert second[2] == {"role": "assistant", "content": "Thought: done\nFinal Answer: OK"}
+        assert second[3] == {"role": "user", "content": "Task: second"}
+        assert len(session) == 4
+
+    def test_no_session(self):
+        """Without a session every run starts from the system message and task."""
+        client = _FinalAnswerClient()
+        agent = ReActAgent(name="TestAgent", system_prompt="You test things.", llm_client=client, tools={})
+        agent.run("first")
+        agent.run("second")
+        assert [len(prompt) for prompt in client.prompts] == [2, 2]
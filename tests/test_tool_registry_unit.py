@@ -0,0 +1,47 @@
+"""
+Unit tests for the shared tool registry.
+
+Tests that registries are built once per workspace and that agents get
+independent copies.
+"""
+
+from gcmc_agent.tools.registry import create_tool_registry, _build_tool_registry
+
+
+class TestCreateToolRegistry:
+    """Tests for create_tool_registry."""
+
+    def test_built_once_per_workspace(self, temp_workspace):
+        """Repeated calls for the same root reuse the cached build."""
+        _build_tool_registry.cache_clear()
+        create_tool_registry(temp_workspace)
+        create_tool_registry(temp_workspace)
+        info = _build_tool_registry.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_copies_are_independent(self, temp_workspace):
+        """Tools registered on one copy (e.g. delegation tools) stay private to it."""
+        first = create_tool_registry(temp_workspace)
+        second = create_tool_registry(temp_workspace)
+        first.register_function("delegate_test", "test tool", lambda: "ok")
+        assert first.get("delegate_test") is not None
+        assert second.get("delegate_test") is None
+        assert "delegate_test" not in create_tool_registry(temp_workspace).get_all()
+
+    def test_tools_are_shared(self, temp_workspace):
+        """Copies share the Tool objects, so copying stays cheap."""
+        first = create_tool_registry(temp_workspace)
+        second = create_tool_registry(temp_workspace)
+        assert first.get_all() == second.get_all()
+        for name, tool in first.get_all().items():
+            assert second.get(name) is tool
+
+    def test_schema_shared_until_register(self, temp_workspace):
+        """to_dict() is built once per registry content and rebuilt after register()."""
+        first = create_tool_registry(temp_workspace)
+        second = create_tool_registry(temp_workspace)
+        assert first.to_dict() is second.to_dict()
+        first.register_function("delegate_test", "test tool", lambda: "ok")
+        assert "delegate_test" in first.to_dict()
+        assert "delegate_test" not in second.to_dict()